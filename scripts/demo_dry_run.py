@@ -14,26 +14,90 @@ This script:
 
 Usage:
     python3 scripts/demo_dry_run.py
+    python3 scripts/demo_dry_run.py --strict-yaml   # emit artifacts via yaml.dump
 """
 
+import json
 import os
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 import yaml
-import re
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# Frontmatter below this size made of flat `key: value` scalars is parsed
+# without PyYAML; anything larger or more complex goes through the loader.
+_SIMPLE_FRONTMATTER_MAX_LEN = 512
+_YAML_INDICATORS = ('[', '{', '|', '>', '&', '*', '!', ':', '#')
+_YAML_RESERVED_WORDS = {'true', 'false', 'yes', 'no', 'on', 'off', 'y', 'n', 'null', '~'}
+
+# Strings that are safe to emit as plain YAML scalars: start with a letter
+# (so never numeric) and contain no indicator characters
+_PLAIN_SCALAR_RE = re.compile(r'[A-Za-z](?:[A-Za-z0-9_ ./()-]*[A-Za-z0-9_./)])?')
+
+
+# Critic dimension results are identical for every simulated verdict
+_DIMENSION_RESULTS = (
+    {
+        'dimension': 'SpecFit',
+        'verdict': 'pass',
+        'score': 0.95,
+        'feedback': 'Output matches specification requirements'
+    },
+    {
+        'dimension': 'Verification',
+        'verdict': 'pass',
+        'score': 0.92,
+        'feedback': 'All verification commands passed'
+    },
+    {
+        'dimension': 'Dependencies',
+        'verdict': 'pass',
+        'score': 1.0,
+        'feedback': 'No dependencies - standalone fix'
+    },
+    {
+        'dimension': 'Effort',
+        'verdict': 'pass',
+        'score': 0.90,
+        'feedback': 'Completed within time box'
+    },
+    {
+        'dimension': 'Security',
+        'verdict': 'pass',
+        'score': 0.95,
+        'feedback': 'No security issues detected'
+    },
+)
+
+
+# Resolved once at import; resolve() walks every path component
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+# ANSI colors for terminal output; empty when stdout is not a TTY (CI logs, redirects)
+_ISATTY = sys.stdout.isatty()
 
 
-# ANSI colors for terminal output
 class Colors:
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
+    HEADER = '\033[95m' if _ISATTY else ''
+    BLUE = '\033[94m' if _ISATTY else ''
+    CYAN = '\033[96m' if _ISATTY else ''
+    GREEN = '\033[92m' if _ISATTY else ''
+    YELLOW = '\033[93m' if _ISATTY else ''
+    RED = '\033[91m' if _ISATTY else ''
+    BOLD = '\033[1m' if _ISATTY else ''
+    END = '\033[0m' if _ISATTY else ''
+
+
+_OK_PREFIX = f"  {Colors.GREEN}[OK]{Colors.END} "
+_INFO_PREFIX = f"  {Colors.YELLOW}[INFO]{Colors.END} "
 
 
 def print_header(text: str) -> None:
@@ -50,18 +114,61 @@ def print_step(step: int, text: str) -> None:
 
 def print_success(text: str) -> None:
     """Print success message."""
-    print(f"  {Colors.GREEN}[OK]{Colors.END} {text}")
+    sys.stdout.write(f"{_OK_PREFIX}{text}\n")
 
 
 def print_info(text: str) -> None:
     """Print info message."""
-    print(f"  {Colors.YELLOW}[INFO]{Colors.END} {text}")
+    sys.stdout.write(f"{_INFO_PREFIX}{text}\n")
 
 
 def get_repo_root() -> Path:
     """Get the repository root directory."""
-    script_path = Path(__file__).resolve()
-    return script_path.parent.parent
+    return _REPO_ROOT
+
+
+def parse_simple_frontmatter(text: str) -> Optional[dict]:
+    """
+    Parse flat `key: value` frontmatter without invoking PyYAML.
+
+    Returns None when the text is too large or uses any YAML feature beyond
+    quoted strings and integers, so the caller can fall back to the loader.
+    """
+    if len(text) >= _SIMPLE_FRONTMATTER_MAX_LEN:
+        return None
+
+    result = {}
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        if line[0].isspace() or stripped.startswith('-'):
+            return None
+
+        key, sep, value = line.partition(':')
+        key = key.strip()
+        value = value.strip()
+        if not sep or not key or any(c in value for c in _YAML_INDICATORS):
+            return None
+
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+            value = value[1:-1]
+            if '\\' in value or '"' in value or "'" in value:
+                return None
+        elif value.isascii() and value.isdigit() and (value == '0' or value[0] != '0'):
+            value = int(value)
+        else:
+            if not value or value.lower() in _YAML_RESERVED_WORDS:
+                return None
+            try:
+                float(value)
+                return None
+            except ValueError:
+                pass
+
+        result[key] = value
+
+    return result
 
 
 def read_issue(demo_dir: Path) -> dict:
@@ -71,18 +178,21 @@ def read_issue(demo_dir: Path) -> dict:
     if not issue_path.exists():
         raise FileNotFoundError(f"Demo issue not found: {issue_path}")
 
-    with open(issue_path, 'r') as f:
-        content = f.read()
+    # Only the frontmatter is needed, so decode just that slice of the file
+    raw = issue_path.read_bytes()
+    if raw.startswith(b'---\r\n'):
+        raw = raw.replace(b'\r\n', b'\n')
 
-    # Parse YAML frontmatter
-    frontmatter_match = re.search(r'^---\n(.*?)\n---', content, re.DOTALL)
-    if frontmatter_match:
-        frontmatter = yaml.safe_load(frontmatter_match.group(1))
-    else:
-        frontmatter = {}
+    frontmatter = {}
+    if raw.startswith(b'---\n'):
+        end = raw.find(b'\n---', 4)
+        if end != -1:
+            text = raw[4:end].decode('utf-8')
+            frontmatter = parse_simple_frontmatter(text)
+            if frontmatter is None:
+                frontmatter = yaml.load(text, Loader=SafeLoader)
 
     return {
-        'content': content,
         'frontmatter': frontmatter,
         'issue_id': frontmatter.get('issue_id', 'UNKNOWN'),
         'lane': frontmatter.get('lane', 'X'),
@@ -91,11 +201,11 @@ def read_issue(demo_dir: Path) -> dict:
     }
 
 
-def simulate_work_order_generation(issue: dict, demo_dir: Path) -> dict:
+def simulate_work_order_generation(issue: dict, demo_dir: Path, run_time: datetime) -> dict:
     """Simulate PM generating a work order from the issue."""
     work_order = {
         'work_order': {
-            'id': f"WO-{datetime.now().strftime('%Y%m%d')}-{issue['issue_id']}",
+            'id': f"WO-{run_time.strftime('%Y%m%d')}-{issue['issue_id']}",
             'issued_by': 'Demo-Project-Manager',
             'issued_to': 'Demo-Builder',
             'brick_id': f"demo-fix-{issue['issue_id'].lower()}",
@@ -121,7 +231,7 @@ def simulate_work_order_generation(issue: dict, demo_dir: Path) -> dict:
             'priority': 'normal'
         },
         'metadata': {
-            'created_at': datetime.now().isoformat() + 'Z',
+            'created_at': run_time.isoformat() + 'Z',
             'demo_mode': True
         }
     }
@@ -155,46 +265,15 @@ def simulate_fixer_agents(issue: dict) -> list:
     return fixers
 
 
-def simulate_verdict(issue: dict, work_order: dict) -> dict:
+def simulate_verdict(issue: dict, work_order: dict, run_time: datetime) -> dict:
     """Simulate critic orchestrator generating a verdict."""
     verdict = {
         'final_verdict': 'APPROVED',
         'brick_id': work_order['work_order']['brick_id'],
-        'timestamp': datetime.now().isoformat() + 'Z',
+        'timestamp': run_time.isoformat() + 'Z',
         'overall_score': 0.94,
         'recommendation': 'APPROVE - All checks passed',
-        'dimension_results': [
-            {
-                'dimension': 'SpecFit',
-                'verdict': 'pass',
-                'score': 0.95,
-                'feedback': 'Output matches specification requirements'
-            },
-            {
-                'dimension': 'Verification',
-                'verdict': 'pass',
-                'score': 0.92,
-                'feedback': 'All verification commands passed'
-            },
-            {
-                'dimension': 'Dependencies',
-                'verdict': 'pass',
-                'score': 1.0,
-                'feedback': 'No dependencies - standalone fix'
-            },
-            {
-                'dimension': 'Effort',
-                'verdict': 'pass',
-                'score': 0.90,
-                'feedback': 'Completed within time box'
-            },
-            {
-                'dimension': 'Security',
-                'verdict': 'pass',
-                'score': 0.95,
-                'feedback': 'No security issues detected'
-            }
-        ],
+        'dimension_results': list(_DIMENSION_RESULTS),
         'issues_summary': {
             'critical': 0,
             'high': 0,
@@ -211,21 +290,75 @@ def simulate_verdict(issue: dict, work_order: dict) -> dict:
     return verdict
 
 
-def write_artifacts(demo_dir: Path, work_order: dict, verdict: dict) -> None:
-    """Write generated artifacts to files."""
-    # Write work order
-    work_order_path = demo_dir / "demo_work_order_generated.yaml"
-    with open(work_order_path, 'w') as f:
-        f.write("# AUTO-GENERATED by demo_dry_run.py\n")
-        f.write("# This demonstrates work order generation pattern\n\n")
-        yaml.dump(work_order, f, default_flow_style=False, sort_keys=False)
-
-    # Write verdict
-    verdict_path = demo_dir / "demo_verdict_generated.yaml"
-    with open(verdict_path, 'w') as f:
-        f.write("# AUTO-GENERATED by demo_dry_run.py\n")
-        f.write("# This demonstrates verdict generation pattern\n\n")
-        yaml.dump(verdict, f, default_flow_style=False, sort_keys=False)
+def yaml_scalar(value) -> str:
+    """Render a scalar as YAML, quoting strings only when a plain scalar would be misread."""
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return repr(value)
+
+    text = str(value)
+    if _PLAIN_SCALAR_RE.fullmatch(text) and text.lower() not in _YAML_RESERVED_WORDS:
+        return text
+    # JSON strings are valid YAML double-quoted scalars
+    return json.dumps(text)
+
+
+def emit_yaml(data: dict, indent: int = 0) -> list:
+    """
+    Render a mapping as block-style YAML lines, laid out like
+    `yaml.dump(..., default_flow_style=False, sort_keys=False)`.
+
+    Handles the nesting the demo artifacts use: mappings, and lists of
+    mappings or scalars.
+    """
+    pad = ' ' * indent
+    lines = []
+    for key, value in data.items():
+        if isinstance(value, dict):
+            if value:
+                lines.append(f"{pad}{key}:")
+                lines.extend(emit_yaml(value, indent + 2))
+            else:
+                lines.append(f"{pad}{key}: {{}}")
+        elif isinstance(value, (list, tuple)):
+            if not value:
+                lines.append(f"{pad}{key}: []")
+                continue
+            lines.append(f"{pad}{key}:")
+            for item in value:
+                if isinstance(item, dict) and item:
+                    item_lines = emit_yaml(item, indent + 2)
+                    item_lines[0] = f"{pad}- {item_lines[0][indent + 2:]}"
+                    lines.extend(item_lines)
+                else:
+                    lines.append(f"{pad}- {yaml_scalar(item)}")
+        else:
+            lines.append(f"{pad}{key}: {yaml_scalar(value)}")
+    return lines
+
+
+def write_artifacts(demo_dir: Path, work_order: dict, verdict: dict, strict_yaml: bool = False) -> None:
+    """
+    Write generated artifacts to files.
+
+    The artifacts have a small fixed shape, so they are emitted directly
+    instead of through PyYAML's representer; `strict_yaml` restores yaml.dump.
+    """
+    artifacts = [
+        ("demo_work_order_generated.yaml", "work order", work_order),
+        ("demo_verdict_generated.yaml", "verdict", verdict),
+    ]
+    for filename, kind, data in artifacts:
+        with open(demo_dir / filename, 'w') as f:
+            f.write("# AUTO-GENERATED by demo_dry_run.py\n")
+            f.write(f"# This demonstrates {kind} generation pattern\n\n")
+            if strict_yaml:
+                yaml.dump(data, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+            else:
+                f.write('\n'.join(emit_yaml(data)) + '\n')
 
 
 def main() -> int:
@@ -234,9 +367,10 @@ def main() -> int:
     print(f"{Colors.YELLOW}NOTE: This is a DRY RUN - NO AI calls are made{Colors.END}")
     print(f"{Colors.YELLOW}Demonstrating orchestration PATTERN only{Colors.END}\n")
 
-    # Setup paths
+    # Setup paths; the whole run shares one timestamp
     repo_root = get_repo_root()
     demo_dir = repo_root / "demo"
+    run_time = datetime.now()
 
     if not demo_dir.exists():
         print(f"{Colors.RED}[ERROR] Demo directory not found: {demo_dir}{Colors.END}")
@@ -256,7 +390,7 @@ def main() -> int:
 
     # Step 2: Generate work order (simulated PM)
     print_step(2, "Generating work order (simulated PM dispatch)...")
-    work_order = simulate_work_order_generation(issue, demo_dir)
+    work_order = simulate_work_order_generation(issue, demo_dir, run_time)
     print_success(f"Work order ID: {work_order['work_order']['id']}")
     print_info(f"Task type: {work_order['work_order']['task_type']}")
     print_info(f"Time box: {work_order['work_order']['time_box']}")
@@ -270,14 +404,14 @@ def main() -> int:
 
     # Step 4: Generate verdict (simulated Critic Orchestrator)
     print_step(4, "Generating verdict (simulated Critic evaluation)...")
-    verdict = simulate_verdict(issue, work_order)
+    verdict = simulate_verdict(issue, work_order, run_time)
     print_success(f"Verdict: {verdict['final_verdict']}")
     print_info(f"Overall score: {verdict['overall_score']}")
     print_info(f"Dimensions evaluated: {len(verdict['dimension_results'])}")
 
     # Step 5: Write artifacts
     print_step(5, "Writing artifacts to /demo...")
-    write_artifacts(demo_dir, work_order, verdict)
+    write_artifacts(demo_dir, work_order, verdict, strict_yaml='--strict-yaml' in sys.argv)
     print_success("demo_work_order_generated.yaml")
     print_success("demo_verdict_generated.yaml")
 
@@ -10,7 +10,7 @@ What it demonstrates:
 2. Spawns "workers" for each lane (simulated)
 3. Workers write .status files as they progress
 4. Workers write .done files when complete
-5. Orchestrator polls for completion signals
+5. Orchestrator waits for completion signals
 6. Final report is generated
 
 Usage:
@@ -24,29 +24,97 @@ Output:
 
 import os
 import re
+import shutil
 import sys
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
 
-# ANSI colors for terminal output
+LANES = ('E', 'M')
+MAX_LANE_WORKERS = 8
+SIGNAL_SUFFIXES = ('.done', '.status')
+
+_LANE_SECTION_RES = {
+    lane: re.compile(
+        rf'### Lane {lane} -.*?\n\|.*?\n\|[-|]+\|\n(.*?)<!-- LANE_{lane}_ISSUES -->',
+        re.DOTALL,
+    )
+    for lane in LANES
+}
+
+# Config file each demo lane edits, and the fix each issue applies to it as
+# (already-applied guard, anchor to substitute at, replacement text)
+_LANE_CONFIG_FILES = {'E': 'guidelines.yaml', 'M': 'schema.yaml'}
+
+_CONFIG_FIXES = {
+    'E-01': (
+        re.compile(r'(?m)^data_retention:'),
+        re.compile(r'\Z'),
+        "\ndata_retention:\n  retention_days: 365\n  review_frequency: quarterly\n",
+    ),
+    'E-02': (
+        re.compile(r'(?m)^\s*third_party_sharing:'),
+        re.compile(r'(?m)^privacy:'),
+        "privacy:\n  third_party_sharing: documented",
+    ),
+    'E-03': (
+        re.compile(r'(?m)^\s*response_time_hours:'),
+        re.compile(r'(?m)^customer_service:'),
+        "customer_service:\n  response_time_hours: 24",
+    ),
+    'M-01': (
+        re.compile(r'(?m)^schema_version:'),
+        re.compile(r'\A'),
+        'schema_version: "1.0.0"\n\n',
+    ),
+    'M-02': (
+        re.compile(r'(?m)^\s*strict_mode:'),
+        re.compile(r'(?m)^validation:'),
+        "validation:\n  strict_mode: true",
+    ),
+}
+
+# | ID | Title | Severity | Type Tags | OPEN |
+_OPEN_ROW_RE = re.compile(
+    r'^\|[ \t]*([^|\n]+?)[ \t]*\|[ \t]*([^|\n]+?)[ \t]*\|[ \t]*([^|\n]+?)[ \t]*'
+    r'\|[ \t]*([^|\n]*?)[ \t]*\|[ \t]*(OPEN)\b',
+    re.MULTILINE,
+)
+
+
+# Latest status message per lane. Each lane has a single writer thread, and
+# the orchestrator only reads it, so no lock is needed.
+_live_status = {}
+
+# Resolved once at import; resolve() walks every path component
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+# ANSI colors for terminal output; empty when stdout is not a TTY (CI logs, redirects)
+_ISATTY = sys.stdout.isatty()
+
+
 class Colors:
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
+    HEADER = '\033[95m' if _ISATTY else ''
+    BLUE = '\033[94m' if _ISATTY else ''
+    CYAN = '\033[96m' if _ISATTY else ''
+    GREEN = '\033[92m' if _ISATTY else ''
+    YELLOW = '\033[93m' if _ISATTY else ''
+    RED = '\033[91m' if _ISATTY else ''
+    BOLD = '\033[1m' if _ISATTY else ''
+    END = '\033[0m' if _ISATTY else ''
+
+
+_OK_PREFIX = f"  {Colors.GREEN}✓{Colors.END} "
+_INFO_PREFIX = f"  {Colors.YELLOW}→{Colors.END} "
 
 
 def get_repo_root() -> Path:
     """Get the repository root directory."""
-    script_path = Path(__file__).resolve()
-    return script_path.parent.parent
+    return _REPO_ROOT
 
 
 def print_header(text: str) -> None:
@@ -63,19 +131,42 @@ def print_step(step: int, text: str) -> None:
 
 def print_ok(text: str) -> None:
     """Print success message."""
-    print(f"  {Colors.GREEN}✓{Colors.END} {text}")
+    sys.stdout.write(f"{_OK_PREFIX}{text}\n")
 
 
 def print_info(text: str) -> None:
     """Print info message."""
-    print(f"  {Colors.YELLOW}→{Colors.END} {text}")
+    sys.stdout.write(f"{_INFO_PREFIX}{text}\n")
 
 
-def clean_signals(signals_dir: Path) -> None:
+def clean_signals(signals_fd: int) -> None:
     """Remove old signal files."""
-    for ext in ['*.done', '*.status']:
-        for f in signals_dir.glob(ext):
-            f.unlink()
+    with os.scandir(signals_fd) as entries:
+        for entry in entries:
+            if entry.name.endswith(SIGNAL_SUFFIXES) and entry.is_file():
+                os.unlink(entry.name, dir_fd=signals_fd)
+
+
+def write_status(signals_fd: int, lane: str, message: str) -> None:
+    """
+    Publish a lane's status in memory and on disk.
+
+    The in-process orchestrator reads `_live_status`; the .status file is
+    replaced atomically for external observers so they never see a partial write.
+    """
+    _live_status[lane] = message.strip()
+    tmp_name = f'{lane}.status.tmp'
+    fd = os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=signals_fd)
+    try:
+        os.write(fd, message.encode())
+    finally:
+        os.close(fd)
+    os.replace(tmp_name, f'{lane}.status', src_dir_fd=signals_fd, dst_dir_fd=signals_fd)
+
+
+def touch_done(signals_fd: int, lane: str) -> None:
+    """Create a lane's .done completion marker."""
+    os.close(os.open(f'{lane}.done', os.O_WRONLY | os.O_CREAT, 0o644, dir_fd=signals_fd))
 
 
 def parse_catalog(catalog_path: Path) -> dict:
@@ -86,36 +177,30 @@ def parse_catalog(catalog_path: Path) -> dict:
     lanes = {}
 
     # Find each lane section
-    for lane in ['E', 'M']:
-        pattern = rf'### Lane {lane} -.*?\n\|.*?\n\|[-|]+\|\n(.*?)<!-- LANE_{lane}_ISSUES -->'
-        match = re.search(pattern, content, re.DOTALL)
+    for lane, pattern in _LANE_SECTION_RES.items():
+        match = pattern.search(content)
         if match:
-            rows = match.group(1).strip().split('\n')
-            issues = []
-            for row in rows:
-                if row.startswith('|') and 'OPEN' in row:
-                    cols = [c.strip() for c in row.split('|')]
-                    if len(cols) >= 5:
-                        issues.append({
-                            'id': cols[1],
-                            'title': cols[2],
-                            'severity': cols[3],
-                            'status': cols[5] if len(cols) > 5 else 'OPEN'
-                        })
-            lanes[lane] = issues
+            # One C-level scan over the whole section instead of a per-row Python loop
+            lanes[lane] = [
+                {'id': issue_id, 'title': title, 'severity': severity, 'status': status}
+                for issue_id, title, severity, _, status in _OPEN_ROW_RE.findall(match.group(1))
+            ]
 
     return lanes
 
 
-def simulate_lane_worker(lane: str, issues: list, repo_root: Path) -> dict:
+def simulate_lane_worker(
+    lane: str, issues: list, repo_root: Path, run_time: datetime, signals_fd: int
+) -> dict:
     """
     Simulate a lane worker processing issues.
 
     In the real system, this would be a separate agent with its own context.
-    Here we simulate the file-signal behavior.
+    Here we simulate the file-signal behavior. Signal files are created
+    relative to `signals_fd`, an open descriptor for the signals directory.
     """
-    signals_dir = repo_root / 'LogBook' / 'issue-fixing' / 'signals'
     demo_dir = repo_root / 'examples' / 'minimal_demo'
+    fixed_date = run_time.strftime('%Y-%m-%d')
 
     result = {
         'lane': lane,
@@ -125,129 +210,112 @@ def simulate_lane_worker(lane: str, issues: list, repo_root: Path) -> dict:
     }
 
     # Write starting status
-    status_file = signals_dir / f'{lane}.status'
-    status_file.write_text(f"STARTING: scanning catalog for Lane {lane}\n")
+    write_status(signals_fd, lane, f"STARTING: scanning catalog for Lane {lane}\n")
 
     if not issues:
-        status_file.write_text(f"COMPLETE: Lane {lane} is clean (0 issues)\n")
-        (signals_dir / f'{lane}.done').touch()
+        write_status(signals_fd, lane, f"COMPLETE: Lane {lane} is clean (0 issues)\n")
+        touch_done(signals_fd, lane)
         return result
 
     # Simulate complexity assessment
     time.sleep(0.1)  # Brief pause to simulate work
-    status_file.write_text(f"NORMAL: fixing {len(issues)} issues\n")
 
-    # Process each issue (simulate fixing by modifying config files)
+    # Each lane edits one config file: read it once, write it once at the end
+    config_name = _LANE_CONFIG_FILES.get(lane)
+    config_file = demo_dir / 'config' / config_name if config_name else None
+    original_config = config_content = config_file.read_text() if config_file else None
+
+    # Process each issue (simulate fixing by modifying config files).
+    # Issue paths are plain strings to avoid a Path allocation per join.
+    issues_dir = os.path.join(demo_dir, 'issues', lane)
     for issue in issues:
         issue_id = issue['id']
-        issue_file = demo_dir / 'issues' / lane / f'{issue_id}.md'
+        issue_path = os.path.join(issues_dir, f'{issue_id}.md')
 
-        if not issue_file.exists():
+        if not os.path.exists(issue_path):
             continue
 
         # Read issue to get fix requirements
-        issue_content = issue_file.read_text()
-
-        # Simulate applying the fix based on lane
-        if lane == 'E':
-            config_file = demo_dir / 'config' / 'guidelines.yaml'
-            config_content = config_file.read_text()
-
-            # Apply fixes based on issue
-            if issue_id == 'E-01' and 'data_retention:' not in config_content:
-                config_content += "\ndata_retention:\n  retention_days: 365\n  review_frequency: quarterly\n"
-            elif issue_id == 'E-02' and 'third_party_sharing:' not in config_content:
-                config_content = config_content.replace(
-                    "privacy:",
-                    "privacy:\n  third_party_sharing: documented"
-                )
-            elif issue_id == 'E-03' and 'response_time_hours:' not in config_content:
-                config_content = config_content.replace(
-                    "customer_service:",
-                    "customer_service:\n  response_time_hours: 24"
-                )
-
-            config_file.write_text(config_content)
-
-        elif lane == 'M':
-            config_file = demo_dir / 'config' / 'schema.yaml'
-            config_content = config_file.read_text()
-
-            if issue_id == 'M-01' and 'schema_version:' not in config_content:
-                config_content = f"schema_version: \"1.0.0\"\n\n{config_content}"
-            elif issue_id == 'M-02' and 'strict_mode:' not in config_content:
-                config_content = config_content.replace(
-                    "validation:",
-                    "validation:\n  strict_mode: true"
-                )
-
-            config_file.write_text(config_content)
+        with open(issue_path, 'r') as f:
+            issue_content = f.read()
+
+        # Simulate applying the fix: (already-applied guard, anchor, replacement)
+        fix = _CONFIG_FIXES.get(issue_id)
+        if fix is not None and config_content is not None:
+            applied_re, anchor_re, replacement = fix
+            if not applied_re.search(config_content):
+                config_content = anchor_re.sub(replacement, config_content, count=1)
 
         # Mark issue as resolved in the issue file
         updated_issue = issue_content.replace('status: "OPEN"', 'status: "RESOLVED"')
         updated_issue = updated_issue.replace('**Status:** OPEN', '**Status:** RESOLVED')
 
-        # Add resolution section
-        resolution = f"""
+        # Add resolution section (skip rewriting issues already resolved on a previous run)
+        if updated_issue != issue_content:
+            updated_issue += f"""
 ---
 
 ## Resolution
 
-- **Fixed:** {datetime.now().strftime('%Y-%m-%d')}
+- **Fixed:** {fixed_date}
 - **Fixed By:** Demo Lane Worker (simulated)
 - **Verification:** Passed
 """
-        updated_issue += resolution
-        issue_file.write_text(updated_issue)
+            with open(issue_path, 'w') as f:
+                f.write(updated_issue)
 
         result['issues_fixed'] += 1
         result['fixed_ids'].append(issue_id)
 
         # Update status
-        status_file.write_text(f"WORKING: fixed {result['issues_fixed']}/{len(issues)} issues\n")
+        write_status(signals_fd, lane, f"WORKING: fixed {result['issues_fixed']}/{len(issues)} issues\n")
         time.sleep(0.1)  # Brief pause between issues
 
+    if config_content != original_config:
+        config_file.write_text(config_content)
+
     # Signal completion
-    status_file.write_text(f"COMPLETE: fixed {result['issues_fixed']} issues\n")
-    (signals_dir / f'{lane}.done').touch()
+    write_status(signals_fd, lane, f"COMPLETE: fixed {result['issues_fixed']} issues\n")
+    touch_done(signals_fd, lane)
 
     return result
 
 
-def poll_for_completion(signals_dir: Path, lanes: list, timeout: int = 30) -> bool:
+def wait_for_completion(done_events: dict, timeout: int = 30) -> bool:
     """
-    Poll for .done files from all lanes.
+    Block until every lane worker has signaled completion.
+
+    Workers run in-process, so the orchestrator waits on their completion
+    events instead of polling the filesystem. The .done files are still
+    written for external observers, but are not read for control flow.
 
     This demonstrates the key orchestration pattern:
     - NO transcript parsing
-    - Just check for file existence
+    - Just wait for a completion signal
     - Minimal context usage
     """
-    start = time.time()
-
-    while time.time() - start < timeout:
-        done_count = sum(1 for lane in lanes if (signals_dir / f'{lane}.done').exists())
+    deadline = time.monotonic() + timeout
+    lanes = list(done_events)
+    pending = list(lanes)
 
-        # Show status
-        status_parts = []
-        for lane in lanes:
-            status_file = signals_dir / f'{lane}.status'
-            if status_file.exists():
-                status = status_file.read_text().strip().split('\n')[-1]
-                done = "✓" if (signals_dir / f'{lane}.done').exists() else "○"
-                status_parts.append(f"{lane}:{done}")
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not done_events[pending[0]].wait(timeout=remaining):
+            return False
 
-        print(f"  {Colors.CYAN}Polling:{Colors.END} {' | '.join(status_parts)} ({done_count}/{len(lanes)} done)")
+        # Report once per transition, picking up any lanes that finished meanwhile
+        pending = [lane for lane in pending if not done_events[lane].is_set()]
+        status_parts = [
+            f"{lane}:○ {_live_status.get(lane, '')}".rstrip() if lane in pending else f"{lane}:✓"
+            for lane in lanes
+        ]
+        done_count = len(lanes) - len(pending)
+        print(f"  {Colors.CYAN}Signals:{Colors.END} {' | '.join(status_parts)} ({done_count}/{len(lanes)} done)")
 
-        if done_count == len(lanes):
-            return True
+    return True
 
-        time.sleep(0.5)
 
-    return False
-
-
-def generate_report(results: list, repo_root: Path) -> Path:
+def generate_report(results: list, repo_root: Path, run_time: datetime) -> Path:
     """Generate the final run report."""
     output_dir = repo_root / 'examples' / 'output'
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -257,9 +325,9 @@ def generate_report(results: list, repo_root: Path) -> Path:
     total_found = sum(r['issues_found'] for r in results)
     total_fixed = sum(r['issues_fixed'] for r in results)
 
-    report = f"""# Demo Run Report
+    parts = [f"""# Demo Run Report
 
-> **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+> **Generated:** {run_time.strftime('%Y-%m-%d %H:%M:%S')}
 > **Demo Type:** File-Signal Orchestration
 
 ## Summary
@@ -273,19 +341,19 @@ def generate_report(results: list, repo_root: Path) -> Path:
 
 ## Results by Lane
 
-"""
+"""]
 
     for r in results:
         fixed_list = ', '.join(r['fixed_ids']) if r['fixed_ids'] else 'None'
-        report += f"""### Lane {r['lane']}
+        parts.append(f"""### Lane {r['lane']}
 
 - **Issues found:** {r['issues_found']}
 - **Issues fixed:** {r['issues_fixed']}
 - **Fixed IDs:** {fixed_list}
 
-"""
+""")
 
-    report += """## Signals Generated
+    parts.append("""## Signals Generated
 
 The following signal files were created:
 
@@ -306,9 +374,9 @@ The following signal files were created:
 ---
 
 *This report was generated by the demo orchestration script.*
-"""
+""")
 
-    report_path.write_text(report)
+    report_path.write_text(''.join(parts))
     return report_path
 
 
@@ -317,10 +385,17 @@ def copy_signals_to_examples(signals_dir: Path, repo_root: Path) -> None:
     output_signals = repo_root / 'examples' / 'output' / 'signals'
     output_signals.mkdir(parents=True, exist_ok=True)
 
-    for f in signals_dir.glob('*'):
-        if f.suffix in ['.status', '.done']:
-            dest = output_signals / f.name
-            dest.write_text(f.read_text() if f.suffix == '.status' else '')
+    with os.scandir(signals_dir) as entries:
+        for entry in entries:
+            if not (entry.name.endswith(SIGNAL_SUFFIXES) and entry.is_file()):
+                continue
+            dest = output_signals / entry.name
+            dest.unlink(missing_ok=True)
+            # Hardlink when possible; copyfile uses the kernel's zero-copy path otherwise
+            try:
+                os.link(entry.path, dest)
+            except OSError:
+                shutil.copyfile(entry.path, dest)
 
 
 def main() -> int:
@@ -332,63 +407,71 @@ def main() -> int:
     repo_root = get_repo_root()
     signals_dir = repo_root / 'LogBook' / 'issue-fixing' / 'signals'
     catalog_path = repo_root / 'examples' / 'minimal_demo' / 'SAF_ISSUE_CATALOG.md'
+    run_time = datetime.now()
 
     # Ensure directories exist
     signals_dir.mkdir(parents=True, exist_ok=True)
 
-    # Step 1: Clean old signals
-    print_step(1, "Cleaning old signals...")
-    clean_signals(signals_dir)
-    print_ok("Signal directory cleaned")
-
-    # Step 2: Parse catalog
-    print_step(2, "Reading issue catalog...")
-    if not catalog_path.exists():
-        print(f"{Colors.RED}ERROR: Catalog not found: {catalog_path}{Colors.END}")
-        return 1
-
-    lanes_issues = parse_catalog(catalog_path)
-    for lane, issues in lanes_issues.items():
-        print_info(f"Lane {lane}: {len(issues)} open issues")
-
-    # Step 3: Spawn lane workers in parallel (using threading)
-    print_step(3, "Spawning lane workers in PARALLEL...")
-    print_info("In production: dozens of parallel agents via Task tool")
-    print_info("In demo: Threaded simulation with same signal behavior")
-
-    results = []
-    results_lock = threading.Lock()
-
-    def worker_thread(lane: str, issues: list):
-        result = simulate_lane_worker(lane, issues, repo_root)
-        with results_lock:
-            results.append(result)
-
-    threads = []
-    for lane, issues in lanes_issues.items():
-        print_info(f"Starting Lane {lane} worker...")
-        t = threading.Thread(target=worker_thread, args=(lane, issues))
-        threads.append(t)
-        t.start()
-
-    # Step 4: Poll for completion
-    print_step(4, "Polling for completion signals...")
-    lanes = list(lanes_issues.keys())
-    success = poll_for_completion(signals_dir, lanes)
-
-    if not success:
-        print(f"{Colors.RED}ERROR: Timeout waiting for completion{Colors.END}")
-        return 1
-
-    # Ensure all threads finished
-    for t in threads:
-        t.join()
+    # Signal files are opened relative to one directory descriptor, so each
+    # open/unlink resolves a single name instead of the full path
+    signals_fd = os.open(signals_dir, os.O_RDONLY | os.O_DIRECTORY)
+    executor = None
+    try:
+        # Step 1: Clean old signals
+        print_step(1, "Cleaning old signals...")
+        clean_signals(signals_fd)
+        print_ok("Signal directory cleaned")
+
+        # Step 2: Parse catalog
+        print_step(2, "Reading issue catalog...")
+        if not catalog_path.exists():
+            print(f"{Colors.RED}ERROR: Catalog not found: {catalog_path}{Colors.END}")
+            return 1
+
+        lanes_issues = parse_catalog(catalog_path)
+        for lane, issues in lanes_issues.items():
+            print_info(f"Lane {lane}: {len(issues)} open issues")
+
+        # Step 3: Spawn lane workers in parallel (using threading)
+        print_step(3, "Spawning lane workers in PARALLEL...")
+        print_info("In production: dozens of parallel agents via Task tool")
+        print_info("In demo: Threaded simulation with same signal behavior")
+
+        done_events = {lane: threading.Event() for lane in lanes_issues}
+
+        def run_lane(lane: str, issues: list) -> dict:
+            try:
+                return simulate_lane_worker(lane, issues, repo_root, run_time, signals_fd)
+            finally:
+                done_events[lane].set()
+
+        executor = ThreadPoolExecutor(max_workers=max(1, min(MAX_LANE_WORKERS, len(lanes_issues))))
+        futures = []
+        for lane, issues in lanes_issues.items():
+            print_info(f"Starting Lane {lane} worker...")
+            futures.append(executor.submit(run_lane, lane, issues))
+
+        # Step 4: Wait for completion
+        print_step(4, "Waiting for completion signals...")
+        success = wait_for_completion(done_events)
+
+        if not success:
+            print(f"{Colors.RED}ERROR: Timeout waiting for completion{Colors.END}")
+            return 1
+
+        results = [future.result() for future in as_completed(futures)]
+    finally:
+        # Running lane workers write through signals_fd, so they finish
+        # (queued ones are cancelled) before it is closed
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        os.close(signals_fd)
 
     print_ok("All lanes completed!")
 
     # Step 5: Generate report
     print_step(5, "Generating report...")
-    report_path = generate_report(results, repo_root)
+    report_path = generate_report(results, repo_root, run_time)
     print_ok(f"Report: {report_path.relative_to(repo_root)}")
 
     # Copy signals to examples
@@ -8,16 +8,100 @@ Exit codes: 0 = pass, 1 = violations found, 2 = error
 
 import argparse
 import ast
+import io
+import os
 import re
+import shutil
 import sys
 import uuid
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional, Pattern, Tuple
 
 import yaml
 
-@dataclass
+# Below this many src/ files, process start-up costs more than it saves
+PARALLEL_MIN_FILES = 32
+
+# Directories never scanned for Python files (pruned during the walk)
+SKIP_DIRS = frozenset({"venv", ".venv", "node_modules", ".git", "__pycache__"})
+
+# Directories whose .py files are exempt from the "product code must be in src/" rule
+NON_PRODUCT_DIRS = frozenset({"src", "tests", "tools"})
+
+# One bytes regex finds every marker the traceability and escape-hatch checks need
+SAF_MARKER = b"@saf:brick-id="
+ESCAPE_HATCH_MARKERS = frozenset({b"@escape-hatch", b"ESCAPE_HATCH"})
+MARKERS_RE = re.compile(rb"@saf:brick-id=|@escape-hatch|ESCAPE_HATCH")
+MULTIPLE_BLANK_LINES_RE = re.compile(r"\n{3,}")
+CANONICAL_UUID_RE = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z"
+)
+
+# AST fields holding nested statements, in the order ast.iter_child_nodes
+# visits them; expressions never contain the class/function/assignment
+# nodes the source checks look at
+STATEMENT_FIELDS = ("body", "handlers", "orelse", "finalbody", "cases")
+
+
+def _iter_statements(tree: ast.AST):
+    """Yield every statement-level node in tree without visiting expressions.
+
+    Visits the same ClassDef/FunctionDef/Assign nodes as ast.walk, in the
+    same breadth-first order, while skipping the Name/Load/Constant/etc.
+    nodes that make up most of a tree.
+    """
+    queue = deque([tree])
+    while queue:
+        node = queue.popleft()
+        yield node
+        for field in STATEMENT_FIELDS:
+            children = getattr(node, field, None)
+            if isinstance(children, list):
+                queue.extend(children)
+
+def _count_lines(source: str) -> int:
+    """Count lines the way len(f.readlines()) would, without building the list."""
+    return source.count("\n") + (1 if source and not source.endswith("\n") else 0)
+
+def _decode_text(raw: bytes) -> str:
+    """Decode file bytes exactly as open(path, "r").read() would.
+
+    Same default encoding and universal-newline translation, so checks that
+    used to reopen the file in text mode see identical content.
+    """
+    return io.TextIOWrapper(io.BytesIO(raw)).read()
+
+# Characters str.rstrip() treats as whitespace, other than the newline itself
+# (U+3000 is the highest code point str.isspace() accepts)
+_LINE_WHITESPACE = "".join(
+    ch for ch in map(chr, range(0x3001)) if ch.isspace() and ch != "\n"
+)
+_ASCII_LINE_WHITESPACE = "".join(ch for ch in _LINE_WHITESPACE if ch.isascii())
+
+def _first_trailing_whitespace_line(content: str) -> Optional[int]:
+    """Return the 1-based number of the first line ending in whitespace, if any.
+
+    Equivalent to comparing each line of content.split("\n") with its rstrip(),
+    but runs one C-level str.find per whitespace character for
+    "<whitespace>\n" pairs instead of allocating every line twice. Each find
+    stops at the earliest hit so far; ASCII text only needs the ASCII set.
+    """
+    candidates = _ASCII_LINE_WHITESPACE if content.isascii() else _LINE_WHITESPACE
+    first = len(content)
+    for ws in candidates:
+        pos = content.find(ws + "\n", 0, first)
+        if pos >= 0:
+            first = pos
+    if first == len(content):
+        if not content or content[-1] not in candidates:
+            return None
+        first -= 1  # last line has no newline but ends in whitespace
+    return content.count("\n", 0, first) + 1
+
+@dataclass(slots=True)
 class Violation:
     """Represents a convention violation."""
 
@@ -31,12 +115,122 @@ class Violation:
 class ConventionChecker:
     """Validates SAF conventions."""
 
-    def __init__(self, config_path: str, repo_root: str):
-        """Initialize checker with configuration."""
-        self.repo_root = Path(repo_root)
+    def __init__(self, config_path: str, repo_root: str, jobs: Optional[int] = None):
+        """Initialize checker with configuration.
+
+        Args:
+            config_path: Path to conventions.yaml
+            repo_root: Repository root directory
+            jobs: Worker processes for per-file source checks (None = CPU count, 1 = serial)
+        """
         with open(config_path, "r") as f:
-            self.config = yaml.safe_load(f)
+            config = yaml.safe_load(f)
+        self._init_from_config(config, repo_root, jobs)
+
+    @classmethod
+    def from_config(
+        cls, config: dict, repo_root: str, jobs: Optional[int] = None
+    ) -> "ConventionChecker":
+        """Create a checker from an already-loaded configuration."""
+        checker = cls.__new__(cls)
+        checker._init_from_config(config, repo_root, jobs)
+        return checker
+
+    def _init_from_config(self, config: dict, repo_root: str, jobs: Optional[int]):
+        """Set up checker state from a loaded configuration."""
+        self.repo_root = Path(repo_root)
+        self.config = config
+        self.jobs = jobs
         self.violations: List[Violation] = []
+        self._violations_by_check: Dict[str, List[Violation]] = defaultdict(list)
+        self._py_dirs: Optional[List[Tuple[str, str, List[str]]]] = None
+        self._py_files: Dict[Optional[str], List[Path]] = {}
+        self._ast_cache: Dict[Path, Tuple[str, Optional[ast.AST]]] = {}
+        self._marker_cache: Dict[Path, FrozenSet[bytes]] = {}
+        # Raw bytes of src/ and tools/ files, kept from the marker scan for check_fixable_issues
+        self._raw_cache: Dict[Path, bytes] = {}
+        self._fixable_files: Optional[FrozenSet[Path]] = None
+        self._bind_config()
+        self._compile_patterns()
+
+    def _add_violation(self, violation: Violation):
+        """Record a violation, grouping it by check as it is collected."""
+        self.violations.append(violation)
+        self._violations_by_check[violation.check].append(violation)
+
+    def _bind_config(self):
+        """Bind the config values read inside per-file and per-node loops to attributes."""
+        complexity = self.config["quality"]["complexity"]
+        self._max_file_length = complexity["max_file_length"]
+        self._max_function_length = complexity["max_function_length"]
+        self._max_parameters = complexity["max_parameters"]
+        self._docstring_required: FrozenSet[str] = frozenset(
+            self.config["quality"]["docstrings"]["required_for"]
+        )
+
+        saf_tags = self.config["traceability"]["saf_tags"]
+        self._required_tags: Tuple[str, ...] = tuple(saf_tags["required_tags"])
+        self._tag_formats: Dict[str, Optional[Dict]] = saf_tags["tag_formats"]
+
+    def _compile_patterns(self):
+        """Compile the regexes from the configuration once per run."""
+        naming = self.config["naming"]["python"]
+        self._class_re = re.compile(naming["classes"]["regex"])
+        self._func_re = re.compile(naming["functions"]["regex"])
+        self._const_re = re.compile(naming["constants"]["regex"])
+        self._naming_results: Dict[Pattern, Dict[str, bool]] = {
+            self._class_re: {},
+            self._func_re: {},
+            self._const_re: {},
+        }
+
+        # One scan finds every required tag; the value sits in a lookahead so
+        # adjacent tags on the same line are not consumed by the previous match
+        self._saf_tags_re = re.compile(
+            "@saf:(%s)=(?=([^\n]*))" % "|".join(map(re.escape, self._required_tags))
+        )
+        self._tag_value_res = {
+            tag: re.compile(spec["regex"])
+            for tag, spec in self._tag_formats.items()
+            if spec and "regex" in spec
+        }
+
+    def _collect_python_files(self):
+        """Walk the repository once and index its .py files by top-level directory.
+
+        Skipped directories are pruned during the walk rather than filtered
+        per file, so they are never descended into. Entries are kept as plain
+        (top_dir, dirpath, filenames) strings; Path objects are only built
+        when a check asks for them via _python_files().
+        """
+        self._py_dirs = []
+        self._py_files = {}
+        for dirpath, dirnames, filenames in os.walk(self.repo_root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            py_names = [name for name in filenames if name.endswith(".py")]
+            if not py_names:
+                continue
+            rel_dir = os.path.relpath(dirpath, self.repo_root)
+            top_dir = "" if rel_dir == os.curdir else rel_dir.split(os.sep, 1)[0]
+            self._py_dirs.append((top_dir, dirpath, py_names))
+
+    def _python_dirs(self) -> List[Tuple[str, str, List[str]]]:
+        """Return (top_dir, dirpath, filenames) for every directory holding .py files."""
+        if self._py_dirs is None:
+            self._collect_python_files()
+        return self._py_dirs
+
+    def _python_files(self, top_dir: Optional[str] = None) -> List[Path]:
+        """Return repository .py files, optionally only those under a top-level directory."""
+        py_files = self._py_files.get(top_dir)
+        if py_files is None:
+            py_files = self._py_files[top_dir] = [
+                Path(dirpath, name)
+                for dir_top, dirpath, names in self._python_dirs()
+                if top_dir is None or dir_top == top_dir
+                for name in names
+            ]
+        return py_files
 
     def check_all(self) -> int:
         """Run all convention checks.
@@ -46,12 +240,13 @@ class ConventionChecker:
         """
         print("🔍 Running SAF convention checks...\n")
 
+        # Every check below shares this single repository walk
+        self._collect_python_files()
+
         # Run all check categories
         self.check_file_structure()
-        self.check_naming_conventions()
+        self.check_source_conventions()
         self.check_traceability_tags()
-        self.check_code_quality()
-        self.check_documentation()
         self.check_api_documentation()
         self.check_escape_hatch_tracking()
         self.check_fixable_issues()
@@ -67,7 +262,7 @@ class ConventionChecker:
         for dir_name in required_dirs:
             dir_path = self.repo_root / dir_name
             if not dir_path.exists():
-                self.violations.append(
+                self._add_violation(
                     Violation(
                         check="file_structure",
                         severity="error",
@@ -77,49 +272,50 @@ class ConventionChecker:
                     )
                 )
 
-        # Check product code is in src/
-        for py_file in self.repo_root.rglob("*.py"):
-            # Skip venv, .venv, node_modules, etc.
-            if any(
-                part in py_file.parts
-                for part in ["venv", ".venv", "node_modules", ".git", "__pycache__"]
-            ):
+        # Check product code is in src/ (directory exemptions decided once per directory)
+        for _, dirpath, names in self._python_dirs():
+            if not NON_PRODUCT_DIRS.isdisjoint(Path(dirpath).parts):
                 continue
-
-            # Check if it's product code (not test, not tool, not in src/)
-            if (
-                "test" not in py_file.name
-                and "tests" not in py_file.parts
-                and "tools" not in py_file.parts
-                and "src" not in py_file.parts
-                and py_file.name != "setup.py"
-                and py_file.name != "convention_checker.py"
-            ):
-                self.violations.append(
-                    Violation(
-                        check="file_structure",
-                        severity="error",
-                        file_path=str(py_file),
-                        line=None,
-                        message="Product code must be in src/ directory",
+            for name in names:
+                # Check if it's product code (not test, not tool, not in src/)
+                if (
+                    "test" not in name
+                    and name != "setup.py"
+                    and name != "convention_checker.py"
+                ):
+                    self._add_violation(
+                        Violation(
+                            check="file_structure",
+                            severity="error",
+                            file_path=str(Path(dirpath, name)),
+                            line=None,
+                            message="Product code must be in src/ directory",
+                        )
                     )
-                )
 
         # Check test structure mirrors source
         src_path = self.repo_root / "src"
         tests_path = self.repo_root / "tests"
 
         if src_path.exists():
-            for src_file in src_path.rglob("*.py"):
+            # Index existing tests once instead of stat-ing a path per source file
+            existing_tests = {
+                test_file.relative_to(tests_path)
+                for test_file in self._python_files("tests")
+                if test_file.name.startswith("test_")
+            }
+
+            for src_file in self._python_files("src"):
                 if src_file.name == "__init__.py":
                     continue
 
                 # Calculate corresponding test file path
                 rel_path = src_file.relative_to(src_path)
-                test_file = tests_path / rel_path.parent / f"test_{rel_path.name}"
+                expected = rel_path.parent / f"test_{rel_path.name}"
+                test_file = tests_path / expected
 
-                if not test_file.exists():
-                    self.violations.append(
+                if expected not in existing_tests:
+                    self._add_violation(
                         Violation(
                             check="file_structure",
                             severity="error",
@@ -129,6 +325,72 @@ class ConventionChecker:
                         )
                     )
 
+    def _get_ast(self, py_file: Path) -> Tuple[str, Optional[ast.AST]]:
+        """Read and parse a source file once, caching it for every check.
+
+        Returns:
+            Tuple of (source, tree); tree is None if the file has a syntax error
+        """
+        cached = self._ast_cache.get(py_file)
+        if cached is None:
+            with open(py_file, "r") as f:
+                source = f.read()
+            try:
+                tree = ast.parse(source, filename=str(py_file))
+            except SyntaxError:
+                tree = None
+            cached = self._ast_cache[py_file] = (source, tree)
+        return cached
+
+    def check_source_conventions(self):
+        """Verify naming, code quality and documentation with one AST walk per file.
+
+        Equivalent to running check_naming_conventions, check_code_quality and
+        check_documentation, but each tree is traversed once for all three.
+        """
+        print("✍️  Checking naming conventions...")
+        print("📊 Checking code quality limits...")
+        print("📝 Checking documentation...")
+
+        src_path = self.repo_root / "src"
+        if not src_path.exists():
+            return
+
+        src_files = self._python_files("src")
+
+        # Files are independent, so large trees are checked across processes
+        # (parsing is CPU-bound and threads would serialize on the GIL)
+        if self.jobs != 1 and len(src_files) >= PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor(
+                max_workers=self.jobs,
+                initializer=_init_scan_worker,
+                initargs=(self.config, str(self.repo_root)),
+            ) as executor:
+                for violations in executor.map(_scan_source_file, src_files, chunksize=16):
+                    for violation in violations:
+                        self._add_violation(violation)
+            return
+
+        for py_file in src_files:
+            self._check_source_file(py_file)
+
+    def _check_source_file(self, py_file: Path):
+        """Apply the naming, quality and docstring rules to one file."""
+        docstring_required = self._docstring_required
+
+        source, tree = self._get_ast(py_file)
+        self._check_file_length(py_file, source)
+        if tree is None:
+            self._add_syntax_error(py_file)
+            return
+
+        check_docs = py_file.name != "__init__.py"
+        for node in _iter_statements(tree):
+            self._check_naming_node(node, py_file)
+            self._check_quality_node(node, py_file)
+            if check_docs:
+                self._check_docstring_node(node, py_file, docstring_required)
+
     def check_naming_conventions(self):
         """Verify naming conventions for Python code."""
         print("✍️  Checking naming conventions...")
@@ -137,76 +399,118 @@ class ConventionChecker:
         if not src_path.exists():
             return
 
-        for py_file in src_path.rglob("*.py"):
-            try:
-                with open(py_file, "r") as f:
-                    tree = ast.parse(f.read(), filename=str(py_file))
-                    self._check_ast_naming(tree, py_file)
-            except SyntaxError:
-                self.violations.append(
+        for py_file in self._python_files("src"):
+            _, tree = self._get_ast(py_file)
+            if tree is None:
+                self._add_syntax_error(py_file)
+            else:
+                self._check_ast_naming(tree, py_file)
+
+    def _add_syntax_error(self, file_path: Path):
+        """Record that a file could not be parsed."""
+        self._add_violation(
+            Violation(
+                check="naming",
+                severity="error",
+                file_path=str(file_path),
+                line=None,
+                message="Syntax error prevents naming check",
+            )
+        )
+
+    def _matches_naming(self, pattern: Pattern, name: str) -> bool:
+        """Match a name against a naming regex, memoized per pattern.
+
+        Identifiers repeat heavily across a codebase (run, main, get, ...), so
+        most names are answered by a dict lookup instead of the regex engine.
+        The configured regex stays the source of truth.
+        """
+        results = self._naming_results[pattern]
+        matched = results.get(name)
+        if matched is None:
+            matched = results[name] = pattern.match(name) is not None
+        return matched
+
+    def _check_ast_naming(self, tree: ast.AST, file_path: Path):
+        """Check naming conventions in AST."""
+        for node in _iter_statements(tree):
+            self._check_naming_node(node, file_path)
+
+    def _check_naming_node(self, node: ast.AST, file_path: Path):
+        """Check naming conventions for a single AST node."""
+        # Check class names (PascalCase)
+        if isinstance(node, ast.ClassDef):
+            if not self._matches_naming(self._class_re, node.name):
+                self._add_violation(
                     Violation(
                         check="naming",
                         severity="error",
-                        file_path=str(py_file),
-                        line=None,
-                        message="Syntax error prevents naming check",
+                        file_path=str(file_path),
+                        line=node.lineno,
+                        message=f"Class '{node.name}' must be PascalCase",
                     )
                 )
 
-    def _check_ast_naming(self, tree: ast.AST, file_path: Path):
-        """Check naming conventions in AST."""
-        naming = self.config["naming"]["python"]
+        # Check function names (snake_case)
+        elif isinstance(node, ast.FunctionDef):
+            # Skip private methods (intentionally start with _)
+            if node.name.startswith("_"):
+                return
 
-        for node in ast.walk(tree):
-            # Check class names (PascalCase)
-            if isinstance(node, ast.ClassDef):
-                class_regex = naming["classes"]["regex"]
-                if not re.match(class_regex, node.name):
-                    self.violations.append(
-                        Violation(
-                            check="naming",
-                            severity="error",
-                            file_path=str(file_path),
-                            line=node.lineno,
-                            message=f"Class '{node.name}' must be PascalCase",
-                        )
+            if not self._matches_naming(self._func_re, node.name):
+                self._add_violation(
+                    Violation(
+                        check="naming",
+                        severity="error",
+                        file_path=str(file_path),
+                        line=node.lineno,
+                        message=f"Function '{node.name}' must be snake_case",
                     )
+                )
 
-            # Check function names (snake_case)
-            elif isinstance(node, ast.FunctionDef):
-                # Skip private methods (intentionally start with _)
-                if node.name.startswith("_"):
-                    continue
+        # Check constant names (UPPER_SNAKE_CASE)
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    # Only check module-level constants (all caps)
+                    if target.id.isupper():
+                        if not self._matches_naming(self._const_re, target.id):
+                            self._add_violation(
+                                Violation(
+                                    check="naming",
+                                    severity="error",
+                                    file_path=str(file_path),
+                                    line=node.lineno,
+                                    message=f"Constant '{target.id}' must be UPPER_SNAKE_CASE",
+                                )
+                            )
 
-                func_regex = naming["functions"]["regex"]
-                if not re.match(func_regex, node.name):
-                    self.violations.append(
-                        Violation(
-                            check="naming",
-                            severity="error",
-                            file_path=str(file_path),
-                            line=node.lineno,
-                            message=f"Function '{node.name}' must be snake_case",
-                        )
-                    )
+    def _file_markers(self, py_file: Path) -> FrozenSet[bytes]:
+        """Find SAF and escape-hatch markers with one scan of the file's raw bytes.
 
-            # Check constant names (UPPER_SNAKE_CASE)
-            elif isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        # Only check module-level constants (all caps)
-                        if target.id.isupper():
-                            const_regex = naming["constants"]["regex"]
-                            if not re.match(const_regex, target.id):
-                                self.violations.append(
-                                    Violation(
-                                        check="naming",
-                                        severity="error",
-                                        file_path=str(file_path),
-                                        line=node.lineno,
-                                        message=f"Constant '{target.id}' must be UPPER_SNAKE_CASE",
-                                    )
-                                )
+        Cached so the traceability and escape-hatch checks share a single
+        read of each file. The bytes themselves are only kept for the src/
+        and tools/ files that check_fixable_issues reads again.
+        """
+        markers = self._marker_cache.get(py_file)
+        if markers is None:
+            raw = py_file.read_bytes()
+            markers = self._marker_cache[py_file] = frozenset(MARKERS_RE.findall(raw))
+            if self._fixable_files is None:
+                self._fixable_files = frozenset(self._python_files("src") + self._python_files("tools"))
+            if py_file in self._fixable_files:
+                self._raw_cache[py_file] = raw
+        return markers
+
+    def _file_bytes(self, py_file: Path, release: bool = False) -> bytes:
+        """Return a file's raw bytes, reusing those kept by _file_markers.
+
+        With release, kept bytes are dropped once returned.
+        """
+        raw = self._raw_cache.pop(py_file, None) if release else self._raw_cache.get(py_file)
+        if raw is None:
+            raw = py_file.read_bytes()
+        return raw
 
     def check_traceability_tags(self):
         """Verify SAF traceability tags are present in generated files."""
@@ -218,20 +522,18 @@ class ConventionChecker:
         if not src_path.exists():
             return
 
-        for py_file in src_path.rglob("*.py"):
+        for py_file in self._python_files("src"):
             if py_file.name == "__init__.py":
                 continue
 
             try:
-                with open(py_file, "r") as f:
-                    content = f.read()
-
-                    # Check if file has SAF tags
-                    if "@saf:brick-id=" in content:
-                        # File claims to be generated, validate tags
-                        self._validate_saf_tags(py_file, content)
+                # Only decode files that carry tags
+                if SAF_MARKER in self._file_markers(py_file):
+                    # File claims to be generated, validate tags
+                    raw = self._file_bytes(py_file)
+                    self._validate_saf_tags(py_file, raw.decode("utf-8", errors="replace"))
             except Exception as e:
-                self.violations.append(
+                self._add_violation(
                     Violation(
                         check="traceability",
                         severity="error",
@@ -243,13 +545,21 @@ class ConventionChecker:
 
     def _validate_saf_tags(self, file_path: Path, content: str):
         """Validate SAF traceability tags in file."""
-        required_tags = self.config["traceability"]["saf_tags"]["required_tags"]
-        tag_formats = self.config["traceability"]["saf_tags"]["tag_formats"]
-
-        for tag in required_tags:
-            pattern = f"@saf:{tag}="
-            if pattern not in content:
-                self.violations.append(
+        tag_formats = self._tag_formats
+
+        # Every tag present, and the first non-empty value of each
+        present = set()
+        values: Dict[str, str] = {}
+        if self._required_tags:
+            for match in self._saf_tags_re.finditer(content):
+                tag, value = match.groups()
+                present.add(tag)
+                if value and tag not in values:
+                    values[tag] = value
+
+        for tag in self._required_tags:
+            if tag not in present:
+                self._add_violation(
                     Violation(
                         check="traceability",
                         severity="error",
@@ -258,12 +568,9 @@ class ConventionChecker:
                         message=f"Missing required SAF tag: @saf:{tag}",
                     )
                 )
-            else:
-                # Extract tag value and validate format
-                match = re.search(f"@saf:{tag}=([^\n]+)", content)
-                if match:
-                    value = match.group(1).strip()
-                    self._validate_tag_value(file_path, tag, value, tag_formats.get(tag))
+            elif tag in values:
+                # Validate the extracted tag value's format
+                self._validate_tag_value(file_path, tag, values[tag].strip(), tag_formats.get(tag))
 
     def _validate_tag_value(
         self, file_path: Path, tag: str, value: str, format_spec: Optional[Dict]
@@ -272,9 +579,9 @@ class ConventionChecker:
         if not format_spec:
             return
 
-        if "regex" in format_spec:
-            if not re.match(format_spec["regex"], value):
-                self.violations.append(
+        if tag in self._tag_value_res:
+            if not self._tag_value_res[tag].match(value):
+                self._add_violation(
                     Violation(
                         check="traceability",
                         severity="error",
@@ -284,12 +591,14 @@ class ConventionChecker:
                     )
                 )
 
-        # Special validation for brick-id (must be valid UUID)
-        if tag == "brick-id":
+        # Special validation for brick-id (must be valid UUID). Canonical
+        # 8-4-4-4-12 values skip uuid.UUID(); other spellings it accepts
+        # (braces, urn:uuid:, no dashes) still go through it.
+        if tag == "brick-id" and not CANONICAL_UUID_RE.match(value):
             try:
                 uuid.UUID(value)
             except ValueError:
-                self.violations.append(
+                self._add_violation(
                     Violation(
                         check="traceability",
                         severity="error",
@@ -303,60 +612,62 @@ class ConventionChecker:
         """Verify code quality limits."""
         print("📊 Checking code quality limits...")
 
-        quality_limits = self.config["quality"]["complexity"]
         src_path = self.repo_root / "src"
         if not src_path.exists():
             return
 
-        for py_file in src_path.rglob("*.py"):
-            try:
-                with open(py_file, "r") as f:
-                    lines = f.readlines()
-                    total_lines = len(lines)
-
-                    # Check file length
-                    if total_lines > quality_limits["max_file_length"]:
-                        self.violations.append(
-                            Violation(
-                                check="code_quality",
-                                severity="error",
-                                file_path=str(py_file),
-                                line=None,
-                                message=f"File has {total_lines} lines, max is {quality_limits['max_file_length']}",
-                            )
-                        )
-
-                    # Parse and check function lengths
-                    tree = ast.parse("".join(lines), filename=str(py_file))
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.FunctionDef):
-                            func_lines = node.end_lineno - node.lineno + 1
-                            if func_lines > quality_limits["max_function_length"]:
-                                self.violations.append(
-                                    Violation(
-                                        check="code_quality",
-                                        severity="error",
-                                        file_path=str(py_file),
-                                        line=node.lineno,
-                                        message=f"Function '{node.name}' has {func_lines} lines, max is {quality_limits['max_function_length']}",
-                                    )
-                                )
+        for py_file in self._python_files("src"):
+            source, tree = self._get_ast(py_file)
+            self._check_file_length(py_file, source)
+            if tree is None:
+                continue  # Already reported in naming check
+
+            for node in _iter_statements(tree):
+                self._check_quality_node(node, py_file)
+
+    def _check_file_length(self, file_path: Path, source: str):
+        """Check a file's line count against the configured limit."""
+        total_lines = _count_lines(source)
+        if total_lines > self._max_file_length:
+            self._add_violation(
+                Violation(
+                    check="code_quality",
+                    severity="error",
+                    file_path=str(file_path),
+                    line=None,
+                    message=f"File has {total_lines} lines, max is {self._max_file_length}",
+                )
+            )
 
-                            # Check parameter count
-                            param_count = len(node.args.args)
-                            if param_count > quality_limits["max_parameters"]:
-                                self.violations.append(
-                                    Violation(
-                                        check="code_quality",
-                                        severity="error",
-                                        file_path=str(py_file),
-                                        line=node.lineno,
-                                        message=f"Function '{node.name}' has {param_count} parameters, max is {quality_limits['max_parameters']}",
-                                    )
-                                )
+    def _check_quality_node(self, node: ast.AST, file_path: Path):
+        """Check function length and parameter limits for a single AST node."""
+        if not isinstance(node, ast.FunctionDef):
+            return
 
-            except SyntaxError:
-                pass  # Already reported in naming check
+        func_lines = node.end_lineno - node.lineno + 1
+        if func_lines > self._max_function_length:
+            self._add_violation(
+                Violation(
+                    check="code_quality",
+                    severity="error",
+                    file_path=str(file_path),
+                    line=node.lineno,
+                    message=f"Function '{node.name}' has {func_lines} lines, max is {self._max_function_length}",
+                )
+            )
+
+        # Check parameter count
+        param_count = len(node.args.args)
+        if param_count > self._max_parameters:
+            self._add_violation(
+                Violation(
+                    check="code_quality",
+                    severity="error",
+                    file_path=str(file_path),
+                    line=node.lineno,
+                    message=f"Function '{node.name}' has {param_count} parameters, max is {self._max_parameters}",
+                )
+            )
 
     def check_documentation(self):
         """Verify documentation requirements."""
@@ -366,57 +677,60 @@ class ConventionChecker:
         if not src_path.exists():
             return
 
-        docstring_required = self.config["quality"]["docstrings"]["required_for"]
+        docstring_required = self._docstring_required
 
-        for py_file in src_path.rglob("*.py"):
+        for py_file in self._python_files("src"):
             if py_file.name == "__init__.py":
                 continue
 
-            try:
-                with open(py_file, "r") as f:
-                    tree = ast.parse(f.read(), filename=str(py_file))
-                    self._check_docstrings(tree, py_file, docstring_required)
-            except SyntaxError:
-                pass  # Already reported
+            _, tree = self._get_ast(py_file)
+            if tree is not None:  # Syntax errors already reported
+                self._check_docstrings(tree, py_file, docstring_required)
 
     def _check_docstrings(
-        self, tree: ast.AST, file_path: Path, required_for: List[str]
+        self, tree: ast.AST, file_path: Path, required_for: FrozenSet[str]
     ):
         """Check for required docstrings."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                # Skip private functions
-                if node.name.startswith("_"):
-                    continue
+        for node in _iter_statements(tree):
+            self._check_docstring_node(node, file_path, required_for)
 
-                # Check if public function has docstring
-                if "public_functions" in required_for:
-                    docstring = ast.get_docstring(node)
-                    if not docstring:
-                        self.violations.append(
-                            Violation(
-                                check="documentation",
-                                severity="error",
-                                file_path=str(file_path),
-                                line=node.lineno,
-                                message=f"Public function '{node.name}' missing docstring",
-                            )
+    def _check_docstring_node(
+        self, node: ast.AST, file_path: Path, required_for: FrozenSet[str]
+    ):
+        """Check a single AST node for a required docstring."""
+        if isinstance(node, ast.FunctionDef):
+            # Skip private functions
+            if node.name.startswith("_"):
+                return
+
+            # Check if public function has docstring
+            if "public_functions" in required_for:
+                docstring = ast.get_docstring(node)
+                if not docstring:
+                    self._add_violation(
+                        Violation(
+                            check="documentation",
+                            severity="error",
+                            file_path=str(file_path),
+                            line=node.lineno,
+                            message=f"Public function '{node.name}' missing docstring",
                         )
+                    )
 
-            elif isinstance(node, ast.ClassDef):
-                # Check if public class has docstring
-                if "public_classes" in required_for:
-                    docstring = ast.get_docstring(node)
-                    if not docstring:
-                        self.violations.append(
-                            Violation(
-                                check="documentation",
-                                severity="error",
-                                file_path=str(file_path),
-                                line=node.lineno,
-                                message=f"Public class '{node.name}' missing docstring",
-                            )
+        elif isinstance(node, ast.ClassDef):
+            # Check if public class has docstring
+            if "public_classes" in required_for:
+                docstring = ast.get_docstring(node)
+                if not docstring:
+                    self._add_violation(
+                        Violation(
+                            check="documentation",
+                            severity="error",
+                            file_path=str(file_path),
+                            line=node.lineno,
+                            message=f"Public class '{node.name}' missing docstring",
                         )
+                    )
 
     def check_api_documentation(self):
         """Verify API endpoints have corresponding documentation.
@@ -441,7 +755,7 @@ class ConventionChecker:
             expected_doc = docs_api_path / endpoint_file.name
 
             if not expected_doc.exists():
-                self.violations.append(
+                self._add_violation(
                     Violation(
                         check="api_documentation",
                         severity="error",
@@ -461,25 +775,25 @@ class ConventionChecker:
 
         escape_hatch_log = self.repo_root / "LogBook" / "escape-hatches.yaml"
 
-        # Find files with escape hatch markers
-        for py_file in self.repo_root.rglob("*.py"):
-            # Skip common directories
-            if any(
-                part in py_file.parts
-                for part in ["venv", ".venv", "node_modules", ".git", "__pycache__"]
-            ):
-                continue
+        # Read the log once up front rather than once per marked file
+        log_content: Optional[str] = None
+        if escape_hatch_log.exists():
+            try:
+                log_content = escape_hatch_log.read_text(encoding="utf-8")
+            except IOError:
+                pass
 
+        # Find files with escape hatch markers
+        for py_file in self._python_files():
             try:
-                content = py_file.read_text(encoding="utf-8")
                 # Check for escape hatch markers
-                if "@escape-hatch" in content or "ESCAPE_HATCH" in content:
+                markers = self._file_markers(py_file)
+                if not ESCAPE_HATCH_MARKERS.isdisjoint(markers):
                     # Verify it's tracked in LogBook (if log exists)
-                    if escape_hatch_log.exists():
-                        log_content = escape_hatch_log.read_text(encoding="utf-8")
+                    if log_content is not None:
                         rel_path = str(py_file.relative_to(self.repo_root))
                         if rel_path not in log_content:
-                            self.violations.append(
+                            self._add_violation(
                                 Violation(
                                     check="escape_hatch_tracking",
                                     severity="error",
@@ -488,7 +802,7 @@ class ConventionChecker:
                                     message="Escape hatch not tracked in LogBook/escape-hatches.yaml",
                                 )
                             )
-            except (IOError, UnicodeDecodeError):
+            except IOError:
                 pass
 
     def check_fixable_issues(self):
@@ -496,50 +810,42 @@ class ConventionChecker:
         print("🔧 Checking for auto-fixable issues...")
 
         # Check all Python files in src and tools
-        check_paths = [self.repo_root / "src", self.repo_root / "tools"]
-
-        for check_path in check_paths:
-            if not check_path.exists():
-                continue
-
-            for py_file in check_path.rglob("*.py"):
+        for top_dir in ("src", "tools"):
+            for py_file in self._python_files(top_dir):
                 try:
-                    with open(py_file, "r") as f:
-                        content = f.read()
-                        lines = content.split('\n')
-
-                    # Check for trailing whitespace
-                    for i, line in enumerate(lines, 1):
-                        if line != line.rstrip():
-                            self.violations.append(
-                                Violation(
-                                    check="code_quality",
-                                    severity="warning",
-                                    file_path=str(py_file),
-                                    line=i,
-                                    message="Trailing whitespace detected",
-                                    fixable=True,
-                                )
+                    # Reuse the bytes the marker scan already read, then let them go
+                    content = _decode_text(self._file_bytes(py_file, release=True))
+
+                    # Check for trailing whitespace (only reported once per file)
+                    trailing_line = _first_trailing_whitespace_line(content)
+                    if trailing_line is not None:
+                        self._add_violation(
+                            Violation(
+                                check="code_quality",
+                                severity="warning",
+                                file_path=str(py_file),
+                                line=trailing_line,
+                                message="Trailing whitespace detected",
+                                fixable=True,
                             )
-                            break  # Only report once per file
+                        )
 
                     # Check for missing newline at end of file
                     if content and not content.endswith('\n'):
-                        self.violations.append(
+                        self._add_violation(
                             Violation(
                                 check="code_quality",
                                 severity="warning",
                                 file_path=str(py_file),
-                                line=len(lines),
+                                line=_count_lines(content),
                                 message="Missing newline at end of file",
                                 fixable=True,
                             )
                         )
 
                     # Check for multiple blank lines
-                    import re as re_check
-                    if re_check.search(r'\n{3,}', content):
-                        self.violations.append(
+                    if MULTIPLE_BLANK_LINES_RE.search(content):
+                        self._add_violation(
                             Violation(
                                 check="code_quality",
                                 severity="warning",
@@ -568,12 +874,8 @@ class ConventionChecker:
 
         print(f"\n❌ Found {len(self.violations)} convention violations:\n")
 
-        # Group by check type
-        by_check: Dict[str, List[Violation]] = {}
-        for v in self.violations:
-            by_check.setdefault(v.check, []).append(v)
-
-        for check, violations in sorted(by_check.items()):
+        # Violations are grouped by check type as they are recorded
+        for check, violations in sorted(self._violations_by_check.items()):
             print(f"  {check}: {len(violations)} violations")
 
         if verbose:
@@ -590,7 +892,7 @@ class ConventionChecker:
 
         return True
 
-    def auto_fix(self):
+    def auto_fix(self, backup: bool = False):
         """Apply automatic fixes for fixable violations.
 
         Currently supports:
@@ -598,6 +900,12 @@ class ConventionChecker:
         - Missing newline at end of file
         - Empty line cleanup (multiple blank lines -> single)
 
+        Fixed files are written to a temporary sibling and renamed into place,
+        so an interrupted run never leaves a half-written source file.
+
+        Args:
+            backup: Also keep the original content as <file>.bak
+
         For import ordering and code formatting, use external tools:
         - isort: pip install isort && isort .
         - black: pip install black && black .
@@ -631,31 +939,41 @@ class ConventionChecker:
 
                 # Apply fixes
                 for v in violations:
-                    if "trailing whitespace" in v.message.lower():
-                        # Remove trailing whitespace from each line
-                        lines = content.split('\n')
-                        content = '\n'.join(line.rstrip() for line in lines)
+                    message = v.message.lower()
+                    if "trailing whitespace" in message:
+                        # Remove trailing whitespace from each line (split/rstrip/join
+                        # measures ~10x faster here than an equivalent regex sub)
+                        content = '\n'.join(map(str.rstrip, content.split('\n')))
 
-                    if "missing newline" in v.message.lower() or "eof" in v.message.lower():
+                    if "missing newline" in message or "eof" in message:
                         # Ensure file ends with newline
                         if not content.endswith('\n'):
                             content += '\n'
 
-                    if "multiple blank lines" in v.message.lower():
+                    if "multiple blank lines" in message:
                         # Collapse multiple blank lines to single
-                        import re as re_fix
-                        content = re_fix.sub(r'\n{3,}', '\n\n', content)
+                        content = MULTIPLE_BLANK_LINES_RE.sub('\n\n', content)
 
                 # Only write if content changed
                 if content != original:
-                    # Create backup
-                    backup_path = path.with_suffix(path.suffix + '.bak')
-                    backup_path.write_text(original)
-
-                    # Write fixed content
-                    path.write_text(content)
+                    if backup:
+                        backup_path = path.with_suffix(path.suffix + '.bak')
+                        backup_path.write_text(original)
+
+                    # Write fixed content atomically, keeping the file's permissions
+                    tmp_path = path.with_suffix(path.suffix + '.tmp')
+                    try:
+                        tmp_path.write_text(content)
+                        shutil.copymode(path, tmp_path)
+                        os.replace(tmp_path, path)
+                    except BaseException:
+                        tmp_path.unlink(missing_ok=True)
+                        raise
                     fixed_count += 1
-                    print(f"  ✅ Fixed {file_path} (backup: {backup_path.name})")
+                    if backup:
+                        print(f"  ✅ Fixed {file_path} (backup: {backup_path.name})")
+                    else:
+                        print(f"  ✅ Fixed {file_path}")
 
             except Exception as e:
                 print(f"  ❌ Error fixing {file_path}: {e}")
@@ -666,6 +984,31 @@ class ConventionChecker:
             print("\n💡 For import ordering and code formatting, run:")
             print("   pip install isort black && isort . && black .")
 
+# Per-process checker used by ProcessPoolExecutor workers in check_source_conventions
+_worker_checker: Optional[ConventionChecker] = None
+
+def _init_scan_worker(config: dict, repo_root: str):
+    """Build the worker process's checker once, from the parent's configuration."""
+    global _worker_checker
+    _worker_checker = ConventionChecker.from_config(config, repo_root, jobs=1)
+
+def _scan_source_file(py_file: Path) -> List[Violation]:
+    """Run the per-file source checks in a worker process and return its violations."""
+    _worker_checker.violations = []
+    _worker_checker._violations_by_check.clear()
+    _worker_checker._check_source_file(py_file)
+    return _worker_checker.violations
+
+def _positive_int(value: str) -> int:
+    """argparse type for --jobs: an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="SAF Convention Checker")
@@ -684,20 +1027,34 @@ def main():
         action="store_true",
         help="Automatically fix violations where possible",
     )
+    parser.add_argument(
+        "--backup",
+        action="store_true",
+        help="With --fix, keep a .bak copy of each modified file",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
         help="Show detailed violation information",
     )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help="Worker processes for per-file checks (default: CPU count, 1 = serial)",
+    )
 
     args = parser.parse_args()
 
     # Initialize checker
     try:
-        checker = ConventionChecker(args.config, args.repo_root)
+        checker = ConventionChecker(args.config, args.repo_root, jobs=args.jobs)
     except FileNotFoundError as e:
         print(f"❌ Error: {e}", file=sys.stderr)
         return 2
+    except KeyError as e:
+        print(f"❌ Error: missing config key {e}", file=sys.stderr)
+        return 2
 
     # Run checks
     try:
@@ -708,7 +1065,7 @@ def main():
 
     # Apply fixes if requested
     if args.fix and violation_count > 0:
-        checker.auto_fix()
+        checker.auto_fix(backup=args.backup)
 
     # Report results
     has_violations = checker.report(verbose=args.verbose)
@@ -13,13 +13,15 @@ Usage:
     python tools/schema_validator.py --verify-brick .
 """
 
+import argparse
+import hashlib
 import os
 import sys
 import yaml
 import json
 import re
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from datetime import datetime
 
 # Path validation for security
@@ -43,6 +45,186 @@ except ImportError:
             )
         return resolved
 
+# LibYAML-backed loader when available (several times faster for schema parsing)
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Provenance markers searched for in the header of every scanned source file
+SCHEMA_SOURCE_RE = re.compile(r'@saf:schema-source=([^\s\n]+)')
+EXCEPTION_MARKER_RE = re.compile(r'@saf:exception=([^\s\n]+)')
+SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+$')
+
+# Markers only count within the first HEADER_CHARS characters of a file. The
+# bytes pattern spells out every ASCII character str's \s treats as whitespace.
+HEADER_CHARS = 1000
+SCHEMA_SOURCE_BYTES_RE = re.compile(rb'@saf:schema-source=([^\s\x1c-\x1f]+)')
+
+# Source files scanned for provenance, and directories never descended into
+GENERATED_FILE_EXTENSIONS = ('.py', '.ts', '.js', '.sql')
+EXCLUDED_DIRS = frozenset({'.git', 'node_modules', '.brick', 'LogBook', 'PLANNING'})
+
+# Result shared by every check that finds no issues; check results are
+# read-only once returned (validate_schema copies issues out of them)
+_PASSED_CHECK: Dict[str, Any] = {'passed': True, 'issues': []}
+
+# Fields every schema's metadata block must define, in reporting order
+REQUIRED_METADATA_FIELDS = ('name', 'version', 'type', 'created_at')
+_REQUIRED_METADATA_SET = frozenset(REQUIRED_METADATA_FIELDS)
+
+# Keywords whose presence anywhere in a schema marks its constraints as explicit
+CONSTRAINT_KEYWORDS = ('nullable', 'required', 'unique', 'max_length', 'min_length', 'pattern', 'format')
+
+def _mentions_any(node: Any, keywords: Tuple[str, ...]) -> bool:
+    """Return True if any keyword occurs within a string key or value of node.
+
+    Walks the loaded YAML directly rather than substring-searching a
+    yaml.dump() of it; substring matching inside keys and values is kept
+    (e.g. 'required' matches 'required_fields').
+    """
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            if any(keyword in item for keyword in keywords):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set)):
+            stack.extend(item)
+    return False
+
+def _count_nonblank_lines(content: str) -> int:
+    """Count lines that are not empty or whitespace-only.
+
+    Same result as summing line.strip() over the lines, but uses C-level
+    list.count and str.isspace instead of allocating a stripped copy of
+    every line. Text mode has already normalized line endings to '\n'.
+    """
+    lines = content.split('\n')
+    return len(lines) - lines.count('') - sum(map(str.isspace, lines))
+
+# validate_schema verdicts from earlier --dir runs, keyed by a digest of the
+# schema file's bytes and dropped whenever this file's source changes. Kept
+# in the repository's .cache/ whichever directory the tool runs from
+VERDICT_CACHE_PATH = Path(__file__).resolve().parent.parent / '.cache' / 'schema_verdicts.json'
+
+# Per-file scans are I/O-bound, so larger trees are read from a thread pool
+PARALLEL_SCAN_MIN_FILES = 32
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+def _walk_generated_files(root: str):
+    """Yield source file paths under root in one os.scandir walk.
+
+    Excluded directories are pruned on entry, so their subtrees are never
+    listed, and symlinked directories are not followed. An explicit stack
+    replaces recursion (no yield-from chain per directory level); each
+    directory's files are yielded before its subdirectories are visited,
+    matching Path.rglob's ordering.
+    """
+    pending = [root]
+    while pending:
+        subdirs = []
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in EXCLUDED_DIRS:
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith(GENERATED_FILE_EXTENSIONS):
+                        yield entry.path
+        except OSError:
+            continue
+        # Reversed so the first subdirectory is walked next
+        pending.extend(reversed(subdirs))
+
+# Compiled validation functions for --file/--schema; identical schemas share one
+_validators_by_path: Dict[str, Callable[[Any], List[Tuple[str, List[Any]]]]] = {}
+_validators_by_content: Dict[str, Callable[[Any], List[Tuple[str, List[Any]]]]] = {}
+
+class InvalidSchemaError(Exception):
+    """A schema given to --schema is not a valid JSON Schema."""
+
+def _load_document(path: str) -> Any:
+    """Load a JSON or YAML document, chosen by file extension."""
+    with open(path, 'r') as f:
+        if path.endswith('.json'):
+            return json.load(f)
+        return yaml.load(f, Loader=SafeLoader)
+
+def _compile_schema(schema: Any) -> Callable[[Any], List[Tuple[str, List[Any]]]]:
+    """Compile a Draft 7 schema into a function returning (message, path) per error.
+
+    fastjsonschema, when installed, generates straight-line Python for the
+    schema and handles the common all-valid case; jsonschema's Draft7Validator
+    only walks the document when it is invalid, to report every error.
+
+    Raises:
+        ImportError: Neither fastjsonschema nor jsonschema is installed
+        InvalidSchemaError: The schema is not a valid Draft 7 schema
+    """
+    try:
+        import fastjsonschema
+    except ImportError:
+        fastjsonschema = None
+    try:
+        from jsonschema import Draft7Validator, SchemaError
+    except ImportError:
+        if fastjsonschema is None:
+            raise
+        Draft7Validator = None
+
+    draft7 = None
+    if Draft7Validator is not None:
+        try:
+            Draft7Validator.check_schema(schema)
+        except SchemaError as e:
+            raise InvalidSchemaError(e.message) from e
+        draft7 = Draft7Validator(schema)
+
+    def draft7_errors(data: Any) -> List[Tuple[str, List[Any]]]:
+        return [(err.message, list(err.path)) for err in draft7.iter_errors(data)]
+
+    if fastjsonschema is None:
+        return draft7_errors
+
+    try:
+        # use_default=False: the fast path must not write schema defaults into
+        # the document, which Draft7Validator then re-checks on failure
+        fast = fastjsonschema.compile(schema, use_default=False)
+    except fastjsonschema.JsonSchemaDefinitionException as e:
+        raise InvalidSchemaError(str(e)) from e
+
+    def validate(data: Any) -> List[Tuple[str, List[Any]]]:
+        try:
+            fast(data)
+        except fastjsonschema.JsonSchemaValueException as e:
+            if draft7 is not None:
+                return draft7_errors(data)
+            return [(e.message, e.path[1:])]  # Drop the leading 'data' root
+        return []
+
+    return validate
+
+def _get_validator(schema_path: str) -> Callable[[Any], List[Tuple[str, List[Any]]]]:
+    """Return the compiled validation function for schema_path, compiling each distinct schema once.
+
+    Later lookups by path or by canonical content reuse the first compilation.
+    """
+    validator = _validators_by_path.get(schema_path)
+    if validator is not None:
+        return validator
+
+    schema = _load_document(schema_path)
+    content_key = json.dumps(schema, sort_keys=True, default=str)
+    validator = _validators_by_content.get(content_key)
+    if validator is None:
+        validator = _validators_by_content[content_key] = _compile_schema(schema)
+    _validators_by_path[schema_path] = validator
+    return validator
+
 class SchemaValidator:
     """Validate schemas and schema-driven generation compliance."""
 
@@ -51,11 +233,32 @@ class SchemaValidator:
         self.brick_dir = Path(brick_dir)
         self.brick_path = self.brick_dir / '.brick'
         self.schemas_dir = self.brick_dir / 'schemas'
+        # (resolved path, mtime_ns, size) -> (metadata check, versioning check)
+        self._schema_checks: Dict[Tuple[Path, int, int], Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+        # resolved path -> (mtime_ns, size, parsed YAML)
+        self._yaml_cache: Dict[Path, Tuple[int, int, Any]] = {}
+        # Per-brick file scans shared by the checks of one verify_brick run (None outside it)
+        self._brick_scans: Optional[Dict[Path, List[Tuple[Path, int, Optional[str], Optional[str]]]]] = None
+        # Persisted validate_schema verdicts while a --dir run uses them (None otherwise)
+        self._verdicts: Optional[Dict[str, Dict[str, Any]]] = None
+        # Verdict keys looked up in this run; only these are persisted
+        self._verdict_keys: Set[str] = set()
+        self._validator_digest = ''
 
     def validate_schema(self, schema_path: str) -> Dict[str, Any]:
         """Validate schema completeness and correctness."""
         print(f"Validating schema: {schema_path}\n")
 
+        result = self._validate_schema_core(schema_path)
+
+        # Print results (load failures only carry an error message)
+        if 'checks' in result:
+            self._print_validation_results(result)
+
+        return result
+
+    def _validate_schema_core(self, schema_path: str) -> Dict[str, Any]:
+        """Validate a schema without printing anything."""
         schema_file = Path(schema_path)
         if not schema_file.exists():
             return {
@@ -63,15 +266,17 @@ class SchemaValidator:
                 'error': f'Schema file not found: {schema_path}'
             }
 
+        if self._verdicts is not None:
+            return self._cached_verdict(schema_file)
+
         # Load schema
-        with open(schema_file, 'r') as f:
-            try:
-                schema = yaml.safe_load(f)
-            except yaml.YAMLError as e:
-                return {
-                    'status': 'fail',
-                    'error': f'Invalid YAML: {e}'
-                }
+        try:
+            schema = self._load_schema(schema_file)
+        except yaml.YAMLError as e:
+            return {
+                'status': 'fail',
+                'error': f'Invalid YAML: {e}'
+            }
 
         # Validate schema
         result = {
@@ -82,8 +287,10 @@ class SchemaValidator:
             'warnings': []
         }
 
+        # Metadata and versioning checks are shared with score_completeness
+        metadata_check, versioning_check = self._schema_level_checks(schema_file, schema)
+
         # Check 1: Schema metadata
-        metadata_check = self._check_schema_metadata(schema)
         result['checks']['metadata'] = metadata_check
         if not metadata_check['passed']:
             result['status'] = 'fail'
@@ -117,17 +324,83 @@ class SchemaValidator:
                     result['issues'].extend(integration_check['issues'])
 
         # Check 3: Schema versioning
-        versioning_check = self._check_schema_versioning(schema)
         result['checks']['versioning'] = versioning_check
         if not versioning_check['passed']:
             result['status'] = 'fail'
             result['issues'].extend(versioning_check['issues'])
 
-        # Print results
-        self._print_validation_results(result)
-
         return result
 
+    def load_verdict_cache(self) -> None:
+        """Reuse validate_schema verdicts persisted by earlier runs.
+
+        A verdict depends only on the schema file's contents, so it is keyed
+        by their digest. The cache is discarded when this file's source
+        differs from the one that wrote it, so changed checks never reuse
+        stale verdicts.
+        """
+        self._validator_digest = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+        try:
+            with open(VERDICT_CACHE_PATH, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = None
+        if (isinstance(cache, dict) and cache.get('validator') == self._validator_digest
+                and isinstance(cache.get('verdicts'), dict)):
+            self._verdicts = cache['verdicts']
+        else:
+            self._verdicts = {}
+        self._verdict_keys = set()
+
+    def save_verdict_cache(self) -> None:
+        """Persist the verdicts looked up in this run, then stop using the cache.
+
+        Verdicts for schemas that were deleted or edited since are dropped.
+        """
+        verdicts = {key: self._verdicts[key] for key in sorted(self._verdict_keys) if key in self._verdicts}
+        cache = {'validator': self._validator_digest, 'verdicts': verdicts}
+        self._verdicts = None
+        try:
+            VERDICT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            # Per-process name, so concurrent runs never share a half-written file
+            tmp_path = VERDICT_CACHE_PATH.with_suffix(f'.{os.getpid()}.tmp')
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(cache, f)
+                os.replace(tmp_path, VERDICT_CACHE_PATH)
+            except BaseException:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+                raise
+        except OSError as e:
+            print(f"Warning: Cannot write {VERDICT_CACHE_PATH}: {e}", file=sys.stderr)
+
+    def _cached_verdict(self, schema_file: Path) -> Dict[str, Any]:
+        """Validate a schema through the verdict cache."""
+        key = hashlib.blake2b(schema_file.read_bytes(), digest_size=16).hexdigest()
+
+        self._verdict_keys.add(key)
+        verdict = self._verdicts.get(key)
+        if verdict is None:
+            verdicts, self._verdicts = self._verdicts, None
+            try:
+                result = self._validate_schema_core(str(schema_file))
+            finally:
+                self._verdicts = verdicts
+            verdict = {k: v for k, v in result.items() if k != 'schema_path'}
+            # Only verdicts that survive a JSON round trip unchanged are kept
+            if 'checks' not in result:
+                return result
+            try:
+                if json.loads(json.dumps(verdict)) != verdict:
+                    return result
+            except (TypeError, ValueError):
+                # e.g. a YAML date in the schema, which JSON cannot encode
+                return result
+            verdicts[key] = verdict
+
+        return {'schema_path': str(schema_file), **verdict}
+
     def check_correspondence(self, brick_dir: str = '.') -> Dict[str, Any]:
         """Check schema-artifact correspondence."""
         print("Checking schema-artifact correspondence...\n")
@@ -142,15 +415,18 @@ class SchemaValidator:
             'issues': []
         }
 
-        # Find all generated artifacts
-        generated_files = self._find_generated_files(brick_path)
+        # Find all generated artifacts and read their provenance headers
+        scan = self._cached_brick_scan(brick_path)
+        if scan is not None:
+            generated_files = [entry[0] for entry in scan]
+            schema_sources = [entry[2] for entry in scan]
+        else:
+            generated_files = self._find_generated_files(brick_path)
+            schema_sources = self._map_files(self._extract_schema_source, generated_files)
 
-        for file_path in generated_files:
+        for file_path, schema_source in zip(generated_files, schema_sources):
             result['artifacts_checked'] += 1
 
-            # Check for schema source in provenance header
-            schema_source = self._extract_schema_source(file_path)
-
             if not schema_source:
                 result['missing_trace'].append(str(file_path))
                 result['status'] = 'fail'
@@ -168,28 +444,31 @@ class SchemaValidator:
                 })
                 result['status'] = 'fail'
 
-        # Print results
-        print("Schema-Artifact Correspondence Report")
-        print("=" * 60)
-        print(f"Artifacts checked: {result['artifacts_checked']}")
-        print(f"Schema-traced: {result['schema_traced']}")
-        print(f"Missing trace: {len(result['missing_trace'])}")
-        print(f"Invalid trace: {len(result['invalid_trace'])}")
-        print(f"\nStatus: {result['status'].upper()}\n")
+        # Print results as one write
+        report = [
+            "Schema-Artifact Correspondence Report",
+            "=" * 60,
+            f"Artifacts checked: {result['artifacts_checked']}",
+            f"Schema-traced: {result['schema_traced']}",
+            f"Missing trace: {len(result['missing_trace'])}",
+            f"Invalid trace: {len(result['invalid_trace'])}",
+            f"\nStatus: {result['status'].upper()}\n",
+        ]
 
         if result['missing_trace']:
-            print("Files missing schema trace:")
-            for file_path in result['missing_trace']:
-                print(f"  ❌ {file_path}")
-            print()
+            report.append("Files missing schema trace:")
+            report.extend(f"  ❌ {file_path}" for file_path in result['missing_trace'])
+            report.append("")
 
         if result['invalid_trace']:
-            print("Files with invalid schema trace:")
+            report.append("Files with invalid schema trace:")
             for item in result['invalid_trace']:
-                print(f"  ❌ {item['file']}")
-                print(f"     Schema: {item['schema']}")
-                print(f"     Error: {item['error']}")
-            print()
+                report.append(f"  ❌ {item['file']}")
+                report.append(f"     Schema: {item['schema']}")
+                report.append(f"     Error: {item['error']}")
+            report.append("")
+
+        print("\n".join(report))
 
         return result
 
@@ -213,17 +492,16 @@ class SchemaValidator:
             'target_percent': target
         }
 
-        # Find all generated/source files
-        source_files = self._find_source_files(brick_path)
+        # Find all generated/source files; one read per file yields its
+        # line count and provenance markers
+        scan = self._cached_brick_scan(brick_path)
+        if scan is None:
+            scan = self._scan_brick(brick_path)
 
-        for file_path in source_files:
-            lines = self._count_file_lines(file_path)
+        for _, lines, schema_source, exception_marker in scan:
             result['total_lines'] += lines
 
             # Check if schema-traced or exception
-            schema_source = self._extract_schema_source(file_path)
-            exception_marker = self._extract_exception_marker(file_path)
-
             if schema_source:
                 result['schema_traced_lines'] += lines
             elif exception_marker:
@@ -241,16 +519,18 @@ class SchemaValidator:
         if result['coverage_percent'] < result['target_percent']:
             result['status'] = 'fail'
 
-        # Print results
-        print("Schema Coverage Report")
-        print("=" * 60)
-        print(f"Total lines: {result['total_lines']}")
-        print(f"Schema-traced lines: {result['schema_traced_lines']}")
-        print(f"Exception lines: {result['exception_lines']}")
-        print(f"Manual lines: {result['manual_lines']}")
-        print(f"\nCoverage: {result['coverage_percent']:.1f}%")
-        print(f"Target: {result['target_percent']:.1f}%")
-        print(f"\nStatus: {result['status'].upper()}\n")
+        # Print results as one write
+        print("\n".join([
+            "Schema Coverage Report",
+            "=" * 60,
+            f"Total lines: {result['total_lines']}",
+            f"Schema-traced lines: {result['schema_traced_lines']}",
+            f"Exception lines: {result['exception_lines']}",
+            f"Manual lines: {result['manual_lines']}",
+            f"\nCoverage: {result['coverage_percent']:.1f}%",
+            f"Target: {result['target_percent']:.1f}%",
+            f"\nStatus: {result['status'].upper()}\n",
+        ]))
 
         return result
 
@@ -266,8 +546,7 @@ class SchemaValidator:
             }
 
         # Load schema
-        with open(schema_file, 'r') as f:
-            schema = yaml.safe_load(f)
+        schema = self._load_schema(schema_file)
 
         result = {
             'schema_path': str(schema_file),
@@ -305,9 +584,11 @@ class SchemaValidator:
         else:
             result['checks']['relationships_defined'] = 'FAIL'
 
+        # Metadata and versioning checks are shared with validate_schema
+        metadata_check, versioning_check = self._schema_level_checks(schema_file, schema)
+
         # Rule 4: Metadata complete (20 points)
         total_checks += 1
-        metadata_check = self._check_schema_metadata(schema)
         if metadata_check['passed']:
             checks_passed += 1
             result['checks']['metadata_complete'] = 'PASS'
@@ -316,7 +597,6 @@ class SchemaValidator:
 
         # Rule 5: Versioning correct (20 points)
         total_checks += 1
-        versioning_check = self._check_schema_versioning(schema)
         if versioning_check['passed']:
             checks_passed += 1
             result['checks']['versioning_correct'] = 'PASS'
@@ -329,17 +609,20 @@ class SchemaValidator:
         if result['score'] < 100:
             result['status'] = 'fail'
 
-        # Print results
-        print("Schema Completeness Score")
-        print("=" * 60)
-        print(f"Schema: {schema_path}")
-        print(f"Type: {schema_type}")
-        print(f"\nChecks:")
+        # Print results as one write
+        report = [
+            "Schema Completeness Score",
+            "=" * 60,
+            f"Schema: {schema_path}",
+            f"Type: {schema_type}",
+            "\nChecks:",
+        ]
         for check, status in result['checks'].items():
             symbol = "✅" if status == "PASS" else "❌"
-            print(f"  {symbol} {check}: {status}")
-        print(f"\nScore: {result['score']}/{result['max_score']}")
-        print(f"Status: {result['status'].upper()}\n")
+            report.append(f"  {symbol} {check}: {status}")
+        report.append(f"\nScore: {result['score']}/{result['max_score']}")
+        report.append(f"Status: {result['status'].upper()}\n")
+        print("\n".join(report))
 
         return result
 
@@ -355,8 +638,7 @@ class SchemaValidator:
             }
 
         # Load schema
-        with open(schema_file, 'r') as f:
-            schema = yaml.safe_load(f)
+        schema = self._load_schema(schema_file)
 
         result = {
             'schema_path': str(schema_file),
@@ -367,7 +649,8 @@ class SchemaValidator:
         }
 
         # Extract dependencies
-        depends_on = schema.get('schema', {}).get('depends_on', [])
+        schema_meta = schema.get('schema')
+        depends_on = (schema_meta.get('depends_on') if isinstance(schema_meta, dict) else None) or ()
 
         for dep in depends_on:
             result['dependencies'].append(dep)
@@ -384,30 +667,38 @@ class SchemaValidator:
             result['circular'] = circular
             result['status'] = 'fail'
 
-        # Print results
-        print("Schema Dependencies Report")
-        print("=" * 60)
-        print(f"Dependencies: {len(result['dependencies'])}")
-        print(f"Missing: {len(result['missing'])}")
-        print(f"Circular: {len(result['circular'])}")
-        print(f"\nStatus: {result['status'].upper()}\n")
+        # Print results as one write
+        report = [
+            "Schema Dependencies Report",
+            "=" * 60,
+            f"Dependencies: {len(result['dependencies'])}",
+            f"Missing: {len(result['missing'])}",
+            f"Circular: {len(result['circular'])}",
+            f"\nStatus: {result['status'].upper()}\n",
+        ]
 
         if result['missing']:
-            print("Missing dependencies:")
-            for dep in result['missing']:
-                print(f"  ❌ {dep}")
-            print()
+            report.append("Missing dependencies:")
+            report.extend(f"  ❌ {dep}" for dep in result['missing'])
+            report.append("")
 
         if result['circular']:
-            print("Circular dependencies detected:")
-            for cycle in result['circular']:
-                print(f"  ❌ {' → '.join(cycle)}")
-            print()
+            report.append("Circular dependencies detected:")
+            report.extend(f"  ❌ {' → '.join(cycle)}" for cycle in result['circular'])
+            report.append("")
+
+        print("\n".join(report))
 
         return result
 
-    def verify_brick(self, brick_dir: str = '.') -> Dict[str, Any]:
-        """Verify entire brick for schema compliance."""
+    def verify_brick(self, brick_dir: str = '.', verbose: bool = False) -> Dict[str, Any]:
+        """Verify entire brick for schema compliance.
+
+        Args:
+            brick_dir: Brick directory to verify
+            verbose: Print the full validation report of every schema; by default
+                only failing schemas' issues are listed, in the summary
+        """
         print("Verifying brick schema compliance...\n")
 
         result = {
@@ -417,7 +708,8 @@ class SchemaValidator:
             'correspondence_pass': False,
             'coverage_pass': False,
             'coverage_percent': 0.0,
-            'issues': []
+            'issues': [],
+            'schema_issues': {}
         }
 
         brick_path = Path(brick_dir)
@@ -425,66 +717,132 @@ class SchemaValidator:
 
         # Find all schemas
         if schemas_dir.exists():
-            schema_files = list(schemas_dir.glob('**/*.yaml'))
+            # os.walk visits directories in the same top-down order as glob('**')
+            schema_files = [
+                Path(root) / name
+                for root, _dirs, files in os.walk(schemas_dir)
+                for name in files
+                if name.endswith(('.yaml', '.yml'))
+            ]
             result['schemas_found'] = len(schema_files)
 
             # Validate each schema
             for schema_file in schema_files:
-                validation = self.validate_schema(str(schema_file))
+                if verbose:
+                    validation = self.validate_schema(str(schema_file))
+                else:
+                    validation = self._validate_schema_core(str(schema_file))
                 if validation['status'] == 'pass':
                     result['schemas_valid'] += 1
                 else:
                     result['status'] = 'fail'
                     result['issues'].append(f"Schema validation failed: {schema_file}")
+                    result['schema_issues'][str(schema_file)] = (
+                        validation['issues'] if 'issues' in validation else [validation['error']]
+                    )
+
+        # Correspondence and coverage share one walk and one read per source file
+        self._brick_scans = {}
+        try:
+            correspondence = self.check_correspondence(str(brick_path))
+            coverage = self.measure_coverage(str(brick_path))
+        finally:
+            self._brick_scans = None
 
         # Check correspondence
-        correspondence = self.check_correspondence(str(brick_path))
         result['correspondence_pass'] = (correspondence['status'] == 'pass')
         if not result['correspondence_pass']:
             result['status'] = 'fail'
             result['issues'].append("Schema-artifact correspondence check failed")
 
         # Measure coverage
-        coverage = self.measure_coverage(str(brick_path))
         result['coverage_percent'] = coverage['coverage_percent']
         result['coverage_pass'] = (coverage['status'] == 'pass')
         if not result['coverage_pass']:
             result['status'] = 'fail'
             result['issues'].append(f"Schema coverage below target: {coverage['coverage_percent']:.1f}% < {coverage['target_percent']:.1f}%")
 
-        # Print summary
-        print("\n" + "=" * 60)
-        print("BRICK SCHEMA COMPLIANCE SUMMARY")
-        print("=" * 60)
-        print(f"Schemas found: {result['schemas_found']}")
-        print(f"Schemas valid: {result['schemas_valid']}")
-        print(f"Correspondence check: {'✅ PASS' if result['correspondence_pass'] else '❌ FAIL'}")
-        print(f"Coverage check: {'✅ PASS' if result['coverage_pass'] else '❌ FAIL'} ({result['coverage_percent']:.1f}%)")
-        print(f"\nOverall Status: {result['status'].upper()}")
+        # Print summary as one write
+        report = [
+            "\n" + "=" * 60,
+            "BRICK SCHEMA COMPLIANCE SUMMARY",
+            "=" * 60,
+            f"Schemas found: {result['schemas_found']}",
+            f"Schemas valid: {result['schemas_valid']}",
+            f"Correspondence check: {'✅ PASS' if result['correspondence_pass'] else '❌ FAIL'}",
+            f"Coverage check: {'✅ PASS' if result['coverage_pass'] else '❌ FAIL'} ({result['coverage_percent']:.1f}%)",
+            f"\nOverall Status: {result['status'].upper()}",
+        ]
+
+        if result['schema_issues'] and not verbose:
+            report.append("\nSchema issues:")
+            for schema_file, issues in result['schema_issues'].items():
+                report.append(f"  {schema_file}")
+                report.extend(f"    ❌ {issue}" for issue in issues)
 
         if result['issues']:
-            print(f"\nIssues:")
-            for issue in result['issues']:
-                print(f"  ❌ {issue}")
+            report.append("\nIssues:")
+            report.extend(f"  ❌ {issue}" for issue in result['issues'])
 
-        print("=" * 60 + "\n")
+        report.append("=" * 60 + "\n")
+        print("\n".join(report))
 
         return result
 
     # Helper methods
 
+    def _load_schema(self, schema_file: Path) -> Any:
+        """Parse a schema file, reusing the previous parse while the file is unchanged.
+
+        The parsed document is shared between callers and must not be mutated.
+        """
+        stat = schema_file.stat()
+        key = schema_file.resolve()
+        cached = self._yaml_cache.get(key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        with open(schema_file, 'r') as f:
+            schema = yaml.load(f, Loader=SafeLoader)
+        self._yaml_cache[key] = (stat.st_mtime_ns, stat.st_size, schema)
+        return schema
+
+    def _schema_level_checks(
+        self, schema_file: Path, schema: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Return the metadata and versioning checks, memoized per version of the file.
+
+        Keyed on the file's resolved path, mtime and size, so an edited
+        schema is always re-checked.
+        """
+        stat = schema_file.stat()
+        key = (schema_file.resolve(), stat.st_mtime_ns, stat.st_size)
+        cached = self._schema_checks.get(key)
+        if cached is None:
+            cached = self._schema_checks[key] = (
+                self._check_schema_metadata(schema),
+                self._check_schema_versioning(schema),
+            )
+        return cached
+
     def _check_schema_metadata(self, schema: Dict[str, Any]) -> Dict[str, Any]:
         """Check schema metadata completeness."""
-        required_fields = ['name', 'version', 'type', 'created_at']
         metadata = schema.get('schema', {})
 
-        issues = []
-        for field in required_fields:
-            if field not in metadata:
-                issues.append(f"Missing metadata field: {field}")
+        # Complete metadata is the common case: one C-level subset test
+        if isinstance(metadata, dict) and metadata.keys() >= _REQUIRED_METADATA_SET:
+            return _PASSED_CHECK
+
+        issues = [
+            f"Missing metadata field: {field}"
+            for field in REQUIRED_METADATA_FIELDS
+            if field not in metadata
+        ]
 
+        if not issues:
+            return _PASSED_CHECK
         return {
-            'passed': len(issues) == 0,
+            'passed': False,
             'issues': issues
         }
 
@@ -509,8 +867,10 @@ class SchemaValidator:
                 elif not isinstance(field_def, str):
                     issues.append(f"Field '{entity_name}.{field_name}' has invalid definition")
 
+        if not issues:
+            return _PASSED_CHECK
         return {
-            'passed': len(issues) == 0,
+            'passed': False,
             'issues': issues
         }
 
@@ -546,31 +906,36 @@ class SchemaValidator:
                 if 'name' not in state:
                     issues.append("State missing name")
 
+        if not issues:
+            return _PASSED_CHECK
         return {
-            'passed': len(issues) == 0,
+            'passed': False,
             'issues': issues
         }
 
     def _check_integration_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
         """Check integration schema completeness."""
-        issues = []
+        # Only OpenAPI schemas have anything to check
+        if 'openapi' not in schema:
+            return _PASSED_CHECK
 
-        # Check if OpenAPI schema
-        if 'openapi' in schema:
-            paths = schema.get('paths', {})
-            if not paths:
-                issues.append("OpenAPI schema has no paths defined")
+        issues = []
+        paths = schema.get('paths', {})
+        if not paths:
+            issues.append("OpenAPI schema has no paths defined")
 
-            for path, methods in paths.items():
-                for method, operation in methods.items():
-                    if method.startswith('x-'):
-                        continue  # Skip extensions
+        for path, methods in paths.items():
+            for method, operation in methods.items():
+                if method.startswith('x-'):
+                    continue  # Skip extensions
 
-                    if 'responses' not in operation:
-                        issues.append(f"{method.upper()} {path} missing responses")
+                if 'responses' not in operation:
+                    issues.append(f"{method.upper()} {path} missing responses")
 
+        if not issues:
+            return _PASSED_CHECK
         return {
-            'passed': len(issues) == 0,
+            'passed': False,
             'issues': issues
         }
 
@@ -583,11 +948,13 @@ class SchemaValidator:
             issues.append("Schema missing version")
         else:
             # Check semantic versioning format
-            if not re.match(r'^\d+\.\d+\.\d+$', version):
+            if not SEMVER_RE.match(version):
                 issues.append(f"Invalid version format: {version} (expected: X.Y.Z)")
 
+        if not issues:
+            return _PASSED_CHECK
         return {
-            'passed': len(issues) == 0,
+            'passed': False,
             'issues': issues
         }
 
@@ -611,9 +978,7 @@ class SchemaValidator:
     def _all_constraints_explicit(self, schema: Dict[str, Any], schema_type: str) -> bool:
         """Check if constraints are explicit."""
         # Simplified check - look for constraint keywords
-        schema_str = yaml.dump(schema)
-        constraint_keywords = ['nullable', 'required', 'unique', 'max_length', 'min_length', 'pattern', 'format']
-        return any(keyword in schema_str for keyword in constraint_keywords)
+        return _mentions_any(schema, CONSTRAINT_KEYWORDS)
 
     def _all_relationships_defined(self, schema: Dict[str, Any], schema_type: str) -> bool:
         """Check if relationships are defined."""
@@ -621,51 +986,65 @@ class SchemaValidator:
             return True  # Only applies to structural schemas
 
         # Look for references keyword
-        schema_str = yaml.dump(schema)
-        return 'references' in schema_str or 'relationships' not in schema_str
+        return _mentions_any(schema, ('references',)) or not _mentions_any(schema, ('relationships',))
 
     def _find_generated_files(self, brick_path: Path) -> List[Path]:
         """Find all generated files in brick."""
-        generated_files = []
-        exclude_dirs = {'.git', 'node_modules', '.brick', 'LogBook', 'PLANNING'}
-
-        for ext in ['.py', '.ts', '.js', '.sql']:
-            for file_path in brick_path.rglob(f'*{ext}'):
-                # Skip excluded directories
-                if any(part in exclude_dirs for part in file_path.parts):
-                    continue
-                generated_files.append(file_path)
+        # Keep the established report order: grouped by extension, walk order within
+        by_extension: Dict[str, List[Path]] = {ext: [] for ext in GENERATED_FILE_EXTENSIONS}
+        for path in _walk_generated_files(str(brick_path)):
+            by_extension[path[path.rfind('.'):]].append(Path(path))
 
+        generated_files = []
+        for files in by_extension.values():
+            generated_files.extend(files)
         return generated_files
 
     def _find_source_files(self, brick_path: Path) -> List[Path]:
         """Find all source files for coverage measurement."""
         return self._find_generated_files(brick_path)
 
+    def _scan_brick(self, brick_path: Path) -> List[Tuple[Path, int, Optional[str], Optional[str]]]:
+        """Walk a brick once and scan every source file.
+
+        Returns:
+            List of (file path, non-blank lines, schema source, exception marker)
+        """
+        source_files = self._find_source_files(brick_path)
+        return [
+            (file_path,) + scanned
+            for file_path, scanned in zip(source_files, self._map_files(self._scan_file, source_files))
+        ]
+
+    def _cached_brick_scan(
+        self, brick_path: Path
+    ) -> Optional[List[Tuple[Path, int, Optional[str], Optional[str]]]]:
+        """Return the brick's shared scan while verify_brick is running, otherwise None."""
+        if self._brick_scans is None:
+            return None
+        key = brick_path.resolve()
+        scan = self._brick_scans.get(key)
+        if scan is None:
+            scan = self._brick_scans[key] = self._scan_brick(brick_path)
+        return scan
+
     def _extract_schema_source(self, file_path: Path) -> Optional[str]:
         """Extract schema source from file provenance header."""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read(1000)  # Read first 1000 chars
-                match = re.search(r'@saf:schema-source=([^\s\n]+)', content)
+            with open(file_path, 'rb') as f:
+                head = f.read(HEADER_CHARS)
+            if head.isascii() and b'\r' not in head:
+                # Plain ASCII header: bytes are characters, no decode needed
+                match = SCHEMA_SOURCE_BYTES_RE.search(head)
                 if match:
-                    return match.group(1).split('@')[0]  # Remove version
-        except FileNotFoundError:
-            print(f"Warning: File not found: {file_path}", file=sys.stderr)
-        except PermissionError:
-            print(f"Warning: Permission denied: {file_path}", file=sys.stderr)
-        except (UnicodeDecodeError, OSError) as e:
-            print(f"Warning: Cannot read {file_path}: {e}", file=sys.stderr)
-        return None
+                    return match.group(1).decode('ascii').split('@')[0]  # Remove version
+                return None
 
-    def _extract_exception_marker(self, file_path: Path) -> Optional[str]:
-        """Extract exception marker from file."""
-        try:
+            # Non-ASCII or CRLF header: read the first characters as text mode would
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read(1000)
-                match = re.search(r'@saf:exception=([^\s\n]+)', content)
+                match = SCHEMA_SOURCE_RE.search(f.read(HEADER_CHARS))
                 if match:
-                    return match.group(1)
+                    return match.group(1).split('@')[0]  # Remove version
         except FileNotFoundError:
             print(f"Warning: File not found: {file_path}", file=sys.stderr)
         except PermissionError:
@@ -674,270 +1053,326 @@ class SchemaValidator:
             print(f"Warning: Cannot read {file_path}: {e}", file=sys.stderr)
         return None
 
-    def _count_file_lines(self, file_path: Path) -> int:
-        """Count non-blank lines in file."""
+    def _map_files(self, func: Callable[[Path], Any], files: List[Path]) -> List[Any]:
+        """Apply func to every file, in order, using threads once the tree is large enough."""
+        if len(files) < PARALLEL_SCAN_MIN_FILES:
+            return [func(file_path) for file_path in files]
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+            return list(executor.map(func, files))
+
+    def _scan_file(self, file_path: Path) -> Tuple[int, Optional[str], Optional[str]]:
+        """Count non-blank lines and extract provenance markers with one read.
+
+        Returns:
+            Tuple of (non-blank lines, schema source without version, exception marker)
+        """
         try:
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                return sum(1 for line in f if line.strip())
+                content = f.read()
         except FileNotFoundError:
             print(f"Warning: File not found: {file_path}", file=sys.stderr)
-            return 0
+            return 0, None, None
         except PermissionError:
             print(f"Warning: Permission denied: {file_path}", file=sys.stderr)
-            return 0
+            return 0, None, None
         except (UnicodeDecodeError, OSError) as e:
             print(f"Warning: Cannot read {file_path}: {e}", file=sys.stderr)
-            return 0
+            return 0, None, None
+
+        nonblank = _count_nonblank_lines(content)
+
+        # Markers only count within the provenance header; most files carry
+        # none, and a substring test rules that out before either regex runs
+        header = content[:HEADER_CHARS]
+        if '@saf:' not in header:
+            return nonblank, None, None
+        schema_match = SCHEMA_SOURCE_RE.search(header)
+        exception_match = EXCEPTION_MARKER_RE.search(header)
+
+        return (
+            nonblank,
+            schema_match.group(1).split('@')[0] if schema_match else None,  # Remove version
+            exception_match.group(1) if exception_match else None,
+        )
 
     def _detect_circular_dependencies(self, schema_file: Path, visited: Set[Path]) -> List[List[str]]:
         """Detect circular dependencies in schema using DFS.
 
+        Iterative DFS with one shared visited set, so each schema is loaded and
+        expanded once; a dependency that is still on the DFS stack closes a cycle.
+        Schemas on the stack map to their position in the path, so the cycle is
+        sliced out without searching the path.
+
         Args:
             schema_file: The schema file to check for circular dependencies
-            visited: Set of already visited paths in current DFS traversal
+            visited: Schemas already explored (shared across the whole traversal)
 
         Returns:
             List of cycles found, where each cycle is a list of file paths
         """
         cycles = []
+        path: List[str] = [str(schema_file)]
+        # Schema on the DFS stack -> its index in path
+        on_stack: Dict[Path, int] = {schema_file: 0}
+        visited.add(schema_file)
+        stack = [(schema_file, iter(self._schema_dependency_files(schema_file)))]
+
+        while stack:
+            current, dependencies = stack[-1]
+            for dep_file in dependencies:
+                start = on_stack.get(dep_file)
+                if start is not None:
+                    # Found a cycle - extract the cycle from path
+                    cycles.append(path[start:] + [str(dep_file)])
+                elif dep_file not in visited:
+                    visited.add(dep_file)
+                    on_stack[dep_file] = len(path)
+                    path.append(str(dep_file))
+                    stack.append((dep_file, iter(self._schema_dependency_files(dep_file))))
+                    break
+            else:
+                # All dependencies explored - leave the current DFS path
+                stack.pop()
+                del on_stack[current]
+                path.pop()
 
-        def dfs(current: Path, path: List[str], seen: Set[Path]):
-            """Depth-first search to detect cycles."""
-            if current in seen:
-                # Found a cycle - extract the cycle from path
-                current_str = str(current)
-                if current_str in path:
-                    cycle_start = path.index(current_str)
-                    cycles.append(path[cycle_start:] + [current_str])
-                return
+        return cycles
 
-            seen.add(current)
-            path.append(str(current))
+    def _schema_dependency_files(self, schema_file: Path) -> List[Path]:
+        """Resolve a schema's depends_on entries to existing schema files."""
+        dependency_files = []
 
-            # Load schema and check depends_on field
-            try:
-                with open(current, 'r') as f:
-                    schema = yaml.safe_load(f)
-
-                if schema is None:
-                    return
-
-                # Check for depends_on in schema metadata
-                depends_on = []
-                if isinstance(schema, dict):
-                    depends_on = schema.get('depends_on', [])
-                    if not depends_on:
-                        depends_on = schema.get('schema', {}).get('depends_on', [])
-
-                for dep in depends_on:
-                    if isinstance(dep, str):
-                        # Handle format: "brick_id@version" or just "brick_id"
-                        dep_name = dep.split('@')[0] if '@' in dep else dep
-                        dep_path = self.brick_dir / dep_name if self.brick_dir else Path(dep_name)
-
-                        # Try common schema file extensions
-                        for ext in ['.yaml', '.yml', '.json', '']:
-                            candidate = Path(str(dep_path) + ext)
-                            if candidate.exists():
-                                dfs(candidate, path.copy(), seen.copy())
-                                break
-            except (yaml.YAMLError, FileNotFoundError, PermissionError):
-                pass
-
-        dfs(schema_file, [], set())
-        return cycles
+        # Load schema and check depends_on field
+        try:
+            schema = self._load_schema(schema_file)
+        except (yaml.YAMLError, FileNotFoundError, PermissionError):
+            return dependency_files
+
+        # Check for depends_on at the top level, then in schema metadata
+        if not isinstance(schema, dict):
+            return dependency_files
+        depends_on = schema.get('depends_on')
+        if not depends_on:
+            schema_meta = schema.get('schema')
+            depends_on = (schema_meta.get('depends_on') if isinstance(schema_meta, dict) else None) or ()
+
+        brick_dir = self.brick_dir
+        for dep in depends_on:
+            if isinstance(dep, str):
+                # Handle format: "brick_id@version" or just "brick_id"
+                dep_name = dep.partition('@')[0]
+                dep_path = brick_dir / dep_name if brick_dir else Path(dep_name)
+
+                # Try common schema file extensions
+                for ext in ['.yaml', '.yml', '.json', '']:
+                    candidate = Path(str(dep_path) + ext)
+                    if candidate.exists():
+                        dependency_files.append(candidate)
+                        break
+
+        return dependency_files
 
     def _print_validation_results(self, result: Dict[str, Any]):
-        """Print validation results."""
-        print("Schema Validation Report")
-        print("=" * 60)
-        print(f"Schema: {result['schema_path']}")
+        """Print validation results as a single write."""
+        report = [
+            "Schema Validation Report",
+            "=" * 60,
+            f"Schema: {result['schema_path']}",
+        ]
         if 'schema_type' in result:
-            print(f"Type: {result['schema_type']}")
+            report.append(f"Type: {result['schema_type']}")
 
-        print(f"\nChecks:")
+        report.append("\nChecks:")
         for check_name, check_result in result['checks'].items():
             status = "✅ PASS" if check_result.get('passed', False) else "❌ FAIL"
-            print(f"  {status} {check_name}")
+            report.append(f"  {status} {check_name}")
 
-        print(f"\nStatus: {result['status'].upper()}")
+        report.append(f"\nStatus: {result['status'].upper()}")
 
         if result['issues']:
-            print(f"\nIssues:")
-            for issue in result['issues']:
-                print(f"  ❌ {issue}")
+            report.append("\nIssues:")
+            report.extend(f"  ❌ {issue}" for issue in result['issues'])
 
         if result['warnings']:
-            print(f"\nWarnings:")
-            for warning in result['warnings']:
-                print(f"  ⚠️  {warning}")
-
-        print()
-
-def main():
-    """Run schema validator based on command-line arguments."""
-    validator = SchemaValidator()
-
-    def get_validated_path(idx: int, default: str = '.') -> str:
-        """Get and validate path argument."""
-        raw_path = sys.argv[idx + 1] if idx + 1 < len(sys.argv) else default
-        try:
-            validated = validate_path(raw_path)
-            return str(validated)
-        except ValueError as e:
-            print(f"Error: {e}", file=sys.stderr)
-            sys.exit(1)
-
-    if '--validate' in sys.argv:
-        idx = sys.argv.index('--validate')
-        if idx + 1 < len(sys.argv):
-            schema_path = get_validated_path(idx)
-            result = validator.validate_schema(schema_path)
-            sys.exit(0 if result['status'] == 'pass' else 1)
-
-    elif '--check-correspondence' in sys.argv:
-        idx = sys.argv.index('--check-correspondence')
-        brick_dir = get_validated_path(idx, '.')
-        result = validator.check_correspondence(brick_dir)
-        sys.exit(0 if result['status'] == 'pass' else 1)
-
-    elif '--measure-coverage' in sys.argv:
-        idx = sys.argv.index('--measure-coverage')
-        brick_dir = get_validated_path(idx, '.')
-        # Check for --target option
-        target = 95.0
-        if '--target' in sys.argv:
-            try:
-                target_idx = sys.argv.index('--target')
-                target = float(sys.argv[target_idx + 1])
-                if target < 0 or target > 100:
-                    print("Error: --target must be between 0 and 100", file=sys.stderr)
-                    sys.exit(1)
-            except (IndexError, ValueError):
-                print("Error: --target requires a numeric value (e.g., --target 80.0)", file=sys.stderr)
-                sys.exit(1)
-        result = validator.measure_coverage(brick_dir, target)
-        sys.exit(0 if result['status'] == 'pass' else 1)
-
-    elif '--score-completeness' in sys.argv:
-        idx = sys.argv.index('--score-completeness')
-        if idx + 1 < len(sys.argv):
-            schema_path = get_validated_path(idx)
-            result = validator.score_completeness(schema_path)
-            sys.exit(0 if result['status'] == 'pass' else 1)
-
-    elif '--check-dependencies' in sys.argv:
-        idx = sys.argv.index('--check-dependencies')
-        if idx + 1 < len(sys.argv):
-            schema_path = get_validated_path(idx)
-            result = validator.check_dependencies(schema_path)
-            sys.exit(0 if result['status'] == 'pass' else 1)
-
-    elif '--verify-brick' in sys.argv:
-        idx = sys.argv.index('--verify-brick')
-        brick_dir = get_validated_path(idx, '.')
-        result = validator.verify_brick(brick_dir)
-        sys.exit(0 if result['status'] == 'pass' else 1)
-
-    elif '--file' in sys.argv and '--schema' in sys.argv:
-        # Validate a file against a JSON/YAML schema
-        file_idx = sys.argv.index('--file')
-        schema_idx = sys.argv.index('--schema')
-        file_path = get_validated_path(file_idx)
-        schema_path = get_validated_path(schema_idx)
-
-        try:
-            from jsonschema import Draft7Validator
-        except ImportError:
-            print("Warning: jsonschema not installed, skipping validation")
-            sys.exit(0)
-
-        # Load schema
-        try:
-            with open(schema_path, 'r') as f:
-                if schema_path.endswith('.json'):
-                    schema = json.load(f)
-                else:
-                    schema = yaml.safe_load(f)
-        except Exception as e:
-            print(f"Error loading schema {schema_path}: {e}")
-            sys.exit(1)
+            report.append("\nWarnings:")
+            report.extend(f"  ⚠️  {warning}" for warning in result['warnings'])
+
+        report.append("")
+        print("\n".join(report))
+
+def _validated_path(raw_path: str) -> str:
+    """Validate a path argument, exiting with an error if it is unsafe."""
+    try:
+        validated = validate_path(raw_path)
+        return str(validated)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
+def _exit_code(result: Dict[str, Any]) -> int:
+    return 0 if result['status'] == 'pass' else 1
+
+def _cmd_validate(validator: SchemaValidator, args: argparse.Namespace) -> int:
+    return _exit_code(validator.validate_schema(_validated_path(args.validate)))
+
+def _cmd_check_correspondence(validator: SchemaValidator, args: argparse.Namespace) -> int:
+    return _exit_code(validator.check_correspondence(_validated_path(args.check_correspondence)))
+
+def _cmd_measure_coverage(validator: SchemaValidator, args: argparse.Namespace) -> int:
+    brick_dir = _validated_path(args.measure_coverage)
+    # Check --target option
+    try:
+        target = float(args.target)
+    except ValueError:
+        print("Error: --target requires a numeric value (e.g., --target 80.0)", file=sys.stderr)
+        return 1
+    if target < 0 or target > 100:
+        print("Error: --target must be between 0 and 100", file=sys.stderr)
+        return 1
+    return _exit_code(validator.measure_coverage(brick_dir, target))
+
+def _cmd_score_completeness(validator: SchemaValidator, args: argparse.Namespace) -> int:
+    return _exit_code(validator.score_completeness(_validated_path(args.score_completeness)))
+
+def _cmd_check_dependencies(validator: SchemaValidator, args: argparse.Namespace) -> int:
+    return _exit_code(validator.check_dependencies(_validated_path(args.check_dependencies)))
+
+def _cmd_verify_brick(validator: SchemaValidator, args: argparse.Namespace) -> int:
+    return _exit_code(validator.verify_brick(_validated_path(args.verify_brick), verbose=args.verbose))
+
+def _cmd_validate_files(validator: SchemaValidator, args: argparse.Namespace) -> int:
+    """Validate file(s) against a JSON/YAML schema."""
+    file_paths = [_validated_path(raw_path) for raw_path in args.file]
+    schema_path = _validated_path(args.schema)
+
+    # Load and compile the schema once for every file
+    try:
+        validate = _get_validator(schema_path)
+    except ImportError:
+        print("Warning: jsonschema not installed, skipping validation")
+        return 0
+    except InvalidSchemaError as e:
+        print(f"Invalid schema {schema_path}: {e}")
+        return 1
+    except Exception as e:
+        print(f"Error loading schema {schema_path}: {e}")
+        return 1
+
+    all_passed = True
+    for file_path in file_paths:
         # Load file to validate
         try:
-            with open(file_path, 'r') as f:
-                if file_path.endswith('.json'):
-                    data = json.load(f)
-                else:
-                    data = yaml.safe_load(f)
+            data = _load_document(file_path)
         except Exception as e:
             print(f"Error loading file {file_path}: {e}")
-            sys.exit(1)
+            all_passed = False
+            continue
 
         # Validate
-        v = Draft7Validator(schema)
-        errors = list(v.iter_errors(data))
+        errors = validate(data)
         if errors:
             print(f"Validation failed for {file_path}:")
-            for err in errors[:5]:
-                print(f"  - {err.message} at {list(err.path)}")
-            sys.exit(1)
+            for message, path in errors[:5]:
+                print(f"  - {message} at {path}")
+            all_passed = False
         else:
             print(f"✓ {file_path} valid against {schema_path}")
-            sys.exit(0)
-
-    elif '--dir' in sys.argv:
-        # Batch validate schemas in directory
-        dir_idx = sys.argv.index('--dir')
-        dir_path = get_validated_path(dir_idx, '.')
-        file_format = 'yaml'
-        if '--format' in sys.argv:
-            fmt_idx = sys.argv.index('--format')
-            if fmt_idx + 1 < len(sys.argv):
-                file_format = sys.argv[fmt_idx + 1]
-
-        # Find and validate all schema files
-        schema_dir = Path(dir_path)
-        ext_map = {'yaml': ['.yaml', '.yml'], 'json': ['.json']}
-        extensions = ext_map.get(file_format, ['.yaml', '.yml'])
-
-        schema_files = []
-        for ext in extensions:
-            schema_files.extend(schema_dir.glob(f'*{ext}'))
-
-        if not schema_files:
-            print(f"No {file_format} files found in {dir_path}")
-            sys.exit(0)
-
-        all_passed = True
+
+    return 0 if all_passed else 1
+
+def _cmd_validate_dir(validator: SchemaValidator, args: argparse.Namespace) -> int:
+    """Batch validate schemas in a directory."""
+    dir_path = _validated_path(args.dir)
+    file_format = args.format
+
+    # Find and validate all schema files
+    schema_dir = Path(dir_path)
+    ext_map = {'yaml': ['.yaml', '.yml'], 'json': ['.json']}
+    extensions = ext_map.get(file_format, ['.yaml', '.yml'])
+
+    schema_files = []
+    for ext in extensions:
+        schema_files.extend(schema_dir.glob(f'*{ext}'))
+
+    if not schema_files:
+        print(f"No {file_format} files found in {dir_path}")
+        return 0
+
+    all_passed = True
+    validator.load_verdict_cache()
+    try:
         for schema_file in sorted(schema_files):
             result = validator.validate_schema(str(schema_file))
             if result['status'] != 'pass':
                 all_passed = False
+    finally:
+        validator.save_verdict_cache()
+
+    return 0 if all_passed else 1
+
+# Command dispatch, in precedence order: the first entry whose options were
+# all given on the command line runs
+COMMANDS: Tuple[Tuple[Tuple[str, ...], Callable[[SchemaValidator, argparse.Namespace], int]], ...] = (
+    (('validate',), _cmd_validate),
+    (('check_correspondence',), _cmd_check_correspondence),
+    (('measure_coverage',), _cmd_measure_coverage),
+    (('score_completeness',), _cmd_score_completeness),
+    (('check_dependencies',), _cmd_check_dependencies),
+    (('verify_brick',), _cmd_verify_brick),
+    (('file', 'schema'), _cmd_validate_files),
+    (('dir',), _cmd_validate_dir),
+)
 
-        sys.exit(0 if all_passed else 1)
-
-    else:
-        print("SAF Schema Validator")
-        print("\nUsage:")
-        print("  --validate <schema>          Validate schema completeness")
-        print("  --check-correspondence <dir> Check schema-artifact correspondence")
-        print("  --measure-coverage <dir>     Measure schema coverage")
-        print("  --score-completeness <schema> Score schema completeness")
-        print("  --check-dependencies <schema> Check schema dependencies")
-        print("  --verify-brick <dir>         Verify entire brick compliance")
-        print("  --file <file> --schema <schema>  Validate file against JSON/YAML schema")
-        print("  --dir <dir> [--format yaml|json]  Batch validate schemas in directory")
-        print("\nOptions:")
-        print("  --target <percent>           Coverage target (default: 95.0)")
-        print("  --format <type>              File format for --dir (yaml or json)")
-        print("\nExamples:")
-        print("  python tools/schema_validator.py --validate schemas/user.schema.yaml")
-        print("  python tools/schema_validator.py --verify-brick .")
-        print("  python tools/schema_validator.py --measure-coverage . --target 80.0")
-        print("  python tools/schema_validator.py --file brick.yaml --schema brick_schema.yaml")
-        print("  python tools/schema_validator.py --dir PLANNING/schemas/ --format yaml")
-        sys.exit(1)
+def main():
+    """Run schema validator based on command-line arguments."""
+    parser = argparse.ArgumentParser(description='SAF Schema Validator')
+    parser.add_argument('--validate', metavar='SCHEMA', help='Validate schema completeness')
+    parser.add_argument('--check-correspondence', nargs='?', const='.', metavar='DIR',
+                        help='Check schema-artifact correspondence')
+    parser.add_argument('--measure-coverage', nargs='?', const='.', metavar='DIR',
+                        help='Measure schema coverage')
+    parser.add_argument('--score-completeness', metavar='SCHEMA', help='Score schema completeness')
+    parser.add_argument('--check-dependencies', metavar='SCHEMA', help='Check schema dependencies')
+    parser.add_argument('--verify-brick', nargs='?', const='.', metavar='DIR',
+                        help='Verify entire brick compliance')
+    parser.add_argument('--file', nargs='+', help='File(s) to validate against --schema')
+    parser.add_argument('--schema', help='JSON/YAML schema for --file')
+    parser.add_argument('--dir', nargs='?', const='.', metavar='DIR',
+                        help='Batch validate schemas in directory')
+    parser.add_argument('--target', default='95.0',
+                        help='Coverage target (default: 95.0)')
+    parser.add_argument('--format', default='yaml', help='File format for --dir (yaml or json)')
+    parser.add_argument('--verbose', action='store_true',
+                        help='With --verify-brick, print every schema\'s full validation report')
+    args = parser.parse_args()
+
+    for options, command in COMMANDS:
+        if all(getattr(args, option) is not None for option in options):
+            sys.exit(command(SchemaValidator(), args))
+
+    print("SAF Schema Validator")
+    print("\nUsage:")
+    print("  --validate <schema>          Validate schema completeness")
+    print("  --check-correspondence <dir> Check schema-artifact correspondence")
+    print("  --measure-coverage <dir>     Measure schema coverage")
+    print("  --score-completeness <schema> Score schema completeness")
+    print("  --check-dependencies <schema> Check schema dependencies")
+    print("  --verify-brick <dir>         Verify entire brick compliance")
+    print("  --file <file>... --schema <schema>  Validate file(s) against JSON/YAML schema")
+    print("  --dir <dir> [--format yaml|json]  Batch validate schemas in directory")
+    print("\nOptions:")
+    print("  --target <percent>           Coverage target (default: 95.0)")
+    print("  --verbose                    Full per-schema reports for --verify-brick")
+    print("  --format <type>              File format for --dir (yaml or json)")
+    print("\nExamples:")
+    print("  python tools/schema_validator.py --validate schemas/user.schema.yaml")
+    print("  python tools/schema_validator.py --verify-brick .")
+    print("  python tools/schema_validator.py --measure-coverage . --target 80.0")
+    print("  python tools/schema_validator.py --file brick.yaml --schema brick_schema.yaml")
+    print("  python tools/schema_validator.py --dir PLANNING/schemas/ --format yaml")
+    sys.exit(1)
 
 if __name__ == '__main__':
     main()
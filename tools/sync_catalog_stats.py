@@ -16,10 +16,15 @@ Can be integrated into:
 - Manual maintenance
 """
 
+import hashlib
+import io
+import itertools
+import json
 import os
 import re
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -27,13 +32,198 @@ from pathlib import Path
 CATALOG_PATH = "SAF_ISSUE_CATALOG.md"
 ISSUES_DIR = "issues"
 LANES = ['A', 'E', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z']
+# Lane scans are I/O-bound and independent, so lanes are read from a thread pool
+SCAN_WORKERS = min(32, len(LANES))
+
+# Results per version of an issue file, keyed by (path, mtime_ns, size).
+# _text_cache holds files get_file_status(keep_text=True) had to read in
+# full, until parse_issue_file consumes them, so no issue file is read twice
+# in a scan.
+_parse_cache = {}
+_status_cache = {}
+_text_cache = {}
+# File versions looked up in this run; only these are persisted
+_seen_versions = set()
+
+# Status and parse results persisted between runs, so unchanged issue files
+# are never opened; dropped whenever this file's source changes
+SCAN_CACHE_PATH = os.path.join('.cache', 'issue_stats.json')
+
+# Frontmatter fields
+ISSUE_ID_RE = re.compile(r'^issue_id:\s*["\']?([^"\']+)["\']?', re.MULTILINE)
+LANE_RE = re.compile(r'^lane:\s*["\']?([^"\']+)["\']?', re.MULTILINE)
+SEVERITY_RE = re.compile(r'^severity:\s*(\d+)', re.MULTILINE)
+SEVERITY_LEVEL_RE = re.compile(r'^severity_level:\s*["\']?(HIGH|MEDIUM|LOW|CRITICAL|TRIVIAL)["\']?', re.MULTILINE)
+TYPE_TAGS_RE = re.compile(r'^type_tags:\s*\[([^\]]+)\]', re.MULTILINE)
+STATUS_RE = re.compile(r'^status:\s*["\']?(OPEN|RESOLVED)["\']?', re.MULTILINE)
+
+# Status lines anywhere in an issue file, in order of precedence
+YAML_RESOLVED_RE = re.compile(r'^status:\s*["\']?RESOLVED["\']?', re.MULTILINE)
+YAML_OPEN_RE = re.compile(r'^status:\s*["\']?OPEN["\']?', re.MULTILINE)
+MD_RESOLVED_RE = re.compile(r'-\s*Status:\s*RESOLVED', re.IGNORECASE)
+MD_OPEN_RE = re.compile(r'-\s*Status:\s*OPEN', re.IGNORECASE)
+# Every RESOLUTION_RES pattern contains this, so a miss rules them all out
+RESOLUTION_HINT_RE = re.compile(r'resol', re.IGNORECASE)
+RESOLUTION_RES = [
+    re.compile(r'\*Resolved:', re.IGNORECASE),
+    re.compile(r'Resolution applied', re.IGNORECASE),
+    re.compile(r'Issue resolved', re.IGNORECASE),
+    re.compile(r'\*\*Resolution Status:\*\*\s*RESOLVED', re.IGNORECASE),
+]
+
+# Catalog sections rewritten by update_catalog / read by check_sync
+LAST_UPDATED_RE = re.compile(r'>\s*\*\*Last Updated:\*\*\s*\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}')
+HEADER_STATS_RE = re.compile(r'\|\s*\d+\s*\|\s*\d+\s*\|\s*\d+\s*\|\s*\[█*░*\]\s*[\d.]+%\s*\|')
+LANE_TABLE_RE = re.compile(r'\| Lane \| Total \| Resolved \| Open \| % \|[\s\S]*?\| Z \| \d+ \| \d+ \| \d+ \| [^\n]+ \|')
+HEADER_TOTALS_RE = re.compile(r'\|\s*(\d+)\s*\|\s*(\d+)\s*\|\s*(\d+)\s*\|')
+LANE_ROW_RES = {lane: re.compile(rf'\| {lane} \| (\d+) \| (\d+) \| (\d+) \|') for lane in LANES}
+# Heading + table header of a lane's Open Issues table (group 1 is the lane);
+# the table's rows run up to the lane's <!-- LANE_X_ISSUES --> end marker
+LANE_HEADER_RE = re.compile(
+    rf'### Lane ([{"".join(LANES)}]) - [^\n]+\n\| ID \| Title \| Severity \| Type Tags \| Status \|\n\|[-|]+\|'
+)
+
+# Issue titles: the canonical "# [LANE X] Issue X-N: ..." heading, else the first heading
+LANE_TITLE_RE = re.compile(r'^#\s*\[LANE [A-Z]\]\s*Issue\s+[A-Z]-\d+:\s*(.+)$', re.MULTILINE)
+HEADING_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+# A heading line ending inside one of those patterns' \s runs, which a match
+# could carry over onto the following line
+OPEN_HEADING_RE = re.compile(r'#\s*(?:\[LANE [A-Z]\]\s*(?:Issue(?:\s+[A-Z]-\d+:)?\s*)?)?')
+
+
+def read_frontmatter(f) -> tuple:
+    """Read an issue file up to the end of its YAML frontmatter.
+
+    f is an open file or any other iterator over the file's lines. Returns
+    (lines, frontmatter): the lines read so far, and the text between the
+    opening '---' and the next '---' (None if the file has no complete
+    frontmatter). The rest of the file is left unread in f.
+    """
+    first = next(f, '')
+    lines = [first]
+    if not first.startswith('---'):
+        return lines, None
+
+    head = first
+    end = head.find('---', 3)
+    while end == -1:
+        line = next(f, '')
+        if not line:
+            return lines, None
+        lines.append(line)
+        # A closing '---' may straddle the previous line's end
+        start = max(3, len(head) - 2)
+        head += line
+        end = head.find('---', start)
+
+    return lines, head[3:end]
+
+
+def read_title(lines) -> str:
+    """Return the issue title, consuming lines only until it is certain.
+
+    Same result as searching the whole file for LANE_TITLE_RE, then
+    HEADING_RE: a heading starts a line with '#', so lines are matched one
+    at a time and the first canonical heading ends the read. A heading that
+    could run onto the next line falls back to searching the joined text.
+    """
+    seen = []
+    fallback = None
+
+    for line in lines:
+        seen.append(line)
+        if not line.startswith('#'):
+            continue
+
+        if OPEN_HEADING_RE.fullmatch(line.rstrip('\n')):
+            content = ''.join(seen) + ''.join(lines)
+            match = LANE_TITLE_RE.search(content) or HEADING_RE.search(content)
+            return match.group(1).strip() if match else None
+
+        match = LANE_TITLE_RE.match(line)
+        if match:
+            return match.group(1).strip()
+        if fallback is None:
+            match = HEADING_RE.match(line)
+            if match:
+                fallback = match.group(1).strip()
+
+    return fallback
+
+
+def file_version(filepath: str) -> tuple:
+    """Return the cache key for the current version of a file."""
+    st = os.stat(filepath)
+    key = (filepath, st.st_mtime_ns, st.st_size)
+    _seen_versions.add(key)
+    return key
+
+
+def tool_digest() -> str:
+    """Return a digest of this file's source, which versions the scan cache."""
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+
+def load_scan_cache() -> None:
+    """Seed the status and parse caches from the previous run's results."""
+    try:
+        with open(SCAN_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache['tool'] != tool_digest():
+            return
+        for filepath, mtime_ns, size, status, parsed in cache['files']:
+            key = (filepath, mtime_ns, size)
+            if status is not None:
+                _status_cache[key] = status
+            if parsed is not None:
+                _parse_cache[key] = parsed
+    except (OSError, ValueError, KeyError, TypeError):
+        # A missing or unreadable cache just means a full scan
+        return
+
+
+def save_scan_cache() -> None:
+    """Persist the results for the file versions seen in this run."""
+    files = [
+        [*key, _status_cache.get(key), _parse_cache.get(key)]
+        for key in sorted(_seen_versions)
+        if key in _status_cache or key in _parse_cache
+    ]
+    try:
+        os.makedirs(os.path.dirname(SCAN_CACHE_PATH), exist_ok=True)
+        tmp_path = SCAN_CACHE_PATH + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'tool': tool_digest(), 'files': files}, f)
+        os.replace(tmp_path, SCAN_CACHE_PATH)
+    except OSError as e:
+        print(f"Warning: Cannot write {SCAN_CACHE_PATH}: {e}")
 
 
 def parse_issue_file(filepath: str) -> dict:
-    """Parse an issue file and extract frontmatter + title."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+    """Parse an issue file and extract frontmatter + title.
+
+    Reads only the frontmatter and the lines up to the title heading, never
+    the issue body below it. Results are cached per file version and shared
+    between callers, which must not modify them.
+    """
+    key = file_version(filepath)
+    result = _parse_cache.get(key)
+    if result is None:
+        text = _text_cache.pop(key, None)
+        if text is not None:
+            result = parse_issue_lines(io.StringIO(text))
+        else:
+            # Text mode on purpose: the patterns rely on universal newlines
+            # ('\r\n' and lone '\r' read as '\n'), and a bytes/mmap scan
+            # would have to reimplement that and the decode errors
+            with open(filepath, 'r', encoding='utf-8') as f:
+                result = parse_issue_lines(f)
+        _parse_cache[key] = result
+    return result
+
 
+def parse_issue_lines(f) -> dict:
+    """Extract frontmatter fields and title from an iterator over an issue's lines."""
     result = {
         'issue_id': None,
         'lane': None,
@@ -44,64 +234,84 @@ def parse_issue_file(filepath: str) -> dict:
         'status': 'UNKNOWN',
     }
 
-    # Parse YAML frontmatter
-    if content.startswith('---'):
-        end = content.find('---', 3)
-        if end != -1:
-            frontmatter = content[3:end]
+    lines, frontmatter = read_frontmatter(f)
 
-            # Extract issue_id
-            match = re.search(r'^issue_id:\s*["\']?([^"\']+)["\']?', frontmatter, re.MULTILINE)
-            if match:
-                result['issue_id'] = match.group(1).strip()
-
-            # Extract lane
-            match = re.search(r'^lane:\s*["\']?([^"\']+)["\']?', frontmatter, re.MULTILINE)
-            if match:
-                result['lane'] = match.group(1).strip()
+    # Parse YAML frontmatter. Anchored per-field searches over the short
+    # frontmatter cost a few microseconds in total; a full YAML parse of
+    # the same block is 10-100x slower even with libyaml.
+    if frontmatter is not None:
+        # Extract issue_id
+        match = ISSUE_ID_RE.search(frontmatter)
+        if match:
+            result['issue_id'] = match.group(1).strip()
 
-            # Extract severity (numeric)
-            match = re.search(r'^severity:\s*(\d+)', frontmatter, re.MULTILINE)
-            if match:
-                result['severity'] = int(match.group(1))
+        # Extract lane
+        match = LANE_RE.search(frontmatter)
+        if match:
+            result['lane'] = match.group(1).strip()
 
-            # Extract severity_level
-            match = re.search(r'^severity_level:\s*["\']?(HIGH|MEDIUM|LOW|CRITICAL|TRIVIAL)["\']?', frontmatter, re.MULTILINE)
-            if match:
-                result['severity_level'] = match.group(1)
+        # Extract severity (numeric)
+        match = SEVERITY_RE.search(frontmatter)
+        if match:
+            result['severity'] = int(match.group(1))
 
-            # Extract type_tags
-            match = re.search(r'^type_tags:\s*\[([^\]]+)\]', frontmatter, re.MULTILINE)
-            if match:
-                tags = match.group(1)
-                result['type_tags'] = [t.strip().strip('"\'') for t in tags.split(',')]
+        # Extract severity_level
+        match = SEVERITY_LEVEL_RE.search(frontmatter)
+        if match:
+            result['severity_level'] = match.group(1)
 
-            # Extract status
-            match = re.search(r'^status:\s*["\']?(OPEN|RESOLVED)["\']?', frontmatter, re.MULTILINE)
-            if match:
-                result['status'] = match.group(1)
+        # Extract type_tags
+        match = TYPE_TAGS_RE.search(frontmatter)
+        if match:
+            tags = match.group(1)
+            result['type_tags'] = [t.strip().strip('"\'') for t in tags.split(',')]
 
-    # Extract title from heading
-    match = re.search(r'^#\s*\[LANE [A-Z]\]\s*Issue\s+[A-Z]-\d+:\s*(.+)$', content, re.MULTILINE)
-    if match:
-        result['title'] = match.group(1).strip()
-    else:
-        # Fallback to first heading
-        match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+        # Extract status
+        match = STATUS_RE.search(frontmatter)
         if match:
-            result['title'] = match.group(1).strip()
+            result['status'] = match.group(1)
+
+    # Extract title from heading (frontmatter lines included, as before)
+    result['title'] = read_title(itertools.chain(lines, f))
 
     return result
 
 
-def get_file_status(filepath: str) -> str:
-    """Extract status from an issue file (YAML frontmatter or markdown)."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+def get_file_status(filepath: str, keep_text: bool = False) -> str:
+    """Extract status from an issue file (YAML frontmatter or markdown).
 
+    Cached per file version, like parse_issue_file. Only the frontmatter is
+    read up front; the body is read only when the frontmatter is not
+    RESOLVED, since a later status line or resolution note can still decide
+    the result. With keep_text, for callers that parse the file next, text
+    read in full is left in _text_cache for parse_issue_file.
+    """
+    key = file_version(filepath)
+    status = _status_cache.get(key)
+    if status is None:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            lines, _ = read_frontmatter(f)
+            head = ''.join(lines)
+
+            # A RESOLVED status line in the frontmatter wins outright, so the
+            # body only needs reading when it is absent
+            if YAML_RESOLVED_RE.search(head):
+                status = _status_cache[key] = "RESOLVED"
+                return status
+
+            content = head + f.read()
+
+        status = _status_cache[key] = status_from_content(content)
+        if keep_text and key not in _parse_cache:
+            _text_cache[key] = content
+    return status
+
+
+def status_from_content(content: str) -> str:
+    """Determine an issue's status from the full text of its file."""
     # Check YAML frontmatter first (most reliable)
-    yaml_resolved = bool(re.search(r'^status:\s*["\']?RESOLVED["\']?', content, re.MULTILINE))
-    yaml_open = bool(re.search(r'^status:\s*["\']?OPEN["\']?', content, re.MULTILINE))
+    yaml_resolved = bool(YAML_RESOLVED_RE.search(content))
+    yaml_open = bool(YAML_OPEN_RE.search(content))
 
     if yaml_resolved:
         return "RESOLVED"
@@ -109,8 +319,8 @@ def get_file_status(filepath: str) -> str:
         return "OPEN"
 
     # Fallback to markdown status
-    md_resolved = bool(re.search(r'-\s*Status:\s*RESOLVED', content, re.IGNORECASE))
-    md_open = bool(re.search(r'-\s*Status:\s*OPEN', content, re.IGNORECASE))
+    md_resolved = bool(MD_RESOLVED_RE.search(content))
+    md_open = bool(MD_OPEN_RE.search(content))
 
     if md_resolved:
         return "RESOLVED"
@@ -118,93 +328,175 @@ def get_file_status(filepath: str) -> str:
         return "OPEN"
 
     # Check for resolution indicators as last resort
-    resolution_patterns = [
-        r'\*Resolved:',
-        r'Resolution applied',
-        r'Issue resolved',
-        r'\*\*Resolution Status:\*\*\s*RESOLVED',
-    ]
-    if any(re.search(p, content, re.IGNORECASE) for p in resolution_patterns):
+    if RESOLUTION_HINT_RE.search(content) and any(p.search(content) for p in RESOLUTION_RES):
         return "RESOLVED"
 
     return "UNKNOWN"
 
 
+def list_issue_files(lane_dir: str) -> list:
+    """List a lane's issue files as os.DirEntry objects, in directory order.
+
+    os.scandir carries each entry's type from the directory read, so
+    skipping non-files costs no extra stat() on most filesystems.
+    """
+    with os.scandir(lane_dir) as entries:
+        return [e for e in entries if e.name.endswith('.md') and e.is_file()]
+
+
+def scan_lane_stats(lane: str) -> tuple:
+    """Count one lane's issue files by status.
+
+    Returns (stats, unknown_files); stats is None if the lane has no directory.
+    """
+    lane_dir = os.path.join(ISSUES_DIR, lane)
+    if not os.path.isdir(lane_dir):
+        return None, []
+
+    files = list_issue_files(lane_dir)
+    return count_statuses(files, [get_file_status(entry.path) for entry in files])
+
+
+def count_statuses(files: list, statuses: list) -> tuple:
+    """Tally a lane's file statuses into (stats, unknown_files)."""
+    resolved = 0
+    open_count = 0
+    unknown_files = []
+
+    for entry, status in zip(files, statuses):
+        if status == "RESOLVED":
+            resolved += 1
+        elif status == "OPEN":
+            open_count += 1
+        else:
+            unknown_files.append(entry.path)
+
+    stats = {
+        'total': len(files),
+        'resolved': resolved,
+        'open': open_count,
+        'unknown': len(unknown_files)
+    }
+    return stats, unknown_files
+
+
+def print_lane_stats(lane: str, lane_stats: dict, unknown_files: list) -> None:
+    """Print the verbose per-lane scan summary."""
+    for filepath in unknown_files:
+        print(f"  WARNING: {filepath} has unknown status")
+    total = lane_stats['total']
+    resolved = lane_stats['resolved']
+    pct = round(100 * resolved / total) if total else 0
+    print(f"Lane {lane}: {total} total, {resolved} resolved, {lane_stats['open']} open ({pct}%)")
+
+
 def scan_all_issues(verbose: bool = False) -> dict:
-    """Scan all issue files and return statistics."""
+    """Scan all issue files and return statistics.
+
+    Lanes are read concurrently; results and messages are gathered in lane order.
+    """
     stats = {}
 
-    for lane in LANES:
-        lane_dir = os.path.join(ISSUES_DIR, lane)
-        if not os.path.isdir(lane_dir):
-            continue
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        for lane, (lane_stats, unknown_files) in zip(LANES, executor.map(scan_lane_stats, LANES)):
+            if lane_stats is None:
+                continue
 
-        files = [f for f in os.listdir(lane_dir) if f.endswith('.md')]
+            stats[lane] = lane_stats
 
-        resolved = 0
-        open_count = 0
-        unknown = 0
+            if verbose:
+                print_lane_stats(lane, lane_stats, unknown_files)
+
+    return stats
 
-        for f in files:
-            filepath = os.path.join(lane_dir, f)
-            status = get_file_status(filepath)
 
-            if status == "RESOLVED":
-                resolved += 1
-            elif status == "OPEN":
-                open_count += 1
-            else:
-                unknown += 1
-                if verbose:
-                    print(f"  WARNING: {filepath} has unknown status")
+def scan_lane_open_issues(lane: str) -> list:
+    """Return one lane's open issues, sorted by file name."""
+    lane_dir = os.path.join(ISSUES_DIR, lane)
+    if not os.path.isdir(lane_dir):
+        return []
 
-        stats[lane] = {
-            'total': len(files),
-            'resolved': resolved,
-            'open': open_count,
-            'unknown': unknown
-        }
+    files = list_issue_files(lane_dir)
+    return collect_open_issues(files, [parse_issue_file(entry.path) for entry in files])
 
-        if verbose:
-            pct = round(100 * resolved / len(files)) if files else 0
-            print(f"Lane {lane}: {len(files)} total, {resolved} resolved, {open_count} open ({pct}%)")
 
-    return stats
+def collect_open_issues(files: list, parsed: list) -> list:
+    """Build the Open Issues rows for a lane's parsed files, sorted by file name."""
+    issues = []
+    for entry, issue_data in sorted(zip(files, parsed), key=lambda item: item[0].name):
+        if issue_data['status'] == 'OPEN':
+            # Truncate title if too long
+            title = issue_data['title'] or 'Untitled'
+            if len(title) > 60:
+                title = title[:57] + '...'
+
+            issues.append({
+                'id': issue_data['issue_id'] or entry.name.replace('.md', ''),
+                'title': title,
+                'severity': issue_data['severity'],
+                'severity_level': issue_data['severity_level'],
+                'type_tags': issue_data['type_tags'],
+            })
+
+    return issues
 
 
 def scan_open_issues(verbose: bool = False) -> dict:
     """Scan all issue files and return open issues grouped by lane."""
-    open_issues = {lane: [] for lane in LANES}
+    open_issues = {}
 
-    for lane in LANES:
-        lane_dir = os.path.join(ISSUES_DIR, lane)
-        if not os.path.isdir(lane_dir):
-            continue
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        for lane, issues in zip(LANES, executor.map(scan_lane_open_issues, LANES)):
+            open_issues[lane] = issues
+            if verbose and issues:
+                print(f"Lane {lane}: {len(issues)} open issues")
 
-        files = [f for f in os.listdir(lane_dir) if f.endswith('.md')]
+    return open_issues
 
-        for f in sorted(files):
-            filepath = os.path.join(lane_dir, f)
-            issue_data = parse_issue_file(filepath)
 
-            if issue_data['status'] == 'OPEN':
-                # Truncate title if too long
-                title = issue_data['title'] or 'Untitled'
-                if len(title) > 60:
-                    title = title[:57] + '...'
+def scan_lane(lane: str) -> tuple:
+    """Scan one lane for both statistics and open issues, listing it once.
 
-                open_issues[lane].append({
-                    'id': issue_data['issue_id'] or f.replace('.md', ''),
-                    'title': title,
-                    'severity': issue_data['severity'],
-                    'severity_level': issue_data['severity_level'],
-                    'type_tags': issue_data['type_tags'],
-                })
+    Each file's status check is followed directly by its parse, which picks
+    up any text the status check already read. Returns (stats,
+    unknown_files, open_issues); stats is None if the lane has no directory.
+    """
+    lane_dir = os.path.join(ISSUES_DIR, lane)
+    if not os.path.isdir(lane_dir):
+        return None, [], []
 
-        if verbose and open_issues[lane]:
-            print(f"Lane {lane}: {len(open_issues[lane])} open issues")
+    files = list_issue_files(lane_dir)
+    statuses = []
+    parsed = []
+    for entry in files:
+        statuses.append(get_file_status(entry.path, keep_text=True))
+        parsed.append(parse_issue_file(entry.path))
 
-    return open_issues
+    stats, unknown_files = count_statuses(files, statuses)
+    return stats, unknown_files, collect_open_issues(files, parsed)
+
+
+def scan_issues(verbose: bool = False) -> tuple:
+    """Scan all issue files once, returning (stats, open_issues).
+
+    Equivalent to scan_all_issues followed by scan_open_issues; verbose
+    output covers the statistics only, as scan_all_issues does.
+    """
+    stats = {}
+    open_issues = {}
+
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        for lane, (lane_stats, unknown_files, issues) in zip(LANES, executor.map(scan_lane, LANES)):
+            open_issues[lane] = issues
+            if lane_stats is None:
+                continue
+
+            stats[lane] = lane_stats
+
+            if verbose:
+                print_lane_stats(lane, lane_stats, unknown_files)
+
+    return stats, open_issues
 
 
 def generate_open_issues_section(open_issues: dict) -> str:
@@ -228,12 +520,22 @@ def generate_open_issues_section(open_issues: dict) -> str:
 def generate_progress_bar(percentage: float) -> str:
     """Generate a text-based progress bar."""
     filled = int(percentage / 5)  # 20 chars total
+    if 0 <= filled <= 20:
+        return PROGRESS_BARS[filled]
     empty = 20 - filled
     return f"[{'█' * filled}{'░' * empty}]"
 
 
 def generate_lane_indicator(percentage: int) -> str:
     """Generate lane status indicator."""
+    indicator = LANE_INDICATORS.get(percentage)
+    if indicator is not None:
+        return indicator
+    return render_lane_indicator(percentage)
+
+
+def render_lane_indicator(percentage: int) -> str:
+    """Render the lane status indicator for a percentage."""
     if percentage == 100:
         return "✅ 100%"
     elif percentage >= 80:
@@ -242,8 +544,49 @@ def generate_lane_indicator(percentage: int) -> str:
         return f"🔴 {percentage}%"
 
 
-def update_catalog(stats: dict, verbose: bool = False) -> bool:
-    """Update the catalog file with new statistics."""
+# Every bar and indicator a 0-100% value can produce, rendered once
+PROGRESS_BARS = tuple(f"[{'█' * filled}{'░' * (20 - filled)}]" for filled in range(21))
+LANE_INDICATORS = {percentage: render_lane_indicator(percentage) for percentage in range(101)}
+
+
+def replace_lane_sections(content: str, lane_sections: dict) -> tuple:
+    """Replace the rows of every lane's Open Issues table in one forward scan.
+
+    lane_sections maps each lane with open issues to its formatted rows. A
+    lane's table runs from its heading + table header to the first
+    <!-- LANE_X_ISSUES --> marker after it; a heading with no marker after it
+    is left alone. Returns (new content, set of lanes replaced).
+    """
+    pieces = []
+    lanes_updated = set()
+    pos = 0
+    match = LANE_HEADER_RE.search(content)
+    while match:
+        lane = match.group(1)
+        lane_marker = f'<!-- LANE_{lane}_ISSUES -->'
+        marker_at = content.find(lane_marker, match.end())
+        if marker_at == -1:
+            match = LANE_HEADER_RE.search(content, match.start() + 1)
+            continue
+
+        lanes_updated.add(lane)
+        pieces.append(content[pos:match.end()])
+        # New issue rows (none for an empty section)
+        if lane in lane_sections:
+            pieces.append(f"\n{lane_sections[lane]}")
+        pieces.append(f"\n{lane_marker}")
+        pos = marker_at + len(lane_marker)
+        match = LANE_HEADER_RE.search(content, pos)
+
+    pieces.append(content[pos:])
+    return ''.join(pieces), lanes_updated
+
+
+def update_catalog(stats: dict, verbose: bool = False, open_issues: dict = None) -> bool:
+    """Update the catalog file with new statistics.
+
+    open_issues, as returned by scan_issues, is scanned for when not given.
+    """
     if not os.path.exists(CATALOG_PATH):
         print(f"ERROR: Catalog file not found: {CATALOG_PATH}")
         return False
@@ -262,20 +605,12 @@ def update_catalog(stats: dict, verbose: bool = False) -> bool:
 
     # Update timestamp
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    content = re.sub(
-        r'>\s*\*\*Last Updated:\*\*\s*\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}',
-        f'> **Last Updated:** {timestamp}',
-        content
-    )
+    content = LAST_UPDATED_RE.sub(f'> **Last Updated:** {timestamp}', content)
 
     # Update header stats table
     progress_bar = generate_progress_bar(progress_pct)
     new_header = f"| {total_files} | {total_resolved} | {total_open} | {progress_bar} {progress_pct}% |"
-    content = re.sub(
-        r'\|\s*\d+\s*\|\s*\d+\s*\|\s*\d+\s*\|\s*\[█*░*\]\s*[\d.]+%\s*\|',
-        new_header,
-        content
-    )
+    content = HEADER_STATS_RE.sub(new_header, content)
 
     # Update lane table
     lane_table_lines = []
@@ -293,44 +628,36 @@ def update_catalog(stats: dict, verbose: bool = False) -> bool:
     new_lane_table = "\n".join(lane_table_lines)
 
     # Replace the lane table
-    lane_table_pattern = r'\| Lane \| Total \| Resolved \| Open \| % \|[\s\S]*?\| Z \| \d+ \| \d+ \| \d+ \| [^\n]+ \|'
-    content = re.sub(lane_table_pattern, new_lane_table, content)
+    content = LANE_TABLE_RE.sub(new_lane_table, content)
 
     # Update Open Issues section
     if verbose:
         print("Scanning open issues for Open Issues section...")
-    open_issues = scan_open_issues(verbose=verbose)
-
-    # Update each lane's issues in the Open Issues section
-    for lane in LANES:
-        # Pattern to match: table header + existing rows + marker
-        # <!-- LANE_X_ISSUES --> marks end of lane section
-        lane_marker = f'<!-- LANE_{lane}_ISSUES -->'
-
-        if lane_marker not in content:
-            if verbose:
-                print(f"  Warning: No marker {lane_marker} found in catalog")
-            continue
-
-        # Find the lane section header (e.g., "### Lane E - ...")
-        lane_header_pattern = rf'(### Lane {lane} - [^\n]+\n\| ID \| Title \| Severity \| Type Tags \| Status \|\n\|[-|]+\|)[\s\S]*?({lane_marker})'
+    if open_issues is None:
+        open_issues = scan_open_issues(verbose=verbose)
+    elif verbose:
+        for lane, issues in open_issues.items():
+            if issues:
+                print(f"Lane {lane}: {len(issues)} open issues")
+
+    # Update each lane's issues in the Open Issues section, all lanes in one
+    # pass over the catalog; <!-- LANE_X_ISSUES --> marks end of lane section
+    lanes_with_marker = [lane for lane in LANES if f'<!-- LANE_{lane}_ISSUES -->' in content]
+    lane_sections = {
+        lane: generate_open_issues_section(issues)
+        for lane, issues in open_issues.items()
+        if issues
+    }
+    content, lanes_updated = replace_lane_sections(content, lane_sections)
 
-        match = re.search(lane_header_pattern, content)
-        if match:
-            # Generate new issue rows
-            if open_issues.get(lane):
-                issue_rows = generate_open_issues_section(open_issues[lane])
-                new_section = f"{match.group(1)}\n{issue_rows}\n{match.group(2)}"
-            else:
-                # No open issues - empty section
-                new_section = f"{match.group(1)}\n{match.group(2)}"
-
-            content = re.sub(lane_header_pattern, new_section, content)
-            if verbose and open_issues.get(lane):
-                print(f"  Lane {lane}: {len(open_issues[lane])} open issues updated")
-        else:
-            if verbose:
+    if verbose:
+        for lane in LANES:
+            if lane not in lanes_with_marker:
+                print(f"  Warning: No marker <!-- LANE_{lane}_ISSUES --> found in catalog")
+            elif lane not in lanes_updated:
                 print(f"  Warning: Could not find lane section for Lane {lane}")
+            elif open_issues.get(lane):
+                print(f"  Lane {lane}: {len(open_issues[lane])} open issues updated")
 
     # Write updated content
     with open(CATALOG_PATH, 'w', encoding='utf-8') as f:
@@ -354,7 +681,7 @@ def check_sync(stats: dict) -> tuple:
     total_resolved = sum(s['resolved'] for s in stats.values())
     total_open = sum(s['open'] for s in stats.values())
 
-    header_match = re.search(r'\|\s*(\d+)\s*\|\s*(\d+)\s*\|\s*(\d+)\s*\|', content)
+    header_match = HEADER_TOTALS_RE.search(content)
     if header_match:
         cat_total = int(header_match.group(1))
         cat_resolved = int(header_match.group(2))
@@ -373,8 +700,7 @@ def check_sync(stats: dict) -> tuple:
             continue
         s = stats[lane]
 
-        lane_pattern = rf'\| {lane} \| (\d+) \| (\d+) \| (\d+) \|'
-        lane_match = re.search(lane_pattern, content)
+        lane_match = LANE_ROW_RES[lane].search(content)
         if lane_match:
             cat_total = int(lane_match.group(1))
             cat_resolved = int(lane_match.group(2))
@@ -400,7 +726,13 @@ def main():
     args = parser.parse_args()
 
     print("Scanning issue files...")
-    stats = scan_all_issues(verbose=args.verbose)
+    load_scan_cache()
+    if args.check:
+        # Only the statistics are compared
+        stats = scan_all_issues(verbose=args.verbose)
+    else:
+        stats, open_issues = scan_issues(verbose=args.verbose)
+    save_scan_cache()
 
     total_files = sum(s['total'] for s in stats.values())
     total_resolved = sum(s['resolved'] for s in stats.values())
@@ -420,7 +752,7 @@ def main():
             return 1
     else:
         print("Updating catalog...")
-        if update_catalog(stats, verbose=args.verbose):
+        if update_catalog(stats, verbose=args.verbose, open_issues=open_issues):
             print("✅ Catalog updated successfully")
             return 0
         else:
@@ -19,19 +19,23 @@ Usage:
     python3 tools/verify_issue.py --lane G          # Verify all in lane
     python3 tools/verify_issue.py --all             # Verify all issues
     python3 tools/verify_issue.py G-01 --quick      # Quick check only
+    python3 tools/verify_issue.py --all --evidence-files  # Per-issue evidence JSON
 """
 
+import io
 import os
 import re
 import sys
+import threading
+import time
 import glob
 import json
-import yaml
-import subprocess
+import fnmatch
+import itertools
 import argparse
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
 
 # =============================================================================
 # MALFORMED COMMAND DETECTION AND AUTO-CORRECTION
@@ -40,16 +44,42 @@ from dataclasses import dataclass
 # Patterns that indicate malformed verification commands
 MALFORMED_PATTERNS = [
     # Command used as file path (test -f ls foo)
-    (r'test\s+-[efds]\s+(ls|cat|grep|find|echo|test|python|python3)\s',
+    (re.compile(r'test\s+-[efds]\s+(ls|cat|grep|find|echo|test|python|python3)\s'),
      "Shell command used as file path"),
     # Unsubstituted template variables
-    (r'<[a-z_-]+>', "Unsubstituted template variable"),
-    (r'\{[a-z_]+\}', "Unsubstituted template placeholder"),
+    (re.compile(r'<[a-z_-]+>'), "Unsubstituted template variable"),
+    (re.compile(r'\{[a-z_]+\}'), "Unsubstituted template placeholder"),
     # Wrong test operator for path type
-    (r'test\s+-f\s+\S+/$', "Using -f on directory path (should be -d)"),
+    (re.compile(r'test\s+-f\s+\S+/$'), "Using -f on directory path (should be -d)"),
 ]
 
-
+# Path argument of a test command
+TEST_PATH_RE = re.compile(r'test\s+-[efds]\s+(\S+)')
+
+# auto_correct_command patterns, in the order they are applied
+DIR_TEST_RE = re.compile(r'test\s+-f\s+(\S+/)\s*&&')
+DIR_TEST_FIX_RE = re.compile(r'test\s+-f\s+(\S+/)')
+WILDCARD_TEST_RE = re.compile(r'test\s+-[fdse]\s+(\S*\*\S*)\s*&&\s*echo\s+"?PASS"?')
+GIT_WILDCARD_RE = re.compile(r'git\s+ls-files\s+--error-unmatch\s+(\S*\*\S*)')
+GIT_WILDCARD_FIX_RE = re.compile(GIT_WILDCARD_RE.pattern + r'.*&&\s*echo\s+"?PASS"?')
+COMMENT_PATH_RE = re.compile(r'test\s+-([fd])\s+#\s*(\S+)')
+PLACEHOLDER_TEST_RE = re.compile(r'test\s+-[fdse]\s+/?(\S*)<[a-z_-]+>(\S*)')
+PLACEHOLDER_TEST_FIX_RE = re.compile(PLACEHOLDER_TEST_RE.pattern + r'\s*&&\s*echo\s+"?PASS"?')
+GIT_PLACEHOLDER_RE = re.compile(r'git\s+ls-files\s+--error-unmatch\s+/?(\S*)<[a-z_-]+>(\S*)')
+GIT_PLACEHOLDER_FIX_RE = re.compile(GIT_PLACEHOLDER_RE.pattern + r'.*&&\s*echo\s+"?PASS"?')
+MULTI_CMD_RE = re.compile(r'test\s+-[fd]\s+(ls|cat|grep|find)\s+')
+TEST_WRAPPER_RE = re.compile(r'test\s+-[fd]\s+')
+ABS_PATH_RE = re.compile(r'test\s+-([fd])\s+/([A-Za-z])')
+WC_TEST_RE = re.compile(r'test\s+-[fd]\s+wc\s+-l\s+')
+# Matches wherever any of the patterns above would fire; a command with no
+# match needs no correction
+CORRECTABLE_RE = re.compile('|'.join(f'(?:{p.pattern})' for p in (
+    DIR_TEST_RE, WILDCARD_TEST_RE, GIT_WILDCARD_RE, COMMENT_PATH_RE, PLACEHOLDER_TEST_RE,
+    GIT_PLACEHOLDER_RE, MULTI_CMD_RE, ABS_PATH_RE, WC_TEST_RE,
+)))
+
+
+@lru_cache(maxsize=2048)
 def auto_correct_command(command: str) -> tuple:
     """
     Attempt to auto-correct common malformed verification commands.
@@ -61,106 +91,87 @@ def auto_correct_command(command: str) -> tuple:
     4. Placeholder variables → test parent directory
     5. Multi-part commands as paths → extract valid command
 
+    Results are cached per command string, since issues share templates.
+
     Returns:
         (corrected_command: str, was_corrected: bool, correction_note: str)
     """
+    # Well-formed commands are rejected by a single scan
+    if not CORRECTABLE_RE.search(command):
+        return command, False, ""
+
     original = command
     corrected = command
     notes = []
 
     # Pattern 1: Fix test -f on directory paths (ending in /)
     # e.g., test -f LogBook/audit/ → test -d LogBook/audit/
-    dir_pattern = r'test\s+-f\s+(\S+/)\s*&&'
-    match = re.search(dir_pattern, corrected)
+    match = DIR_TEST_RE.search(corrected)
     if match:
-        corrected = re.sub(r'test\s+-f\s+(\S+/)', r'test -d \1', corrected)
+        corrected = DIR_TEST_FIX_RE.sub(r'test -d \1', corrected)
         notes.append("Changed -f to -d for directory path")
 
     # Pattern 2: Fix wildcards in test command (any test flag)
     # e.g., test -f templates/*.jinja2 → ls templates/*.jinja2 >/dev/null 2>&1
     # e.g., test -s LogBook/*/STATE.md → ls LogBook/*/STATE.md >/dev/null 2>&1
-    wildcard_pattern = r'test\s+-[fdse]\s+(\S*\*\S*)\s*&&\s*echo\s+"?PASS"?'
-    match = re.search(wildcard_pattern, corrected)
+    match = WILDCARD_TEST_RE.search(corrected)
     if match:
         path = match.group(1)
-        corrected = re.sub(
-            wildcard_pattern,
-            f'ls {path} >/dev/null 2>&1 && echo "PASS"',
-            corrected
-        )
+        corrected = WILDCARD_TEST_RE.sub(f'ls {path} >/dev/null 2>&1 && echo "PASS"', corrected)
         notes.append("Converted wildcard test to ls command")
 
     # Pattern 2b: Fix wildcards in git ls-files
     # e.g., git ls-files --error-unmatch PATH/* → ls PATH/* >/dev/null 2>&1
-    git_wildcard_pattern = r'git\s+ls-files\s+--error-unmatch\s+(\S*\*\S*)'
-    match = re.search(git_wildcard_pattern, corrected)
+    match = GIT_WILDCARD_RE.search(corrected)
     if match:
         path = match.group(1)
-        corrected = re.sub(
-            git_wildcard_pattern + r'.*&&\s*echo\s+"?PASS"?',
-            f'ls {path} >/dev/null 2>&1 && echo "PASS"',
-            corrected
-        )
+        corrected = GIT_WILDCARD_FIX_RE.sub(f'ls {path} >/dev/null 2>&1 && echo "PASS"', corrected)
         notes.append("Converted git ls-files wildcard to ls command")
 
     # Pattern 3: Remove comment characters from paths
     # e.g., test -f # LogBook/foo → test -f LogBook/foo
-    comment_pattern = r'test\s+-([fd])\s+#\s*(\S+)'
-    match = re.search(comment_pattern, corrected)
+    match = COMMENT_PATH_RE.search(corrected)
     if match:
-        corrected = re.sub(comment_pattern, r'test -\1 \2', corrected)
+        corrected = COMMENT_PATH_RE.sub(r'test -\1 \2', corrected)
         notes.append("Removed comment character from path")
 
     # Pattern 4: Handle placeholder variables - test parent directory
     # e.g., test -f /LogBook/bricks/<brick-id>/status.yaml → test -d LogBook/bricks/
     # e.g., test -s /LogBook/bricks/<brick-id>/status.yaml → test -d LogBook/bricks/
-    placeholder_pattern = r'test\s+-[fdse]\s+/?(\S*)<[a-z_-]+>(\S*)'
-    match = re.search(placeholder_pattern, corrected)
+    match = PLACEHOLDER_TEST_RE.search(corrected)
     if match:
         parent_path = match.group(1).rstrip('/')
         if parent_path:
-            corrected = re.sub(
-                placeholder_pattern + r'\s*&&\s*echo\s+"?PASS"?',
-                f'test -d {parent_path}/ && echo "PASS"',
-                corrected
-            )
+            corrected = PLACEHOLDER_TEST_FIX_RE.sub(f'test -d {parent_path}/ && echo "PASS"', corrected)
             notes.append(f"Replaced placeholder with parent directory test: {parent_path}/")
 
     # Pattern 4b: Handle placeholder variables in git ls-files
     # e.g., git ls-files /LogBook/<brick-id>/status.yaml → ls LogBook/ >/dev/null 2>&1
-    git_placeholder_pattern = r'git\s+ls-files\s+--error-unmatch\s+/?(\S*)<[a-z_-]+>(\S*)'
-    match = re.search(git_placeholder_pattern, corrected)
+    match = GIT_PLACEHOLDER_RE.search(corrected)
     if match:
         parent_path = match.group(1).rstrip('/')
         if parent_path:
-            corrected = re.sub(
-                git_placeholder_pattern + r'.*&&\s*echo\s+"?PASS"?',
-                f'ls {parent_path}/ >/dev/null 2>&1 && echo "PASS"',
-                corrected
-            )
+            corrected = GIT_PLACEHOLDER_FIX_RE.sub(f'ls {parent_path}/ >/dev/null 2>&1 && echo "PASS"', corrected)
             notes.append(f"Replaced git ls-files placeholder with ls: {parent_path}/")
 
     # Pattern 5: Fix multi-part commands used as paths
     # e.g., test -f ls LogBook/builder/ && grep → ls LogBook/builder/ && grep
-    multi_cmd_pattern = r'test\s+-[fd]\s+(ls|cat|grep|find)\s+'
-    match = re.search(multi_cmd_pattern, corrected)
+    match = MULTI_CMD_RE.search(corrected)
     if match:
         # Remove the test -f/d prefix, keep the actual command
-        corrected = re.sub(r'test\s+-[fd]\s+', '', corrected, count=1)
+        corrected = TEST_WRAPPER_RE.sub('', corrected, count=1)
         notes.append("Removed incorrect test wrapper from command")
 
     # Pattern 6: Fix paths starting with /
     # e.g., /LogBook/foo → LogBook/foo (relative paths in project)
-    abs_path_pattern = r'test\s+-([fd])\s+/([A-Za-z])'
-    if re.search(abs_path_pattern, corrected):
-        corrected = re.sub(abs_path_pattern, r'test -\1 \2', corrected)
+    if ABS_PATH_RE.search(corrected):
+        corrected = ABS_PATH_RE.sub(r'test -\1 \2', corrected)
         notes.append("Converted absolute path to relative")
 
     # Pattern 7: Fix wc -l incorrectly placed in test
     # e.g., test -f wc -l docs/foo → wc -l docs/foo
-    wc_pattern = r'test\s+-[fd]\s+wc\s+-l\s+'
-    if re.search(wc_pattern, corrected):
-        corrected = re.sub(r'test\s+-[fd]\s+', '', corrected, count=1)
+    if WC_TEST_RE.search(corrected):
+        corrected = TEST_WRAPPER_RE.sub('', corrected, count=1)
         notes.append("Removed incorrect test wrapper from wc command")
 
     was_corrected = corrected != original
@@ -169,23 +180,24 @@ def auto_correct_command(command: str) -> tuple:
     return corrected, was_corrected, correction_note
 
 
+@lru_cache(maxsize=2048)
 def is_malformed_command(command: str) -> tuple:
     """
     Check if a verification command is malformed.
 
+    Results are cached per command string.
+
     Returns:
         (is_malformed: bool, reason: str)
     """
-    import re
-
     for pattern, reason in MALFORMED_PATTERNS:
-        if re.search(pattern, command):
+        if pattern.search(command):
             return True, reason
 
     # Check for common path malformations
     if 'test -' in command:
         # Extract the path being tested
-        match = re.search(r'test\s+-[efds]\s+(\S+)', command)
+        match = TEST_PATH_RE.search(command)
         if match:
             path = match.group(1)
             # Path should not contain spaces or start with shell commands
@@ -206,60 +218,162 @@ def is_malformed_command(command: str) -> tuple:
 ISSUES_DIR = "issues"
 PATTERNS_FILE = "tools/verification_patterns.yaml"
 EVIDENCE_DIR = "LogBook/verification/evidence"
+# Chunk size for reading just the frontmatter at the head of an issue file
+FRONTMATTER_READ_CHARS = 8192
+# Checks mostly wait on shell commands, so a lane's issues are verified from a thread pool
+VERIFY_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+# Most of a command's stdout and of its stderr kept as check output; at
+# least the 500 characters recorded as evidence
+COMMAND_OUTPUT_CHARS = 4096
+
+# Parsed frontmatter per issue file: path -> (mtime_ns, size, frontmatter)
+_frontmatter_cache: Dict[str, Tuple[int, int, Any]] = {}
+# Issue ID -> issue file path, from earlier find_issue_file lookups
+_issue_file_cache: Dict[str, str] = {}
+# Lane -> evidence held for flush_evidence while a batch is open, else None
+_evidence_buffer: Optional[Dict[str, List[Dict[str, Any]]]] = None
+_evidence_lock = threading.Lock()
+# Lane directory -> (mtime_ns, entry names in listing order, set of those names)
+_lane_entries_cache: Dict[str, Tuple[int, List[str], frozenset]] = {}
+# (mtime_ns, size, parsed patterns) of PATTERNS_FILE as last loaded
+_patterns_cache: Optional[Tuple[int, int, Any]] = None
+# (pattern_name, depth) -> (patterns, checks run at that depth) from pattern_checks
+_pattern_checks_cache: Dict[Tuple[Any, Any], Tuple[Any, Tuple[Any, ...]]] = {}
 
 # =============================================================================
 # PATTERNS LOADING
 # =============================================================================
 
+def _yaml_load(stream: Any) -> Any:
+    """yaml.safe_load, using the LibYAML-backed loader when available."""
+    import yaml
+
+    try:
+        loader = yaml.CSafeLoader
+    except AttributeError:
+        loader = yaml.SafeLoader
+    return yaml.load(stream, Loader=loader)
+
 def load_patterns() -> Dict[str, Any]:
-    """Load verification patterns from YAML."""
+    """Load verification patterns from YAML.
+
+    The parsed file is reused while its mtime and size are unchanged, and
+    shared between callers, which must not modify it.
+    """
+    global _patterns_cache
+
     if not os.path.exists(PATTERNS_FILE):
         print(f"Warning: Patterns file not found: {PATTERNS_FILE}")
         return {'patterns': {}}
 
+    st = os.stat(PATTERNS_FILE)
+    cached = _patterns_cache
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
     with open(PATTERNS_FILE, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+        patterns = _yaml_load(f)
+    _patterns_cache = (st.st_mtime_ns, st.st_size, patterns)
+    return patterns
 
 # =============================================================================
 # FRONTMATTER PARSING
 # =============================================================================
 
+# Issue body sections
+VERIFICATION_SECTION_RE = re.compile(r'\*\*Verification Commands.*?\*\*.*?```bash\n(.*?)```', re.DOTALL)
+CHECK_LINE_RE = re.compile(r'# (Check \d+): ([^\n]+)\n([^\n]+)')
+EXPECTED_OUTPUTS_RE = re.compile(r'\*\*Expected Outputs \(Machine-Readable\)\*\*.*?```yaml\n(.*?)```', re.DOTALL)
+
+# Path references in issue frontmatter and content
+LINE_NUMBER_SUFFIX_RE = re.compile(r':\d+.*$')
+REFERENCED_PATH_RE = re.compile(r'Referenced\s+path:\s*`?([^\s`\n]+)`?')
+BACKTICK_PATH_RE = re.compile(r'`([^`]+\.(py|yaml|yml|json|md|sh))`')
+
 def parse_frontmatter(filepath: str) -> Optional[Dict[str, Any]]:
-    """Parse YAML frontmatter from issue file."""
+    """Parse YAML frontmatter from issue file.
+
+    Results are cached per version (mtime and size) of the file and shared
+    between callers, which must not modify them. Failures are not cached, so
+    their messages are printed on every call.
+    """
     try:
+        st = os.stat(filepath)
+        cached = _frontmatter_cache.get(filepath)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
         with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+            head = read_frontmatter_head(f)
     except Exception as e:
         print(f"Error reading {filepath}: {e}")
         return None
 
-    if not content.startswith('---'):
-        return None
-
-    end = content.find('\n---\n', 3)
-    if end < 0:
-        return None
+    import yaml
 
     try:
-        return yaml.safe_load(content[4:end])
+        frontmatter = parse_frontmatter_text(head)
     except yaml.YAMLError as e:
         print(f"Error parsing frontmatter: {e}")
         return None
 
+    _frontmatter_cache[filepath] = (st.st_mtime_ns, st.st_size, frontmatter)
+    return frontmatter
+
+def read_frontmatter_head(f) -> str:
+    """Read an open issue file only as far as the end of its frontmatter.
+
+    Reads in FRONTMATTER_READ_CHARS chunks until the closing '---' line
+    turns up (or the file ends); a file without frontmatter stops after the
+    first chunk.
+    """
+    content = f.read(max(3, FRONTMATTER_READ_CHARS))
+    if not content.startswith('---'):
+        return content
+
+    start = 3
+    while content.find('\n---\n', start) < 0:
+        chunk = f.read(FRONTMATTER_READ_CHARS)
+        if not chunk:
+            break
+        # The closing delimiter may straddle the chunk boundary
+        start = max(3, len(content) - 4)
+        content += chunk
+    return content
+
+def parse_frontmatter_text(content: str) -> Optional[Dict[str, Any]]:
+    """Parse the YAML frontmatter at the start of an issue's text.
+
+    Returns None when there is no complete frontmatter block; YAML errors
+    propagate to the caller.
+    """
+    return parse_frontmatter_with_bounds(content)[0]
+
+def frontmatter_end(content: str) -> int:
+    """Index of the newline before an issue's closing '---' line, or -1."""
+    if not content.startswith('---'):
+        return -1
+    return content.find('\n---\n', 3)
+
+def parse_frontmatter_with_bounds(content: str) -> Tuple[Optional[Dict[str, Any]], int]:
+    """Parse an issue's frontmatter and also return frontmatter_end(content)."""
+    end = frontmatter_end(content)
+    if end < 0:
+        return None, end
+    return _yaml_load(content[4:end]), end
+
 def extract_verification_commands(content: str) -> List[Dict[str, str]]:
     """Extract Verification Commands section from issue content."""
     commands = []
 
     # Find Verification Commands section
-    match = re.search(r'\*\*Verification Commands.*?\*\*.*?```bash\n(.*?)```', content, re.DOTALL)
+    match = VERIFICATION_SECTION_RE.search(content)
     if not match:
         return commands
 
     cmd_section = match.group(1)
 
     # Extract individual checks
-    check_pattern = r'# (Check \d+): ([^\n]+)\n([^\n]+)'
-    for match in re.finditer(check_pattern, cmd_section):
+    for match in CHECK_LINE_RE.finditer(cmd_section):
         check_num = match.group(1)
         check_name = match.group(2).strip()
         command = match.group(3).strip()
@@ -275,12 +389,14 @@ def extract_verification_commands(content: str) -> List[Dict[str, str]]:
 def extract_expected_outputs(content: str) -> Optional[Dict[str, Any]]:
     """Extract Expected Outputs YAML section from issue content."""
     # Find Expected Outputs (Machine-Readable) section
-    match = re.search(r'\*\*Expected Outputs \(Machine-Readable\)\*\*.*?```yaml\n(.*?)```', content, re.DOTALL)
+    match = EXPECTED_OUTPUTS_RE.search(content)
     if not match:
         return None
 
+    import yaml
+
     try:
-        expected = yaml.safe_load(match.group(1))
+        expected = _yaml_load(match.group(1))
         return expected
     except yaml.YAMLError as e:
         print(f"Warning: Failed to parse expected outputs YAML: {e}")
@@ -294,68 +410,159 @@ def extract_target_paths(frontmatter: Dict[str, Any], content: str) -> List[str]
     affected = frontmatter.get('affected_paths', [])
     for path in affected:
         # Clean path
-        clean = re.sub(r':\d+.*$', '', path)
+        clean = LINE_NUMBER_SUFFIX_RE.sub('', path)
         clean = clean.strip('`')
         if '/' in clean and not clean.startswith('test'):
             paths.append(clean)
 
-    # From content - referenced paths
-    matches = re.findall(r'Referenced\s+path:\s*`?([^\s`\n]+)`?', content)
-    paths.extend(matches)
-
-    # From Evidence section
-    matches = re.findall(r'`([^`]+\.(py|yaml|yml|json|md|sh))`', content)
-    for match in matches:
-        if isinstance(match, tuple):
-            path = match[0]
-        else:
-            path = match
-        if '/' in path:
-            paths.append(path)
+    # From content - referenced paths, then from the Evidence section. These
+    # are scanned lazily, as only the first five usable paths are kept
+    referenced = (match.group(1) for match in REFERENCED_PATH_RE.finditer(content))
+    evidence = (path for path in (match.group(1) for match in BACKTICK_PATH_RE.finditer(content)) if '/' in path)
 
-    # Dedupe and clean
+    # Dedupe and clean. A path is compared before its line number is
+    # removed, against the cleaned paths kept so far
     clean_paths = []
-    for path in paths:
+    seen = set()
+    for path in itertools.chain(paths, referenced, evidence):
         clean = path.strip()
-        if clean and clean not in clean_paths and '/' in clean:
+        if clean and clean not in seen and '/' in clean:
             # Remove line numbers
-            clean = re.sub(r':\d+.*$', '', clean)
+            clean = LINE_NUMBER_SUFFIX_RE.sub('', clean)
             if len(clean) > 3:
                 clean_paths.append(clean)
+                if len(clean_paths) == 5:
+                    break
+                seen.add(clean)
 
-    return clean_paths[:5]
+    return clean_paths
 
 # =============================================================================
 # CHECK EXECUTION
 # =============================================================================
 
+# A {name} placeholder in a verification pattern command
+PLACEHOLDER_RE = re.compile(r'\{([^{}]*)\}')
+
 def run_command(command: str, timeout: int = 30) -> Tuple[int, str]:
-    """Run a shell command and return exit code and output."""
+    """Run a shell command and return exit code and output.
+
+    The output is the head of stdout followed by the head of stderr, each
+    capped at COMMAND_OUTPUT_CHARS.
+    """
+    exit_code, output, _ = run_command_matching(command, '', timeout)
+    return exit_code, output
+
+def run_command_matching(command: str, needle: str, timeout: int = 30) -> Tuple[int, str, bool]:
+    """Run a shell command; return exit code, output and whether needle occurs.
+
+    Both streams are read as the command writes them and only their heads
+    are kept, as in run_command, so memory stays bounded however much it
+    prints. needle is searched for in the full stdout followed by stderr,
+    so a marker printed at the end of a long output is still found.
+    """
+    import subprocess
+
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             command,
             shell=True,
-            capture_output=True,
-            text=True,
-            timeout=timeout
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
         )
-        return result.returncode, result.stdout + result.stderr
+    except Exception as e:
+        return -1, str(e), needle in str(e)
+
+    deadline = time.monotonic() + timeout
+    scans: List[List[Any]] = [[], []]
+    readers = [
+        threading.Thread(target=_scan_stream, args=(stream, needle, scan), daemon=True)
+        for stream, scan in zip((proc.stdout, proc.stderr), scans)
+    ]
+    for reader in readers:
+        reader.start()
+    try:
+        for reader in readers:
+            reader.join(max(0.0, deadline - time.monotonic()))
+        if any(reader.is_alive() for reader in readers):
+            raise subprocess.TimeoutExpired(command, timeout)
+        proc.wait(max(0.0, deadline - time.monotonic()))
     except subprocess.TimeoutExpired:
-        return -1, "Command timed out"
+        proc.kill()
+        proc.wait()
+        return -1, "Command timed out", needle in "Command timed out"
+
+    for scan in scans:
+        if len(scan) == 1:
+            # The stream could not be decoded
+            return -1, str(scan[0]), needle in str(scan[0])
+    (out_head, _, out_tail, out_found), (err_head, err_prefix, _, err_found) = scans
+    found = out_found or err_found or needle in out_tail + err_prefix
+    return proc.returncode, out_head + err_head, found
+
+def _scan_stream(stream, needle: str, scan: List[Any]) -> None:
+    """Read a command's output stream to EOF for run_command_matching.
+
+    Fills scan with the stream's first COMMAND_OUTPUT_CHARS characters, its
+    first and last len(needle) - 1 characters (to find needle across the
+    stdout/stderr boundary) and whether needle occurs in it; or with just
+    the exception if reading fails.
+    """
+    keep = len(needle) - 1
+    head: List[str] = []
+    head_len = 0
+    prefix = ''
+    tail = ''
+    found = not needle
+    try:
+        while True:
+            chunk = stream.read(8192)
+            if not chunk:
+                break
+            if head_len < COMMAND_OUTPUT_CHARS:
+                head.append(chunk[:COMMAND_OUTPUT_CHARS - head_len])
+                head_len += len(head[-1])
+            if len(prefix) < keep:
+                prefix += chunk[:keep - len(prefix)]
+            if not found:
+                window = tail + chunk
+                found = needle in window
+                tail = window[-keep:] if keep > 0 else ''
     except Exception as e:
-        return -1, str(e)
+        scan.append(e)
+        return
+    finally:
+        stream.close()
+    scan.extend((''.join(head), prefix, tail, found))
 
 def substitute_vars(template: str, variables: Dict[str, str]) -> str:
-    """Substitute variables in command template."""
-    result = template
-    for key, value in variables.items():
-        result = result.replace(f'{{{key}}}', str(value))
-    return result
+    """Substitute variables in command template.
 
-def run_pattern_checks(pattern_name: str, patterns: Dict[str, Any],
-                       variables: Dict[str, str], depth: str = "STANDARD") -> List[Dict]:
-    """Run verification checks for a pattern."""
-    results = []
+    Placeholders are replaced in one regex pass. When braces outside
+    complete placeholders, or in a name or value, could let one substitution
+    form a placeholder for the next, the variables are substituted one at a
+    time instead, as that can give a different result.
+    """
+    values = {key: str(value) for key, value in variables.items()}
+    stray = PLACEHOLDER_RE.sub('', template)
+    if '{' in stray or '}' in stray or any('{' in text or '}' in text for item in values.items() for text in item):
+        result = template
+        for key, value in values.items():
+            result = result.replace(f'{{{key}}}', value)
+        return result
+    return PLACEHOLDER_RE.sub(lambda match: values.get(match.group(1), match.group(0)), template)
+
+def pattern_checks(pattern_name: str, patterns: Dict[str, Any],
+                   depth: str = "STANDARD") -> Tuple[Any, ...]:
+    """Checks of a pattern that run at the given depth.
+
+    Resolved once per pattern and depth for each loaded patterns file.
+    """
+    key = (pattern_name, depth)
+    cached = _pattern_checks_cache.get(key)
+    if cached is not None and cached[0] is patterns:
+        return cached[1]
 
     pattern = patterns.get('patterns', {}).get(pattern_name, {})
     checks = pattern.get('checks', [])
@@ -364,20 +571,30 @@ def run_pattern_checks(pattern_name: str, patterns: Dict[str, Any],
     depth_levels = patterns.get('depth_levels', {})
     allowed_checks = depth_levels.get(depth, {}).get('checks', ['existence', 'content_validation', 'git_tracking'])
 
+    selected = []
     for check in checks:
-        name = check.get('name', '')
-
         # Skip checks not in depth level
-        check_type = 'existence' if 'exist' in name else 'content_validation'
+        check_type = 'existence' if 'exist' in check.get('name', '') else 'content_validation'
         if check_type not in allowed_checks and depth != "DEEP":
             continue
+        selected.append(check)
+
+    _pattern_checks_cache[key] = (patterns, tuple(selected))
+    return _pattern_checks_cache[key][1]
+
+def run_pattern_checks(pattern_name: str, patterns: Dict[str, Any],
+                       variables: Dict[str, str], depth: str = "STANDARD") -> List[Dict]:
+    """Run verification checks for a pattern."""
+    results = []
 
+    for check in pattern_checks(pattern_name, patterns, depth):
+        name = check.get('name', '')
         command = substitute_vars(check.get('command', ''), variables)
         expected = check.get('expected_exit', 0)
 
-        start = datetime.now()
+        start = time.perf_counter_ns()
         actual, output = run_command(command)
-        duration = int((datetime.now() - start).total_seconds() * 1000)
+        duration = (time.perf_counter_ns() - start) // 1_000_000
 
         passed = (actual == expected)
 
@@ -399,7 +616,58 @@ def run_pattern_checks(pattern_name: str, patterns: Dict[str, Any],
 # =============================================================================
 
 def find_issue_file(issue_id: str) -> Optional[str]:
-    """Find issue file by ID."""
+    """Find issue file by ID.
+
+    Found paths are remembered for the rest of the run and only looked up
+    again if the file has since disappeared.
+    """
+    path = _issue_file_cache.get(issue_id)
+    if path is not None and os.path.exists(path):
+        return path
+
+    path = _find_issue_file(issue_id)
+    if path is not None:
+        _issue_file_cache[issue_id] = path
+    return path
+
+def lane_entries(lane_dir: str) -> Tuple[List[str], frozenset]:
+    """Names in a lane directory, in listing order and as a set.
+
+    The listing is reused until the directory's mtime changes, so looking
+    issues up costs one stat instead of a stat per candidate and a glob.
+    """
+    try:
+        mtime = os.stat(lane_dir).st_mtime_ns
+    except OSError:
+        return [], frozenset()
+    cached = _lane_entries_cache.get(lane_dir)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+    try:
+        names = os.listdir(lane_dir)
+    except OSError:
+        return [], frozenset()
+    _lane_entries_cache[lane_dir] = (mtime, names, frozenset(names))
+    return names, _lane_entries_cache[lane_dir][2]
+
+def _find_issue_file(issue_id: str) -> Optional[str]:
+    """Look up an issue file by ID on disk."""
+    lane = issue_id[0].upper()
+    lane_dir = os.path.join(ISSUES_DIR, lane)
+    if os.sep in issue_id or (os.altsep and os.altsep in issue_id) or glob.escape(lane_dir) != lane_dir:
+        return _glob_issue_file(issue_id)
+
+    names, name_set = lane_entries(lane_dir)
+    for name in (f"{issue_id}.md", f"{lane}-{issue_id[1:].lstrip('-')}.md"):
+        if name in name_set:
+            return os.path.join(lane_dir, name)
+
+    # Same matches as the glob fallback, which skips hidden names
+    matches = fnmatch.filter((n for n in names if not n.startswith('.')), f"*{issue_id}*.md")
+    return os.path.join(lane_dir, matches[0]) if matches else None
+
+def _glob_issue_file(issue_id: str) -> Optional[str]:
+    """Look up an issue file by ID with path checks and a glob."""
     lane = issue_id[0].upper()
     candidates = [
         os.path.join(ISSUES_DIR, lane, f"{issue_id}.md"),
@@ -438,8 +706,14 @@ def verify_issue(issue_id: str, depth: str = "STANDARD",
             'passed': False
         }
 
-    # Parse frontmatter
-    frontmatter = parse_frontmatter(filepath)
+    # Parse frontmatter from the text already read
+    import yaml
+
+    try:
+        frontmatter, fm_end = parse_frontmatter_with_bounds(content)
+    except yaml.YAMLError as e:
+        print(f"Error parsing frontmatter: {e}")
+        frontmatter = None
 
     if not frontmatter:
         return {
@@ -467,6 +741,7 @@ def verify_issue(issue_id: str, depth: str = "STANDARD",
     # Try to use embedded Verification Commands first
     verification_commands = extract_verification_commands(content)
     expected_outputs = extract_expected_outputs(content)
+    target_paths = extract_target_paths(frontmatter, content)
 
     check_results = []
 
@@ -497,22 +772,24 @@ def verify_issue(issue_id: str, depth: str = "STANDARD",
             # Use corrected command for execution
             exec_command = corrected_cmd
 
-            start = datetime.now()
-            actual_exit, output = run_command(exec_command)
-            duration = int((datetime.now() - start).total_seconds() * 1000)
-
             # Check against expected outputs if available
-            passed = False
             if expected_outputs:
                 check_num = cmd_spec['check'].replace('Check ', 'check_')
                 expected = expected_outputs.get('expected_results', {}).get(check_num, {})
                 expected_exit = expected.get('exit_code', 0)
                 expected_stdout = expected.get('stdout_contains', 'PASS')
-
-                passed = (actual_exit == expected_exit and expected_stdout in output)
             else:
                 # Fallback: check if output contains PASS
-                passed = (actual_exit == 0 and 'PASS' in output)
+                expected_exit = 0
+                expected_stdout = 'PASS'
+
+            # The full output is searched while it is read, as only its head is kept
+            searchable = isinstance(expected_stdout, str)
+            start = time.perf_counter_ns()
+            actual_exit, output, found = run_command_matching(exec_command, expected_stdout if searchable else '')
+            duration = (time.perf_counter_ns() - start) // 1_000_000
+
+            passed = (actual_exit == expected_exit and (found if searchable else expected_stdout in output))
 
             check_results.append({
                 'name': cmd_spec['name'],
@@ -533,8 +810,6 @@ def verify_issue(issue_id: str, depth: str = "STANDARD",
         pattern_name = frontmatter.get('verification_pattern', 'missing_file')
         fm_depth = frontmatter.get('verification_depth', depth)
 
-        target_paths = extract_target_paths(frontmatter, content)
-
         variables = {
             'issue_id': issue_id,
             'lane': frontmatter.get('lane', issue_id[0]),
@@ -577,7 +852,7 @@ def verify_issue(issue_id: str, depth: str = "STANDARD",
         'depth': frontmatter.get('verification_depth', depth),
         'depends_on': depends_on,
         'unresolved_dependencies': unresolved_deps,
-        'target_paths': extract_target_paths(frontmatter, content),
+        'target_paths': target_paths,
         'checks': check_results,
         'passed': all_passed,
         'passed_count': passed_count,
@@ -597,22 +872,20 @@ def verify_issue(issue_id: str, depth: str = "STANDARD",
     # Update issue status if requested
     if update_status and all_passed:
         try:
-            update_issue_verified(filepath, result)
+            update_issue_verified(filepath, result, content, fm_end)
             result['status_updated'] = True
         except Exception as e:
             result['update_error'] = str(e)
 
     return result
 
-def save_evidence(result: Dict[str, Any]) -> str:
-    """Save verification evidence to file."""
-    lane = result.get('lane', result['issue_id'][0])
-    lane_dir = os.path.join(EVIDENCE_DIR, lane.upper())
-    os.makedirs(lane_dir, exist_ok=True)
+def save_evidence(result: Dict[str, Any]) -> Optional[str]:
+    """Save verification evidence to file.
 
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    filename = f"{result['issue_id']}_{timestamp}.json"
-    filepath = os.path.join(lane_dir, filename)
+    While an evidence batch is open the evidence is held for flush_evidence
+    and None is returned; otherwise it is written to its own JSON file.
+    """
+    lane = result.get('lane', result['issue_id'][0])
 
     # Prepare data
     data = {
@@ -630,32 +903,123 @@ def save_evidence(result: Dict[str, Any]) -> str:
         'checks': result['checks']
     }
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    with _evidence_lock:
+        if _evidence_buffer is not None:
+            _evidence_buffer.setdefault(lane.upper(), []).append(data)
+            return None
+
+    lane_dir = os.path.join(EVIDENCE_DIR, lane.upper())
+    os.makedirs(lane_dir, exist_ok=True)
+
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    filename = f"{result['issue_id']}_{timestamp}.json"
+    filepath = os.path.join(lane_dir, filename)
+
+    with open(filepath, 'wb') as f:
+        f.write(_dump_evidence(data))
 
     return filepath
 
-def update_issue_verified(filepath: str, result: Dict[str, Any]) -> None:
-    """Update issue file to mark as verified."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+def start_evidence_batch() -> None:
+    """Hold evidence from save_evidence until flush_evidence is called."""
+    global _evidence_buffer
+
+    with _evidence_lock:
+        if _evidence_buffer is None:
+            _evidence_buffer = {}
+
+def flush_evidence() -> List[str]:
+    """Write the held evidence as one JSON Lines file per lane and close the batch.
+
+    Records are appended, so a run in the same second as an earlier one
+    adds to its file instead of replacing it. Returns the paths written. A lane whose file cannot be written is
+    reported and skipped.
+    """
+    global _evidence_buffer
+
+    with _evidence_lock:
+        buffer, _evidence_buffer = _evidence_buffer, None
+    if not buffer:
+        return []
+
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    written = []
+    for lane, entries in buffer.items():
+        filepath = os.path.join(EVIDENCE_DIR, lane, f"{lane}-{timestamp}.jsonl")
+        try:
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            with open(filepath, 'ab') as f:
+                f.write(b''.join(_dump_evidence_line(data) for data in entries))
+        except OSError as e:
+            print(f"Warning: Failed to write evidence for lane {lane}: {e}")
+            continue
+        written.append(filepath)
+    return written
+
+def _dump_evidence_line(data: Dict[str, Any]) -> bytes:
+    """Serialize evidence as one compact JSON line, with orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    return json.dumps(data).encode('utf-8') + b'\n'
+
+def _dump_evidence(data: Dict[str, Any]) -> bytes:
+    """Serialize evidence as indented JSON, with orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # e.g. non-string keys, which json converts but orjson rejects
+            pass
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def update_issue_verified(filepath: str, result: Dict[str, Any],
+                          content: Optional[str] = None, end: Optional[int] = None) -> None:
+    """Update issue file to mark as verified.
+
+    content is the file's text and end its frontmatter_end() if the caller
+    already has them. The new text is written to a temporary file that then
+    replaces the issue atomically.
+    """
+    if content is None:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = f.read()
+    if end is None:
+        end = frontmatter_end(content)
 
     # Update frontmatter status if exists
-    if content.startswith('---'):
-        end = content.find('\n---\n', 3)
-        if end > 0:
-            frontmatter_text = content[4:end]
-            rest = content[end+5:]
+    if end > 0:
+        frontmatter_text = content[4:end]
 
-            # Add verified date
-            if 'date_verified:' not in frontmatter_text:
-                frontmatter_text += f'\ndate_verified: "{datetime.now().strftime("%Y-%m-%d")}"\n'
-                frontmatter_text += f'verification_confidence: {result["confidence"]}\n'
+        # Add verified date
+        if 'date_verified:' not in frontmatter_text:
+            frontmatter_text += f'\ndate_verified: "{datetime.now().strftime("%Y-%m-%d")}"\n'
+            frontmatter_text += f'verification_confidence: {result["confidence"]}\n'
 
-            content = f"---\n{frontmatter_text}\n---\n{rest}"
+        content = f"---\n{frontmatter_text}{content[end:]}"
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    tmp_path = f"{filepath}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.chmod(tmp_path, os.stat(filepath).st_mode & 0o7777)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 # =============================================================================
 # OUTPUT FORMATTING
@@ -719,34 +1083,98 @@ def print_result(result: Dict[str, Any], verbose: bool = False) -> None:
 # BATCH PROCESSING
 # =============================================================================
 
+def list_issue_files(lane: str) -> List[str]:
+    """Return a lane's issue file paths (templates excluded), sorted.
+
+    Matches what globbing '*.md' in the lane directory would give, from a
+    single os.scandir pass whose entries already know their type.
+    """
+    lane_dir = os.path.join(ISSUES_DIR, lane.upper())
+    try:
+        with os.scandir(lane_dir) as entries:
+            files = [
+                e.path for e in entries
+                if e.name.endswith('.md') and not e.name.startswith('.')
+                and 'TEMPLATE' not in e.path.upper() and e.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    return sorted(files)
+
+def list_lanes() -> List[str]:
+    """Return the names of the lane directories under ISSUES_DIR, sorted."""
+    try:
+        with os.scandir(ISSUES_DIR) as entries:
+            return sorted(e.name for e in entries if not e.name.startswith('.') and e.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+class _ThreadBufferedStdout:
+    """sys.stdout stand-in that diverts a thread's writes to its own buffer.
+
+    Lets issues be verified concurrently while their messages still come
+    out in the order a sequential run would print them.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer if buffer is not None else self._stream).write(text)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+    def capture(self, func, *args) -> Tuple[Any, str]:
+        """Call func(*args) with this thread's output buffered; return (result, output)."""
+        self._local.buffer = io.StringIO()
+        try:
+            return func(*args), self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
 def verify_lane(lane: str, depth: str = "STANDARD") -> Dict[str, int]:
-    """Verify all issues in a lane."""
-    pattern = os.path.join(ISSUES_DIR, lane.upper(), '*.md')
-    files = [f for f in glob.glob(pattern) if 'TEMPLATE' not in f.upper()]
+    """Verify all issues in a lane.
+
+    Issues are verified concurrently; each one's messages and summary line
+    are printed in file name order as results come in.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    files = list_issue_files(lane)
 
     stats = {'total': 0, 'passed': 0, 'failed': 0, 'errors': 0}
 
     print(f"\nVerifying Lane {lane.upper()}: {len(files)} issues")
     print(f"{'='*60}")
 
-    for filepath in sorted(files):
-        issue_id = os.path.basename(filepath).replace('.md', '')
-        result = verify_issue(issue_id, depth)
+    issue_ids = [os.path.basename(filepath).replace('.md', '') for filepath in files]
 
-        stats['total'] += 1
-
-        if 'error' in result:
-            stats['errors'] += 1
-            icon = "\u26a0\ufe0f"
-        elif result['passed']:
-            stats['passed'] += 1
-            icon = "\u2705"
-        else:
-            stats['failed'] += 1
-            icon = "\u274c"
-
-        checks = f"{result.get('passed_count', 0)}/{result.get('total_checks', 0)}"
-        print(f"{icon} {issue_id}: {checks} checks passed")
+    stdout = sys.stdout
+    buffered = sys.stdout = _ThreadBufferedStdout(stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=VERIFY_WORKERS) as executor:
+            results = executor.map(lambda issue_id: buffered.capture(verify_issue, issue_id, depth), issue_ids)
+            for issue_id, (result, output) in zip(issue_ids, results):
+                stdout.write(output)
+                stats['total'] += 1
+
+                if 'error' in result:
+                    stats['errors'] += 1
+                    icon = "\u26a0\ufe0f"
+                elif result['passed']:
+                    stats['passed'] += 1
+                    icon = "\u2705"
+                else:
+                    stats['failed'] += 1
+                    icon = "\u274c"
+
+                checks = f"{result.get('passed_count', 0)}/{result.get('total_checks', 0)}"
+                print(f"{icon} {issue_id}: {checks} checks passed")
+    finally:
+        sys.stdout = stdout
 
     print(f"\n{'='*60}")
     print(f"Lane {lane.upper()} Summary:")
@@ -775,6 +1203,8 @@ def main():
     parser.add_argument('--quick', '-q', action='store_true', help='Quick verification only')
     parser.add_argument('--deep', '-d', action='store_true', help='Deep verification')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    parser.add_argument('--evidence-files', action='store_true',
+                        help='With --lane/--all, write one evidence JSON file per issue instead of one JSONL file per lane')
 
     args = parser.parse_args()
 
@@ -786,19 +1216,27 @@ def main():
     else:
         depth = "STANDARD"
 
-    # Process
+    # Process; lane and full runs write their evidence once the run ends,
+    # unless --evidence-files asks for one file per issue
+    if (args.lane or args.all) and not args.evidence_files:
+        start_evidence_batch()
+    try:
+        _process(args, parser, depth)
+    finally:
+        flush_evidence()
+
+def _process(args: argparse.Namespace, parser: argparse.ArgumentParser, depth: str) -> None:
+    """Verify the issues selected on the command line and exit with the result."""
     if args.lane:
         stats = verify_lane(args.lane, depth)
         sys.exit(0 if stats['failed'] == 0 else 1)
 
     elif args.all:
         total_stats = {'total': 0, 'passed': 0, 'failed': 0, 'errors': 0}
-        for lane_dir in sorted(glob.glob(os.path.join(ISSUES_DIR, '*'))):
-            if os.path.isdir(lane_dir):
-                lane = os.path.basename(lane_dir)
-                stats = verify_lane(lane, depth)
-                for k in total_stats:
-                    total_stats[k] += stats[k]
+        for lane in list_lanes():
+            stats = verify_lane(lane, depth)
+            for k in total_stats:
+                total_stats[k] += stats[k]
 
         print(f"\n{'='*60}")
         print("OVERALL SUMMARY")